@@ -0,0 +1,360 @@
+import os
+import re
+import sys
+import csv
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+#folders are audited in parallel, each one is a handful of stats and a json read on the share (override with ORI_AUDIT_WORKERS)
+AUDIT_WORKERS = int(os.environ.get("ORI_AUDIT_WORKERS", "16"))
+
+META_NAME = "orion_meta.json"
+
+def get_proposed_name(folder_name):
+    """stc_<4 digit number> from whatever number a shot folder ends in."""
+    match = re.search(r'(\d+)$', folder_name)
+    if match:
+        number = int(match.group(1))
+        return f"stc_{number:04d}"
+    return folder_name
+
+def load_shots(orion):
+    """The whole shots table in one query, keyed by code (plain dicts so workers can share it)."""
+    try:
+        return {row["code"]: dict(row) for row in orion.get_all_shots()}
+    except Exception as e:
+        print(f"Could not load shots table: {e}")
+        return None
+
+def load_assets(orion):
+    """The whole assets table in one query, keyed by name."""
+    try:
+        return {row["name"]: dict(row) for row in orion.get_all_assets()}
+    except Exception as e:
+        print(f"Could not load assets table: {e}")
+        return None
+
+def list_shot_folders(root):
+    try:
+        return sorted(e.name for e in os.scandir(root) if e.is_dir() and e.name.lower() != "old")
+    except OSError:
+        return []
+
+def list_asset_folders(root):
+    try:
+        return sorted(e.name for e in os.scandir(root) if e.is_dir() and not e.name.startswith("."))
+    except OSError:
+        return []
+
+class CheckTimer:
+    """Times each named check of one audit into a {check: seconds} dict."""
+
+    def __init__(self, timings):
+        self.timings = timings
+        self.name = None
+        self.start = None
+
+    def __call__(self, name):
+        self.name = name
+        return self
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.timings[self.name] = self.timings.get(self.name, 0.0) + time.perf_counter() - self.start
+
+#   SHOTS
+
+def audit_shot(orion, folder_name, full_path, shots=None):
+    """
+    Works out what is wrong with one shot folder. shots is the prefetched
+    shots table, without it the DB is queried for this folder.
+    Safe to run on a worker thread. state["checks"] has the seconds each check took.
+    """
+    state = {
+        "issues": [],
+        "db_status": "Unknown",
+        "id_status": "Unknown",
+        "action_needed": False,
+        "checks": {},
+    }
+    timed = CheckTimer(state["checks"])
+
+    proposed = get_proposed_name(folder_name)
+
+    # 1. Name Check
+    with timed("name"):
+        if folder_name != proposed:
+            state["issues"].append("Wrong Name")
+
+    # 2. DB Check
+    with timed("db"):
+        if shots is not None:
+            shot_data = shots.get(proposed)
+            in_db_as_current = folder_name in shots
+        else:
+            shot_data = orion.get_shot(proposed)
+            in_db_as_current = orion.check_shot_exists_in_db(folder_name)
+
+        if shot_data:
+            state["db_status"] = "Good"
+            shot_id = shot_data['id']
+            # Check for complex/UUID IDs vs Simple IDs if strict mode wanted,
+            # but broadly we just ensure ID exists.
+            if len(shot_id) > 20 and shot_id != proposed:
+                state["id_status"] = "UUID"
+            else:
+                state["id_status"] = "Simple"
+        elif in_db_as_current:
+            state["db_status"] = "Old Name in DB"
+            state["issues"].append("DB needs Update")
+        else:
+            state["db_status"] = "Missing"
+            state["issues"].append("Register in DB")
+
+    # 3. Structure Check
+    with timed("folders"):
+        for sub in orion.SHOT_SUBFOLDERS:
+            if not os.path.exists(os.path.join(full_path, sub)):
+                state["issues"].append("Missing Folders")
+                break
+
+    # 4. Meta & Path Check
+    with timed("meta"):
+        expected_rel_path = orion.get_relative_path(full_path)
+        try:
+            with open(os.path.join(full_path, META_NAME), 'r') as f:
+                data = json.load(f)
+            if data.get("original_path") != expected_rel_path:
+                state["issues"].append("JSON Path Update")
+            if data.get("code") != proposed:
+                state["issues"].append("JSON Code Update")
+        except FileNotFoundError:
+            state["issues"].append("Missing JSON")
+        except (OSError, ValueError, AttributeError):
+            state["issues"].append("JSON Corrupt")
+
+    # 5. ID Tag
+    with timed("id_tag"):
+        try:
+            names = os.listdir(full_path)
+        except OSError:
+            names = []
+        if not any(f.startswith(".id_") for f in names):
+            state["issues"].append("Missing ID Tag")
+
+    state["action_needed"] = bool(state["issues"])
+    return state
+
+#   ASSETS
+
+def audit_asset(orion, name, full_path, assets=None):
+    """Same as audit_shot for an asset folder, assets is the prefetched assets table."""
+    state = {
+        "issues": [],
+        "action_needed": False,
+        "db_status": "Unknown",
+        "path_status": "Unknown",
+        "checks": {},
+    }
+    timed = CheckTimer(state["checks"])
+
+    # 1. DB Check
+    with timed("db"):
+        asset_record = assets.get(name) if assets is not None else orion.get_asset(name)
+        if not asset_record:
+            state["db_status"] = "Missing"
+            state["issues"].append("Register in DB")
+        else:
+            state["db_status"] = "Exists"
+
+    # 2. Path Check
+    with timed("path"):
+        real_rel_path = orion.get_relative_path(full_path)
+        if asset_record:
+            if asset_record['path'] != real_rel_path:
+                state["path_status"] = "Mismatch"
+                state["issues"].append("Update DB Path")
+            else:
+                state["path_status"] = "Synced"
+        else:
+            state["path_status"] = "N/A"
+
+    # 3. Meta Files Check
+    with timed("meta"):
+        try:
+            names = os.listdir(full_path)
+        except OSError:
+            names = []
+        if META_NAME not in names:
+            state["issues"].append("Missing Meta JSON")
+        if not any(f.startswith(".id_") for f in names):
+            state["issues"].append("Missing ID Tag")
+
+    state["action_needed"] = bool(state["issues"])
+    return state
+
+#   REPORT
+
+def run_audit(orion, shots_root=None, assets_root=None, workers=AUDIT_WORKERS, progress=None):
+    """
+    Audits every shot folder under shots_root and asset folder under assets_root
+    (either can be None to skip it) with one query per DB table and the folders
+    in parallel. progress(done, total) is called from worker threads.
+    Returns the report dict (see write_json/write_csv).
+    """
+    start = time.time()
+    jobs = []
+    if shots_root:
+        shots = load_shots(orion)
+        for folder in list_shot_folders(shots_root):
+            jobs.append(("shot", folder, os.path.join(shots_root, folder), audit_shot, shots))
+    if assets_root:
+        assets = load_assets(orion)
+        for name in list_asset_folders(assets_root):
+            jobs.append(("asset", name, os.path.join(assets_root, name), audit_asset, assets))
+
+    total = len(jobs)
+    done = [0]
+    lock = threading.Lock()
+
+    def work(job):
+        kind, name, path, func, table = job
+        started = time.perf_counter()
+        try:
+            state = func(orion, name, path, table)
+        except Exception as e:
+            state = {"issues": [f"Audit Error: {e}"], "action_needed": True, "checks": {}}
+        state.update({"kind": kind, "name": name, "path": orion.get_relative_path(path),
+                      "seconds": time.perf_counter() - started})
+        if kind == "shot":
+            state["proposed"] = get_proposed_name(name)
+        with lock:
+            done[0] += 1
+            count = done[0]
+        if progress:
+            progress(count, total)
+        return state
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="orion_audit") as executor:
+        items = list(executor.map(work, jobs))
+
+    check_seconds = {}
+    for item in items:
+        for check, seconds in item.get("checks", {}).items():
+            key = f"{item['kind']}.{check}"
+            check_seconds[key] = check_seconds.get(key, 0.0) + seconds
+
+    return {
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "root": orion.get_root_dir(),
+        "seconds": time.time() - start,
+        "workers": workers,
+        "totals": {
+            "shots": sum(1 for i in items if i["kind"] == "shot"),
+            "assets": sum(1 for i in items if i["kind"] == "asset"),
+            "needs_action": sum(1 for i in items if i["action_needed"]),
+        },
+        "check_seconds": check_seconds,
+        "items": items,
+    }
+
+def write_json(report, path):
+    temp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+CSV_FIELDS = ["kind", "name", "proposed", "path", "action_needed", "issues", "db_status", "id_status", "path_status", "seconds"]
+
+def write_csv(report, path):
+    """One row per folder, issues joined with ';', plus a column per check timing."""
+    checks = sorted({c for item in report["items"] for c in item.get("checks", {})})
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS + [f"check_{c}" for c in checks])
+        for item in report["items"]:
+            row = [item.get(field, "") for field in CSV_FIELDS]
+            row[CSV_FIELDS.index("issues")] = ";".join(item.get("issues", []))
+            row[CSV_FIELDS.index("seconds")] = f"{item.get('seconds', 0):.4f}"
+            row += [f"{item.get('checks', {}).get(c, 0):.4f}" for c in checks]
+            writer.writerow(row)
+
+def diff_reports(old, new):
+    """
+    What changed between two reports, per folder.
+    Returns {"new": [(kind, name, issue)], "fixed": [...], "added": [(kind, name)], "removed": [...]}.
+    """
+    def index(report):
+        return {(i["kind"], i["name"]): set(i.get("issues", [])) for i in report.get("items", [])}
+
+    before = index(old)
+    after = index(new)
+    changes = {"new": [], "fixed": [], "added": [], "removed": []}
+    for key in sorted(set(before) | set(after)):
+        if key not in before:
+            changes["added"].append(key)
+        elif key not in after:
+            changes["removed"].append(key)
+            continue
+        old_issues = before.get(key, set())
+        for issue in sorted(after[key] - old_issues):
+            changes["new"].append(key + (issue,))
+        for issue in sorted(old_issues - after[key]):
+            changes["fixed"].append(key + (issue,))
+    return changes
+
+def main(argv=None):
+    """Headless entry point, e.g. for a nightly job on a render node."""
+    parser = argparse.ArgumentParser(description="Audit Orion shot and asset folders against the DB.")
+    parser.add_argument("--json", default=None, help="Write the full report here")
+    parser.add_argument("--csv", default=None, help="Write one row per folder here")
+    parser.add_argument("--only", choices=("shots", "assets"), default=None, help="Audit just shots or just assets")
+    parser.add_argument("--shots-root", default=None, help="Shots folder (defaults to <root>/40_shots)")
+    parser.add_argument("--assets-root", default=None, help="Assets folder (defaults to <root>/30_assets)")
+    parser.add_argument("--workers", type=int, default=AUDIT_WORKERS, help="Folders audited at once")
+    parser.add_argument("--diff", default=None, help="Earlier JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.orionUtils import OrionUtils
+    orion = OrionUtils(check_schema=False)
+
+    shots_root = None if args.only == "assets" else (args.shots_root or os.path.join(orion.get_root_dir(), "40_shots"))
+    assets_root = None if args.only == "shots" else (args.assets_root or os.path.join(orion.get_root_dir(), "30_assets"))
+
+    report = run_audit(orion, shots_root, assets_root, workers=args.workers)
+    if args.json:
+        write_json(report, args.json)
+    if args.csv:
+        write_csv(report, args.csv)
+
+    totals = report["totals"]
+    print(f"Audit done in {report['seconds']:.1f}s: {totals['shots']} shots, {totals['assets']} assets, "
+          f"{totals['needs_action']} need fixing")
+    for check, seconds in sorted(report["check_seconds"].items(), key=lambda c: -c[1]):
+        print(f"  {check:<16}{seconds:8.3f}s")
+
+    if args.diff:
+        try:
+            with open(args.diff, "r") as f:
+                changes = diff_reports(json.load(f), report)
+        except (OSError, ValueError) as e:
+            print(f"Could not read {args.diff}: {e}")
+            return 1
+        for kind, name, issue in changes["new"]:
+            print(f"NEW   {kind} {name}: {issue}")
+        for kind, name, issue in changes["fixed"]:
+            print(f"FIXED {kind} {name}: {issue}")
+        for kind, name in changes["added"]:
+            print(f"ADDED {kind} {name}")
+        for kind, name in changes["removed"]:
+            print(f"GONE  {kind} {name}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+def get_local_cache_dir(*parts):
+    """
+    Returns (and creates) a per-user cache folder on the local machine.
+    Uses %LOCALAPPDATA% on windows so cached data never lives on the share.
+    """
+    base = os.environ.get("ORI_CACHE_PATH")
+    if not base:
+        local_app = os.environ.get("LOCALAPPDATA")
+        if local_app:
+            base = os.path.join(local_app, "OrionTech", "cache")
+        else:
+            base = os.path.join(os.path.expanduser("~"), ".orion", "cache")
+
+    path = os.path.join(base, *parts)
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        #fallback to temp if home is not writable (render nodes etc)
+        path = os.path.join(tempfile.gettempdir(), "orion_cache", *parts)
+        os.makedirs(path, exist_ok=True)
+    return path
+
+def get_file_signature(path):
+    """
+    Returns (normalised path, size, mtime_ns) for a file, or None if missing.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.normcase(os.path.abspath(path)), st.st_size, st.st_mtime_ns)
+
+def make_content_key(path, params=None):
+    """
+    Key from a file's name + size + mtime (not its folder), so the same file
+    seen through different drive mappings (P:/O:) gets the same key.
+    Returns None if the file is missing.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    payload = json.dumps({"name": os.path.basename(path), "size": st.st_size, "mtime": st.st_mtime_ns,
+                          "params": params or {}}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def make_cache_key(paths, params=None):
+    """
+    Builds a content key from input paths + sizes + mtimes + extra parameters.
+    Any change to an input file or to the params gives a different key.
+    Returns None if one of the inputs is missing.
+    """
+    parts = []
+    for p in paths:
+        sig = get_file_signature(p)
+        if sig is None:
+            return None
+        parts.append(list(sig))
+
+    payload = json.dumps({"inputs": parts, "params": params or {}}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+class DiskCache:
+    """
+    Folder of cached files named by key, evicted least-recently-used
+    when the total size goes over max_bytes.
+    The file mtime is used as the LRU stamp (touched on every hit unless
+    track_access is off, e.g. for caches living on the share).
+    """
+
+    def __init__(self, root, max_bytes=2 * 1024 ** 3, ext="", track_access=True):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ext = ext
+        self.track_access = track_access
+        self.hits = 0
+        self.misses = 0
+        #running total, only worked out from disk once
+        self._total = None
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    def path_for(self, key):
+        #two char sub folders so big caches dont end up in one huge directory
+        return os.path.join(self.root, key[:2], key + self.ext)
+
+    def get(self, key):
+        """Returns the cached file path for key, or None on a miss."""
+        if not key:
+            self.misses += 1
+            return None
+
+        path = self.path_for(key)
+        try:
+            if os.path.getsize(path) > 0:
+                if self.track_access:
+                    now = time.time()
+                    os.utime(path, (now, now))
+                self.hits += 1
+                return path
+        except OSError:
+            pass
+
+        self.misses += 1
+        return None
+
+    def temp_path_for(self, key):
+        """
+        Path to write a new entry to before calling commit().
+        Writing to a temp name keeps half written files out of the cache.
+        """
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return f"{path}.{os.getpid()}_{threading.get_ident()}.tmp{self.ext}"
+
+    def commit(self, key, temp_path):
+        """Moves a finished temp file into place and trims the cache."""
+        path = self.path_for(key)
+        if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
+            try: os.remove(temp_path)
+            except OSError: pass
+            return None
+
+        size = os.path.getsize(temp_path)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._total is None:
+                self._total = self.total_bytes()
+            else:
+                self._total += size
+            over_budget = self._total > self.max_bytes
+
+        if over_budget:
+            self.evict()
+        return path
+
+    def put_bytes(self, key, data):
+        """Stores raw bytes under key and returns the cached path."""
+        temp_path = self.temp_path_for(key)
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        return self.commit(key, temp_path)
+
+    def entries(self):
+        """Returns a list of (mtime, size, path) for every cached file."""
+        found = []
+        for sub in os.scandir(self.root):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".tmp" + self.ext):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                found.append((st.st_mtime, st.st_size, entry.path))
+        return found
+
+    def total_bytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, max_bytes=None):
+        """Deletes oldest entries until the cache fits in max_bytes."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= budget:
+            self._total = total
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= budget:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError as e:
+                print(f"Cache eviction failed for {path}: {e}")
+        self._total = total
+        return removed
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+class MemoryLRU:
+    """
+    In-memory least-recently-used cache capped by total bytes.
+    Callers pass the size of each value since only they know it
+    (e.g. width * height * 4 for an image).
+    """
+
+    def __init__(self, max_bytes=256 * 1024 ** 2):
+        self.max_bytes = max_bytes
+        self.total = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, size):
+        """Stores value and drops the oldest entries until the cache fits."""
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.total -= old[1]
+
+            #never keep something bigger than the whole budget
+            if size > self.max_bytes:
+                return
+
+            self._items[key] = (value, size)
+            self.total += size
+            while self.total > self.max_bytes and self._items:
+                _, (_, old_size) = self._items.popitem(last=False)
+                self.total -= old_size
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.total = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": len(self._items),
+            "bytes": self.total,
+        }
@@ -0,0 +1,408 @@
+import os
+import sys
+import json
+import time
+import uuid
+import glob
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from core.orionUtils import set_hidden
+except ImportError:
+    from orionUtils import set_hidden
+
+#folders are created and tagged this many at once (override with ORI_FIX_WORKERS)
+FIX_WORKERS = int(os.environ.get("ORI_FIX_WORKERS", "8"))
+
+#a batch moves through these in order, anything before "done" can be resumed or rolled back
+PHASES = ("planned", "renamed", "committed", "done", "rolled_back")
+
+def get_journal_dir(orion):
+    """Journals live next to the DB they describe."""
+    return os.path.join(orion.data_path, "fix_journals")
+
+#   PLANNING
+
+def plan_shot_fix(orion, root_path, folder, proposed, state, shots, claimed=None):
+    """
+    Works out everything fixing one shot folder will do, without doing any of it.
+    state is what analyze_folder found, shots the shots table keyed by code.
+    claimed is the set of target folders already used by this batch.
+    Returns the item dict, with "error" set if it can't be fixed.
+    """
+    health = ", ".join(state.get("issues", []))
+    db_status = state.get("db_status")
+    src = os.path.join(root_path, folder)
+    dst = os.path.join(root_path, proposed)
+    item = {"kind": "shot", "name": folder, "code": proposed, "src": src, "dst": dst,
+            "rename": False, "renamed": False, "db": None, "tag": False, "shot_id": None, "status": "planned", "error": None}
+
+    # 1. Rename
+    if "Wrong Name" in health and folder != proposed:
+        if os.path.exists(dst) or (claimed is not None and dst in claimed):
+            item["error"] = f"{proposed} already exists"
+            return item
+        item["rename"] = True
+    if claimed is not None:
+        claimed.add(dst)
+
+    # 2. DB
+    if db_status == "Old Name in DB":
+        if proposed in shots:
+            item["error"] = f"{proposed} is already in the DB"
+            return item
+        item["db"] = "rename_code"
+        item["shot_id"] = shots[folder]["id"] if folder in shots else None
+    elif db_status == "Missing":
+        item["db"] = "insert"
+        item["shot_id"] = str(uuid.uuid4())
+    elif proposed in shots:
+        item["shot_id"] = shots[proposed]["id"]
+
+    # 3. Structure & Tags (registering always wrote the tags too)
+    if item["db"] == "insert" or "Missing" in health or "JSON" in health or "Update" in health:
+        item["tag"] = True
+    item["shot_id"] = item["shot_id"] or proposed
+    return item
+
+def plan_asset_fix(orion, root_path, name, assets):
+    """Same as plan_shot_fix for an asset folder. The ID comes from the meta json, the .id_ marker, or is new."""
+    path = os.path.join(root_path, name)
+    item = {"kind": "asset", "name": name, "path": path, "asset_id": None, "asset_type": "Prop",
+            "db": "update" if name in assets else "insert", "status": "planned", "error": None}
+
+    try:
+        with open(os.path.join(path, "orion_meta.json"), "r") as f:
+            d = json.load(f)
+            item["asset_id"] = d.get("id")
+            item["asset_type"] = d.get("asset_type", "Prop")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if not item["asset_id"]:
+        try:
+            for f in os.listdir(path):
+                if f.startswith(".id_"):
+                    item["asset_id"] = f.replace(".id_", "")
+                    break
+        except OSError as e:
+            item["error"] = str(e)
+            return item
+
+    item["asset_id"] = item["asset_id"] or str(uuid.uuid4())
+    return item
+
+#   BATCH
+
+class FixBatch:
+    """
+    A planned set of shot or asset fixes run as one unit:
+      1. folder renames
+      2. every DB change in one transaction
+      3. folders and meta tags, several at once
+    Every step is journaled before it runs, so a batch that died half way can
+    be resumed, and a finished one rolled back (DB rows restored from the
+    journal, renames undone; folders and tags it created are left in place).
+    """
+
+    def __init__(self, orion, kind, items, journal_dir=None, batch_id=None):
+        self.orion = orion
+        self.kind = kind
+        self.items = items
+        self.phase = "planned"
+        self.batch_id = batch_id or f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.journal_dir = journal_dir or get_journal_dir(orion)
+        self.path = os.path.join(self.journal_dir, f"{kind}_{self.batch_id}.json")
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<FixBatch {self.kind} {self.batch_id} {self.phase} ({len(self.items)} items)>"
+
+    @classmethod
+    def load(cls, orion, path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        batch = cls(orion, data["kind"], data["items"], os.path.dirname(path), data["id"])
+        batch.phase = data.get("phase", "planned")
+        batch.path = path
+        return batch
+
+    def active(self):
+        """Items still being fixed (not skipped at planning or failed on the way)."""
+        return [i for i in self.items if not i.get("error")]
+
+    def failed(self):
+        return [i for i in self.items if i.get("error")]
+
+    def summary(self):
+        items = self.active()
+        if self.kind == "shot":
+            return (f"{len(items)} shots: {sum(1 for i in items if i['rename'])} renames, "
+                    f"{sum(1 for i in items if i['db'])} DB changes, {sum(1 for i in items if i['tag'])} folders to tag")
+        return (f"{len(items)} assets: {sum(1 for i in items if i['db'] == 'insert')} to register, "
+                f"{sum(1 for i in items if i['db'] == 'update')} to update")
+
+    #   JOURNAL
+
+    def save(self):
+        with self._lock:
+            os.makedirs(self.journal_dir, exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}_{threading.get_ident()}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"id": self.batch_id, "kind": self.kind, "phase": self.phase,
+                           "time": time.time(), "items": self.items}, f, indent=2)
+            os.replace(temp_path, self.path)
+
+    def set_phase(self, phase):
+        self.phase = phase
+        self.save()
+
+    #   RUN
+
+    def run(self, progress=None):
+        """
+        Runs the batch, or carries on from wherever its journal stopped.
+        progress(done, total) is called from worker threads during the folder phase.
+        A DB error rolls the whole batch back and is raised. Returns the failed items.
+        """
+        if self.phase == "planned":
+            self.save()
+            self.do_renames()
+            self.set_phase("renamed")
+        if self.phase == "renamed":
+            try:
+                self.commit_db()
+            except Exception:
+                self.undo_renames()
+                self.set_phase("rolled_back")
+                raise
+            self.set_phase("committed")
+        if self.phase == "committed":
+            self.do_folders(progress)
+            self.set_phase("done")
+        return self.failed()
+
+    def do_renames(self):
+        def rename(item):
+            if os.path.exists(item["dst"]) and not os.path.exists(item["src"]):
+                #already renamed by an earlier run of this batch
+                item["renamed"] = True
+                return
+            try:
+                os.rename(item["src"], item["dst"])
+                item["renamed"] = True
+            except OSError as e:
+                item["error"] = f"Rename failed: {e}"
+
+        todo = [i for i in self.active() if i.get("rename") and not i.get("renamed")]
+        if todo:
+            with ThreadPoolExecutor(max_workers=FIX_WORKERS, thread_name_prefix="orion_fix") as executor:
+                list(executor.map(rename, todo))
+
+    def undo_renames(self):
+        #goes by the folders rather than the flag, a crash can land between a rename and its journal write
+        for item in self.items:
+            if not item.get("rename"):
+                continue
+            if os.path.exists(item["dst"]) and not os.path.exists(item["src"]):
+                try:
+                    os.rename(item["dst"], item["src"])
+                    item["renamed"] = False
+                except OSError as e:
+                    print(f"Could not rename {item['dst']} back: {e}")
+
+    def commit_db(self):
+        """Every DB change of the batch, in one transaction. Rows are journaled as they were before."""
+        conn = self.orion.get_db_connection()
+        try:
+            if self.kind == "shot":
+                cols = [info[1] for info in conn.execute("PRAGMA table_info(shots)").fetchall()]
+                for item in self.active():
+                    self.apply_shot(conn, item, cols)
+            else:
+                for item in self.active():
+                    self.apply_asset(conn, item)
+            #before images have to be on disk before the changes are
+            self.save()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        for item in self.active():
+            item["status"] = "committed"
+
+    def snapshot(self, conn, table, key, values):
+        rows = []
+        for value in values:
+            row = conn.execute(f"SELECT * FROM {table} WHERE {key} = ?", (value,)).fetchone()
+            if row:
+                rows.append(dict(row))
+        return rows
+
+    def apply_shot(self, conn, item, cols):
+        if "before" not in item:
+            item["before"] = self.snapshot(conn, "shots", "code", {item["name"], item["code"]})
+        code = item["code"]
+        exists = conn.execute("SELECT 1 FROM shots WHERE code = ?", (code,)).fetchone()
+
+        if item["db"] == "rename_code" and not exists:
+            conn.execute("UPDATE shots SET code = ? WHERE code = ?", (code, item["name"]))
+            try:
+                conn.execute("UPDATE shot_assets SET shot_code = ? WHERE shot_code = ?", (code, item["name"]))
+            except sqlite3.OperationalError:
+                pass
+        elif item["db"] == "insert" and not exists:
+            values = {"id": item["shot_id"], "code": code, "frame_start": 1001, "frame_end": 1100,
+                      "user_assigned": "Migrated", "shot_path": self.orion.get_relative_path(item["dst"]),
+                      "description": "", "thumbnail_path": ""}
+            values = {k: v for k, v in values.items() if k in cols}
+            conn.execute(f"INSERT INTO shots ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})",
+                         tuple(values.values()))
+
+        if item["tag"]:
+            conn.execute("UPDATE shots SET shot_path = ? WHERE code = ?", (self.orion.get_relative_path(item["dst"]), code))
+
+    def apply_asset(self, conn, item):
+        if "before" not in item:
+            item["before"] = self.snapshot(conn, "assets", "name", [item["name"]])
+        rel_path = self.orion.get_relative_path(item["path"])
+        exists = conn.execute("SELECT 1 FROM assets WHERE name = ?", (item["name"],)).fetchone()
+        if not exists:
+            conn.execute(
+                "INSERT INTO assets (id, name, type, path, description, thumbnail_path) VALUES (?, ?, ?, ?, ?, ?)",
+                (item["asset_id"], item["name"], item["asset_type"], rel_path, "", "")
+            )
+        else:
+            conn.execute("UPDATE assets SET path = ?, id = ? WHERE name = ?", (rel_path, item["asset_id"], item["name"]))
+
+    def do_folders(self, progress=None):
+        todo = [i for i in self.active() if i["status"] != "done"]
+        total = len(todo)
+        counter = [0]
+
+        def fix(item):
+            try:
+                if self.kind == "shot":
+                    self.fix_shot_folder(item)
+                else:
+                    self.fix_asset_folder(item)
+                item["status"] = "done"
+            except Exception as e:
+                item["error"] = f"Folder fix failed: {e}"
+            with self._lock:
+                counter[0] += 1
+            if progress:
+                progress(counter[0], total)
+
+        if todo:
+            with ThreadPoolExecutor(max_workers=FIX_WORKERS, thread_name_prefix="orion_fix") as executor:
+                list(executor.map(fix, todo))
+
+    def fix_shot_folder(self, item):
+        if not item["tag"]:
+            return
+        # Ensure folders exist
+        self.orion.create_shot_structure(item["code"], base_path=os.path.dirname(item["dst"]))
+        if not self.orion.create_meta_tag(item["dst"], item["code"], shot_id=item["shot_id"]):
+            raise IOError(f"Could not tag {item['dst']}")
+
+    def fix_asset_folder(self, item):
+        path = item["path"]
+        # Ensure standard folders exist
+        tasks = self.orion.ASSET_TASKS
+        if isinstance(tasks, dict):
+            subfolders = [os.path.join(group, sub) for group, subs in tasks.items() for sub in ([""] + list(subs))]
+        else:
+            subfolders = list(tasks)
+        for sub in subfolders:
+            os.makedirs(os.path.join(path, sub.replace('/', os.sep)), exist_ok=True)
+
+        # Write Meta Tag
+        if not self.orion.asset_create_meta_tag(path, item["name"], {"type": "asset", "asset_type": item["asset_type"]},
+                                                asset_id=item["asset_id"]):
+            raise IOError(f"Could not tag {path}")
+
+        # Ensure .id_ marker
+        marker = os.path.join(path, f".id_{item['asset_id']}")
+        if not os.path.exists(marker):
+            with open(marker, 'w') as f: f.write(item["name"])
+            set_hidden(marker)
+
+    #   ROLLBACK
+
+    def rollback(self):
+        """
+        Puts the DB rows back as they were before the batch and undoes its renames.
+        Folders and tags it created stay, they are harmless and a rescan shows them.
+        """
+        touched = [i for i in self.items if "before" in i]
+        if touched:
+            table, key = ("shots", "code") if self.kind == "shot" else ("assets", "name")
+            conn = self.orion.get_db_connection()
+            try:
+                for item in touched:
+                    keys = {item["name"], item["code"]} if self.kind == "shot" else {item["name"]}
+                    for value in keys:
+                        conn.execute(f"DELETE FROM {table} WHERE {key} = ?", (value,))
+                    for row in item["before"] or []:
+                        conn.execute(f"INSERT OR REPLACE INTO {table} ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+                                     tuple(row.values()))
+                    if self.kind == "shot" and item["db"] == "rename_code":
+                        try:
+                            conn.execute("UPDATE shot_assets SET shot_code = ? WHERE shot_code = ?", (item["name"], item["code"]))
+                        except sqlite3.OperationalError:
+                            pass
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+            for item in touched:
+                del item["before"]
+
+        if self.kind == "shot":
+            self.undo_renames()
+        self.set_phase("rolled_back")
+
+def list_journals(journal_dir, kind=None, unfinished=False):
+    """Journal paths, newest first. unfinished only returns batches that stopped before "done"."""
+    found = []
+    for path in sorted(glob.glob(os.path.join(journal_dir, f"{kind or '*'}_*.json")), reverse=True):
+        try:
+            with open(path, "r") as f:
+                phase = json.load(f).get("phase")
+        except (OSError, ValueError):
+            continue
+        if unfinished and phase in ("done", "rolled_back"):
+            continue
+        found.append(path)
+    return found
+
+if __name__ == "__main__":
+    #e.g. python fixerUtils.py list | resume <journal> | rollback <journal>
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.orionUtils import OrionUtils
+
+    orion = OrionUtils(check_schema=False)
+    args = sys.argv[1:] or ["list"]
+    if args[0] == "list":
+        for path in list_journals(get_journal_dir(orion)):
+            batch = FixBatch.load(orion, path)
+            print(f"{path}  {batch.phase}  {batch.summary()}")
+    elif args[0] in ("resume", "rollback") and len(args) > 1:
+        batch = FixBatch.load(orion, args[1])
+        if args[0] == "resume":
+            failed = batch.run()
+        else:
+            batch.rollback()
+            failed = batch.failed()
+        print(f"{batch}: {len(failed)} failed")
+        for item in failed:
+            print(f"  {item['name']}: {item['error']}")
+    else:
+        print("usage: fixerUtils.py list | resume <journal> | rollback <journal>")
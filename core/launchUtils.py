@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import shutil
+import subprocess
+import threading
+
+try:
+    from core.cacheUtils import get_local_cache_dir
+except ImportError:
+    from cacheUtils import get_local_cache_dir
+
+#set by the launcher UI so the CLI launchers can report click to process start time
+CLICK_TIME_ENV = "ORI_LAUNCH_CLICK_TIME"
+
+def get_click_time():
+    try:
+        return float(os.environ.get(CLICK_TIME_ENV, ""))
+    except ValueError:
+        return None
+
+def spawn_dcc(cmd, env, name, click_time=None, mode="subprocess"):
+    """
+    Starts a DCC with env and prints how long it took since the launcher click.
+    Returns the Popen object, or None if the executable is missing.
+    """
+    if click_time is None:
+        click_time = get_click_time()
+    #only meant for the launcher, not the DCC
+    env.pop(CLICK_TIME_ENV, None)
+
+    try:
+        proc = subprocess.Popen(cmd, env=env)
+    except FileNotFoundError:
+        print(f"Error: {name} executable not found.")
+        return None
+
+    if click_time:
+        print(f"Orion Launch: {name} started {(time.time() - click_time) * 1000:.0f} ms after click ({mode})")
+    return proc
+
+def get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def walk_dirs(base):
+    """base plus every sub folder below it (hidden and __pycache__ folders skipped)."""
+    found = [base]
+    for root, dirs, files in os.walk(base):
+        #prune so os.walk doesn't go into them either
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+        for d in dirs:
+            found.append(os.path.join(root, d))
+    return found
+
+class LaunchManifest:
+    """
+    Locally cached launch environment for one DCC.
+    Each entry remembers the mtimes of the folders it was built from and is
+    reused while they are unchanged, so a launch with an unchanged config
+    only stats those folders instead of walking the trees on the share.
+    """
+
+    def __init__(self, name):
+        self.path = os.path.join(get_local_cache_dir("launch_env"), f"{name}.json")
+        self.changed = False
+        try:
+            with open(self.path, "r") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    def is_fresh(self, entry):
+        if not entry:
+            return False
+        return all(get_mtime(d) == m for d, m in entry.get("dirs", {}).items())
+
+    def get_env(self, key):
+        """Cached env values for key, or None if any watched folder changed."""
+        entry = self.data.get(key)
+        if self.is_fresh(entry):
+            return entry["env"]
+        return None
+
+    def set_env(self, key, env_values, watched_dirs):
+        self.data[key] = {"env": env_values, "dirs": {d: get_mtime(d) for d in watched_dirs}}
+        self.changed = True
+
+    def sync_tree(self, src, dst):
+        """
+        Copies src into dst, but only files that changed since the last sync.
+        An unchanged tree costs one stat per folder and file, no listing or copying.
+        Returns the number of files copied.
+        """
+        key = f"sync:{src}>{dst}"
+        entry = self.data.get(key)
+        if entry and self.is_fresh(entry) and self.files_unchanged(src, dst, entry.get("files", {})):
+            return 0
+
+        if not os.path.isdir(src):
+            return 0
+
+        copied = 0
+        files = {}
+        dirs = walk_dirs(src)
+        for d in dirs:
+            for item in os.scandir(d):
+                if not item.is_file():
+                    continue
+                st = item.stat()
+                rel = os.path.relpath(item.path, src)
+                target = os.path.join(dst, rel)
+                files[rel] = (st.st_size, st.st_mtime_ns)
+
+                try:
+                    dst_st = os.stat(target)
+                    if dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+                        continue
+                except OSError:
+                    pass
+
+                try:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    shutil.copy2(item.path, target)
+                    copied += 1
+                except OSError as e:
+                    print(f"Unable to copy {rel}: {e}")
+
+        self.data[key] = {"dirs": {d: get_mtime(d) for d in dirs}, "files": files}
+        self.changed = True
+        return copied
+
+    def files_unchanged(self, src, dst, files):
+        """True if every file from the last sync is the same in src and still there in dst."""
+        for rel, (size, mtime) in files.items():
+            try:
+                st = os.stat(os.path.join(src, rel))
+            except OSError:
+                return False
+            if st.st_size != size or st.st_mtime_ns != mtime:
+                return False
+            if not os.path.exists(os.path.join(dst, rel)):
+                return False
+        return True
+
+    def save(self):
+        if not self.changed:
+            return
+        temp_path = f"{self.path}.{os.getpid()}_{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(self.data, f)
+            os.replace(temp_path, self.path)
+            self.changed = False
+        except OSError as e:
+            print(f"Could not save launch manifest {self.path}: {e}")
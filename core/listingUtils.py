@@ -0,0 +1,139 @@
+import os
+import time
+import threading
+
+try:
+    from core.publishUtils import PUBLISH_MANIFEST
+except ImportError:
+    from publishUtils import PUBLISH_MANIFEST
+
+#folders the launcher never shows
+IGNORED_DIRS = {"__pycache__", ".git"}
+
+#how long prefetched listings are trusted before going back to the share
+LISTING_TTL = float(os.environ.get("ORI_LISTING_TTL", "30"))
+
+def norm_key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+def list_dir(path, include_hidden=False):
+    """
+    Lists a folder with one scandir pass.
+    Returns (dirs, files): sorted folder names and (name, size, mtime) tuples
+    for files. Missing or unreadable folders give ([], []).
+    """
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not include_hidden and entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir():
+                        if entry.name not in IGNORED_DIRS:
+                            dirs.append(entry.name)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.name, st.st_size, st.st_mtime))
+    except OSError:
+        return [], []
+
+    dirs.sort()
+    return dirs, files
+
+def scan_item_tree(item_path):
+    """
+    Lists a shot/asset folder down to the files of every task in one go:
+    item -> department -> task -> task files, EXPORT and EXPORT/PUBLISHED.
+    Returns {folder path: (dirs, files)} for every folder visited.
+    """
+    listings = {}
+
+    def visit(path):
+        listing = list_dir(path)
+        listings[path] = listing
+        return listing[0]
+
+    for spec in visit(item_path):
+        spec_path = os.path.join(item_path, spec)
+        for task in visit(spec_path):
+            task_path = os.path.join(spec_path, task)
+            if "EXPORT" in visit(task_path):
+                export_path = os.path.join(task_path, "EXPORT")
+                if "PUBLISHED" in visit(export_path):
+                    visit(os.path.join(export_path, "PUBLISHED"))
+    return listings
+
+def list_exports(task_path, listing_cache=None):
+    """
+    Export records for a task: (name, path, size, mtime, published).
+    EXPORT and EXPORT/PUBLISHED are each listed once (or taken from
+    listing_cache), published files come first, newest first within each.
+    """
+    export_path = os.path.join(task_path, "EXPORT")
+    publish_path = os.path.join(export_path, "PUBLISHED")
+
+    records = []
+    for folder, published in ((publish_path, True), (export_path, False)):
+        listing = listing_cache.get(folder) if listing_cache else None
+        if listing is None:
+            listing = list_dir(folder)
+            if listing_cache:
+                listing_cache.put(folder, listing)
+
+        part = [(name, os.path.join(folder, name), size, mtime, published) for name, size, mtime in listing[1]
+                if name != PUBLISH_MANIFEST]
+        part.sort(key=lambda r: r[3], reverse=True)
+        records.extend(part)
+    return records
+
+class ListingCache:
+    """
+    Short lived cache of folder listings shared by the launcher panes.
+    Entries expire after ttl seconds so changes made by other people show up.
+    """
+
+    def __init__(self, ttl=LISTING_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Returns (dirs, files) for path, or None if not cached or too old."""
+        key = norm_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stamp, listing = entry
+            if time.time() - stamp > self.ttl:
+                del self._entries[key]
+                return None
+            return listing
+
+    def put(self, path, listing):
+        with self._lock:
+            self._entries[norm_key(path)] = (time.time(), listing)
+
+    def update(self, listings):
+        now = time.time()
+        with self._lock:
+            for path, listing in listings.items():
+                self._entries[norm_key(path)] = (now, listing)
+
+    def invalidate(self, path):
+        """Drops path and everything below it."""
+        key = norm_key(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._lock:
+            for k in [k for k in self._entries if k == key or k.startswith(prefix)]:
+                del self._entries[k]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
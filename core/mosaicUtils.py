@@ -0,0 +1,78 @@
+import os
+import math
+
+try:
+    from core.cacheUtils import DiskCache, get_local_cache_dir, make_cache_key
+except ImportError:
+    from cacheUtils import DiskCache, get_local_cache_dir, make_cache_key
+
+#default budget for cached comparison videos (override with ORI_COMPARE_CACHE_MB)
+COMPARE_CACHE_MB = int(os.environ.get("ORI_COMPARE_CACHE_MB", "4096"))
+
+_compare_cache = None
+
+def compute_mosaic_layout(num_inputs, canvas_width=1920, canvas_height=1080, even_dims=True):
+    """
+    Works out the xstack grid for a number of inputs.
+    Pure function, no disk or ffmpeg access.
+
+    Returns a dict with:
+        cols, rows              grid size
+        tile_width, tile_height size each input is scaled to
+        positions               list of 'x_y' xstack expressions, one per input
+        layout                  positions joined with '|' for the xstack filter
+    """
+    if num_inputs < 1:
+        raise ValueError("Mosaic needs at least one input.")
+
+    cols = math.ceil(math.sqrt(num_inputs))
+    rows = math.ceil(num_inputs / cols)
+
+    tile_width = int(canvas_width // cols)
+    tile_height = int(canvas_height // rows)
+
+    #x264/nvenc need even dimensions
+    if even_dims:
+        tile_width -= tile_width % 2
+        tile_height -= tile_height % 2
+
+    positions = []
+    for i in range(num_inputs):
+        x_pos = i % cols
+        y_pos = i // cols
+
+        x_str = '+'.join([f'w{j}' for j in range(x_pos)]) if x_pos > 0 else '0'
+        y_str = '+'.join([f'h{j}' for j in range(y_pos)]) if y_pos > 0 else '0'
+        positions.append(f'{x_str}_{y_str}')
+
+    return {
+        "cols": cols,
+        "rows": rows,
+        "tile_width": tile_width,
+        "tile_height": tile_height,
+        "positions": positions,
+        "layout": '|'.join(positions),
+    }
+
+def get_compare_cache():
+    """Shared local cache for comparison mosaics."""
+    global _compare_cache
+    if _compare_cache is None:
+        root = get_local_cache_dir("comparisons")
+        _compare_cache = DiskCache(root, max_bytes=COMPARE_CACHE_MB * 1024 * 1024, ext=".mp4")
+    return _compare_cache
+
+def get_comparison_key(paths, layout, params=None):
+    """
+    Key for a comparison made from paths with the given layout.
+    Input order matters, so callers should sort paths first.
+    """
+    key_params = {
+        "cols": layout["cols"],
+        "rows": layout["rows"],
+        "tile_width": layout["tile_width"],
+        "tile_height": layout["tile_height"],
+    }
+    if params:
+        key_params.update(params)
+    return make_cache_key(paths, key_params)
@@ -9,6 +9,25 @@ import subprocess
 import shutil
 from datetime import datetime 
 
+def set_hidden(path, hidden=True):
+    """
+    Sets or clears the windows hidden attribute. Goes through the win32 api so
+    tagging hundreds of folders doesn't start an attrib process per file. No-op off windows.
+    """
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        attrs = kernel32.GetFileAttributesW(str(path))
+        if attrs not in (-1, 0xFFFFFFFF):
+            attrs = attrs | 0x2 if hidden else attrs & ~0x2
+            if kernel32.SetFileAttributesW(str(path), attrs):
+                return
+    except (ImportError, AttributeError, OSError):
+        pass
+    subprocess.run(["attrib", "+h" if hidden else "-h", path], check=False, shell=True)
+
 class OrionUtils():
     
     # Standard Folder Structure
@@ -284,7 +303,7 @@ class OrionUtils():
         
         # file exists and is hidden, unhide so can write to it
         if os.name == 'nt' and os.path.exists(json_path):
-            subprocess.run(["attrib", "-h", json_path], check=False, shell=True)
+            set_hidden(json_path, False)
         # ----------------------------
 
         try:
@@ -312,8 +331,8 @@ class OrionUtils():
             
             # Re-apply Hidden Attribute
             if os.name == 'nt':
-                subprocess.run(["attrib", "+h", json_path], check=False, shell=True)
-                subprocess.run(["attrib", "+h", id_marker], check=False, shell=True)
+                set_hidden(json_path)
+                set_hidden(id_marker)
             
             return True
         except Exception as e:
@@ -336,7 +355,7 @@ class OrionUtils():
         json_path = os.path.join(folder_path, "orion_meta.json")
         
         if os.name == 'nt' and os.path.exists(json_path):
-            subprocess.run(["attrib", "-h", json_path], check=False, shell=True)
+            set_hidden(json_path, False)
 
         try:
             if os.path.exists(json_path):
@@ -352,7 +371,7 @@ class OrionUtils():
             
             # Re-hide
             if os.name == 'nt':
-                subprocess.run(["attrib", "+h", json_path], check=False, shell=True)
+                set_hidden(json_path)
             return True
         except Exception as e:
             print(f"Tagging failed: {e}")
@@ -376,7 +395,7 @@ class OrionUtils():
         json_path = os.path.join(folder_path, "orion_meta.json")
         
         if os.name == 'nt' and os.path.exists(json_path):
-            subprocess.run(["attrib", "-h", json_path], check=False, shell=True)
+            set_hidden(json_path, False)
 
         try:
             if os.path.exists(json_path):
@@ -392,7 +411,7 @@ class OrionUtils():
             
             # Re-hide
             if os.name == 'nt':
-                subprocess.run(["attrib", "+h", json_path], check=False, shell=True)
+                set_hidden(json_path)
             return True
         except Exception as e:
             print(f"Tagging failed: {e}")
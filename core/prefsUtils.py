@@ -1,8 +1,13 @@
 import os
-import shutil
+import sys
 import json
 import subprocess
 
+try:
+    from core.syncUtils import sync_tree
+except ImportError:
+    from syncUtils import sync_tree
+
 class PrefsUtils:
 
     def __init__(self, orion_utils_instance):
@@ -71,18 +76,10 @@ class PrefsUtils:
             dst_dir = os.path.join(self.root_dir, dst_fmt.format(user=user if user else self.current_user))
 
             if os.path.exists(src_dir):
-                if not os.path.exists(dst_dir):
-                    os.makedirs(dst_dir)
-
-                src_files = os.listdir(src_dir)
-                for f in src_files:
-                    if f.endswith(".pref") and f != "jump.pref":
-                        src_file = os.path.join(src_dir, f)
-                        try:
-                            shutil.copy2(src_file, dst_dir)
-                            print(f"Saved {f}")
-                        except Exception as e:
-                            print(f"Error copying {f}: {e}")
+                #only top level .pref files, server files that aren't local any more are kept
+                result = sync_tree(src_dir, dst_dir, delete=False, use_hash=True, recursive=False,
+                                   file_filter=lambda rel: rel.endswith(".pref") and rel != "jump.pref")
+                self.print_sync_result(src_dir, dst_dir, result)
         
         # Handle Folder-based software (Maya, etc.)
         elif software != "nuke": # Nuke usually handled via env vars only
@@ -99,16 +96,25 @@ class PrefsUtils:
                     dst_final = os.path.join(self.root_dir, dst_fmt.format(user=user if user else self.current_user), folder_name)
                     
                     if os.path.exists(s_path):
+                        #only changed files are copied and removed ones deleted, instead of rmtree + copytree
                         try:
-                            if os.path.exists(dst_final):
-                                shutil.rmtree(dst_final) # Clear old backup to ensure sync
-                            shutil.copytree(s_path, dst_final)
-                            print(f"Saved folder {s_path} to {dst_final}")
+                            result = sync_tree(s_path, dst_final, use_hash=True)
+                            self.print_sync_result(s_path, dst_final, result)
                         except Exception as e:
                             print(f"Error saving {s_path}: {e}")
 
-    def load_prefs(self, software, user=None):
-        """Loads preferences from server to local machine"""
+    def print_sync_result(self, src, dst, result):
+        for rel, err in result["errors"]:
+            print(f"Error copying {rel}: {err}")
+        print(f"Saved {src} to {dst}: {len(result['copied'])} copied, {len(result['deleted'])} deleted, "
+              f"{result['unchanged']} unchanged ({result['seconds']:.1f}s)")
+
+    def load_prefs(self, software, user=None, dry_run=False):
+        """
+        Loads preferences from server to local machine.
+        Only files that differ from the local copy are copied, local only files are kept.
+        dry_run just reports what would be copied. Returns the sync result (or None).
+        """
         user_to_use = user if user else self.current_user
         pref_json = self.get_software_config_file(software)
 
@@ -128,11 +134,20 @@ class PrefsUtils:
         src_path = os.path.join(self.root_dir, src_config.format(user=user_to_use))
 
         if os.path.exists(src_path):
+                #both sides are listed: the server folder can be changed by hand and save_prefs only
+                #covers part of it (houdini), so its manifest can't stand in for the real listing
                 try:
-                    shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
-                    print(f"Copied prefs from: {src_path} to {dst_path}")
+                    result = sync_tree(src_path, dst_path, delete=False, dst_manifest=False, dry_run=dry_run)
                 except Exception as e:
                     print(f"Error copying prefs from: {src_path} to {dst_path}: {e}")
+                    return
+
+                for rel, err in result["errors"]:
+                    print(f"Error copying {rel}: {err}")
+                verb = "Would copy" if dry_run else "Copied"
+                print(f"{verb} prefs from: {src_path} to {dst_path}: {len(result['copied'])} files, "
+                      f"{result['bytes'] / (1024 * 1024):.1f} MB, {result['unchanged']} unchanged ({result['seconds']:.1f}s)")
+                return result
 
         # if software == "houdini":
         #     jump_src = os.path.join(self.root_dir, "60_config", "softwarePrefs", "houdini", "jump.pref")
@@ -215,4 +230,4 @@ if __name__ == "__main__":
     orion = orionUtils.OrionUtils()
     prefs = prefsUtils.PrefsUtils(orion)
     
-    prefs.load_prefs("maya")
\ No newline at end of file
+    prefs.load_prefs("maya", dry_run="--dry-run" in sys.argv)
\ No newline at end of file
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import getpass
+import shutil
+import threading
+
+try:
+    from core.transferUtils import copy_file, swap_in, list_tree
+except ImportError:
+    from transferUtils import copy_file, swap_in, list_tree
+
+#lives inside each PUBLISHED folder, DCC loaders only look for their own file types so they skip it
+PUBLISH_MANIFEST = "published.json"
+
+class LinkUnavailable(OSError):
+    """The share can't hardlink these files, a real copy is needed instead."""
+
+#"link" hardlinks into PUBLISHED (falls back to copying per file), "copy" always copies
+PUBLISH_MODE = os.environ.get("ORI_PUBLISH_MODE", "link")
+
+def try_link(src, dst):
+    """
+    Hardlinks src to dst, replacing dst in one rename. No data is copied.
+    Returns False if the filesystem can't link (other drive, FAT, some shares).
+    """
+    if PUBLISH_MODE != "link":
+        return False
+    temp_path = f"{dst}.{os.getpid()}_{threading.get_ident()}.link"
+    try:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        os.link(src, temp_path)
+        os.replace(temp_path, dst)
+        return True
+    except (OSError, NotImplementedError, AttributeError):
+        try: os.remove(temp_path)
+        except OSError: pass
+        return False
+
+def link_or_copy(src, dst):
+    """Hardlinks if possible, copies otherwise. Returns 'link' or 'copy'."""
+    if try_link(src, dst):
+        return "link"
+    copy_file(src, dst)
+    return "copy"
+
+#   MANIFEST
+
+def read_manifest(publish_dir):
+    try:
+        with open(os.path.join(publish_dir, PUBLISH_MANIFEST), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+
+def write_manifest(publish_dir, data):
+    path = os.path.join(publish_dir, PUBLISH_MANIFEST)
+    temp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+    os.makedirs(publish_dir, exist_ok=True)
+    with open(temp_path, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(temp_path, path)
+
+def make_entry(src, method):
+    st = os.stat(src)
+    return {
+        "source": os.path.basename(src),
+        "source_path": src,
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "method": method,
+        "user": getpass.getuser(),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+def record_publish(publish_dir, name, src, method):
+    """Adds (or replaces) the entry for a published file."""
+    data = read_manifest(publish_dir)
+    data.setdefault("files", {})[name] = make_entry(src, method)
+    write_manifest(publish_dir, data)
+
+def forget_publish(publish_dir, name):
+    data = read_manifest(publish_dir)
+    if data.get("files", {}).pop(name, None) is not None:
+        write_manifest(publish_dir, data)
+
+def get_published_source(publish_dir, name):
+    """The versioned file a published file came from, or None if unknown."""
+    entry = read_manifest(publish_dir).get("files", {}).get(name)
+    return entry.get("source_path") if entry else None
+
+#   PUBLISH
+
+def publish_file(src, publish_dir, name=None):
+    """
+    Publishes one file into publish_dir under name (default: same name).
+    Costs a link and a small json write when the share supports hardlinks.
+    Returns the published path.
+    """
+    name = name or os.path.basename(src)
+    dst = os.path.join(publish_dir, name)
+    method = link_or_copy(src, dst)
+    record_publish(publish_dir, name, src, method)
+    return dst
+
+def link_publish(src, publish_dir, name=None):
+    """
+    Like publish_file but only if it can be done with a hardlink.
+    Returns the published path, or None so the caller can queue a real copy.
+    """
+    name = name or os.path.basename(src)
+    dst = os.path.join(publish_dir, name)
+    if not try_link(src, dst):
+        return None
+    record_publish(publish_dir, name, src, "link")
+    return dst
+
+def publish_folder(src_dir, publish_dir):
+    """
+    Replaces publish_dir with hardlinks to every file of src_dir (e.g. a
+    texture version folder). The links and manifest are built in a staging
+    folder and swapped in with a rename, so readers see the old or the new
+    publish, never a mix. Raises LinkUnavailable if the files can't be linked,
+    so the caller can fall back to a real copy. Any other error (e.g. PUBLISHED
+    held open by a reader on windows) is raised as is, copying wouldn't get past it.
+    """
+    staging = f"{os.path.normpath(publish_dir)}.{os.getpid()}_{threading.get_ident()}.staging"
+    try:
+        for rel, _ in list_tree(src_dir):
+            dst = os.path.join(staging, rel)
+            if not try_link(os.path.join(src_dir, rel), dst):
+                raise LinkUnavailable(f"Cannot hardlink into {publish_dir}")
+        write_folder_manifest(src_dir, staging, "link")
+        swap_in(staging, publish_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return publish_dir
+
+def write_folder_manifest(src_dir, publish_dir, method):
+    files = {}
+    for rel, _ in list_tree(src_dir):
+        files[rel.replace("\\", "/")] = make_entry(os.path.join(src_dir, rel), method)
+    write_manifest(publish_dir, {"version": os.path.basename(os.path.normpath(src_dir)),
+                                 "source_path": src_dir, "files": files})
@@ -0,0 +1,221 @@
+import os
+import re
+
+#image types that get collapsed into sequences
+IMAGE_EXTS = {".exr", ".jpg", ".jpeg", ".png", ".tif", ".tiff", ".dpx", ".tga", ".bmp", ".hdr"}
+
+#frame number is the last run of digits before the extension, after a '.' or '_'.
+#a run glued to a word (shot_v001, take2) is a version or part of the name, not a frame
+_FRAME_RE = re.compile(r"(?<=[._])(\d+)$")
+
+class ImageSequence:
+    """
+    A run of numbered files in one folder, e.g. plate.1001.exr -> plate.1100.exr
+    head is everything before the frame number ('plate.'), tail is the extension ('.exr').
+    """
+
+    def __init__(self, directory, head, tail, padding):
+        self.directory = directory
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self.frames = []
+        self.sizes = {}
+        self.mtime = 0.0
+
+    def __repr__(self):
+        return f"<ImageSequence {self.name} {self.frame_range_string()}>"
+
+    def __len__(self):
+        return len(self.frames)
+
+    #   INFO
+
+    @property
+    def name(self):
+        """Display name with hashes for the frame, e.g. plate.####.exr"""
+        return f"{self.head}{'#' * self.padding}{self.tail}"
+
+    @property
+    def start(self):
+        return self.frames[0] if self.frames else None
+
+    @property
+    def end(self):
+        return self.frames[-1] if self.frames else None
+
+    @property
+    def count(self):
+        return len(self.frames)
+
+    @property
+    def total_size(self):
+        return sum(self.sizes.values())
+
+    @property
+    def middle_frame(self):
+        """Frame in the middle of the sequence, handy for a representative thumbnail."""
+        if not self.frames: return None
+        return self.frames[len(self.frames) // 2]
+
+    def frame_ranges(self):
+        """Returns list of (start, end) tuples for each continuous block of frames."""
+        ranges = []
+        if not self.frames:
+            return ranges
+
+        block_start = prev = self.frames[0]
+        for f in self.frames[1:]:
+            if f != prev + 1:
+                ranges.append((block_start, prev))
+                block_start = f
+            prev = f
+        ranges.append((block_start, prev))
+        return ranges
+
+    def frame_range_string(self):
+        """e.g. '1001-1050, 1052-1100'"""
+        parts = []
+        for a, b in self.frame_ranges():
+            parts.append(f"{a}-{b}" if a != b else f"{a}")
+        return ", ".join(parts)
+
+    def missing_frames(self):
+        """Frames between start and end that are not on disk."""
+        if len(self.frames) < 2:
+            return []
+        missing = []
+        ranges = self.frame_ranges()
+        for (_, a_end), (b_start, _) in zip(ranges, ranges[1:]):
+            missing.extend(range(a_end + 1, b_start))
+        return missing
+
+    def has_gaps(self):
+        return len(self.frame_ranges()) > 1
+
+    #   PATHS
+
+    def frame_name(self, frame):
+        return f"{self.head}{frame:0{self.padding}d}{self.tail}"
+
+    def path(self, frame):
+        """Full path to a single frame."""
+        return os.path.join(self.directory, self.frame_name(frame))
+
+    def pattern(self, style="printf"):
+        """
+        Full path with the frame swapped for a token.
+        styles: 'printf' -> %04d (ffmpeg/nuke), 'houdini' -> $F4, 'hash' -> ####
+        """
+        if style == "houdini":
+            token = f"$F{self.padding}" if self.padding > 1 else "$F"
+        elif style == "hash":
+            token = "#" * self.padding
+        else:
+            token = f"%0{self.padding}d" if self.padding > 1 else "%d"
+        return os.path.join(self.directory, f"{self.head}{token}{self.tail}")
+
+def split_frame(filename):
+    """
+    Splits 'plate.1001.exr' into ('plate.', '1001', '.exr').
+    Returns None if there is no frame number before the extension
+    ('shot_v001.exr' is a version, not frame 1).
+    """
+    stem, ext = os.path.splitext(filename)
+    match = _FRAME_RE.search(stem)
+    if not match:
+        return None
+    return stem[:match.start()], match.group(1), ext
+
+def collapse_entries(directory, entries, extensions=IMAGE_EXTS, min_frames=2):
+    """
+    Groups (name, size, mtime) tuples into sequences.
+    Returns (sequences, singles) where singles are the entries that are not
+    part of a sequence with at least min_frames frames.
+    Pure function, no disk access.
+    """
+    groups = {}
+    singles = []
+
+    for entry in entries:
+        name = entry[0]
+        parts = split_frame(name)
+        if not parts or (extensions and parts[2].lower() not in extensions):
+            singles.append(entry)
+            continue
+
+        head, digits, tail = parts
+        #padded frames keep their width, unpadded ones group together as width 1
+        width = len(digits) if digits.startswith("0") else 0
+        groups.setdefault((head, tail), []).append((int(digits), width, len(digits), entry))
+
+    sequences = []
+    for (head, tail), items in groups.items():
+        if len(items) < min_frames:
+            singles.extend(item[3] for item in items)
+            continue
+
+        items.sort(key=lambda item: item[0])
+
+        #fixed width if any frame had a leading zero or every frame is the same width
+        widths = {item[2] for item in items}
+        padded = [item[1] for item in items if item[1]]
+        if padded:
+            padding = max(padded)
+        elif len(widths) == 1:
+            padding = widths.pop()
+        else:
+            padding = 1
+
+        seq = ImageSequence(directory, head, tail, padding)
+        for frame, _, _, entry in items:
+            if seq.frames and seq.frames[-1] == frame:
+                #same frame written twice with different padding, keep the first
+                singles.append(entry)
+                continue
+            seq.frames.append(frame)
+            seq.sizes[frame] = entry[1]
+            if entry[2] > seq.mtime:
+                seq.mtime = entry[2]
+        sequences.append(seq)
+
+    sequences.sort(key=lambda s: s.name)
+    return sequences, singles
+
+def scan_directory(directory, extensions=IMAGE_EXTS, min_frames=2, include_hidden=False):
+    """
+    Lists a folder once with scandir and collapses it into sequences.
+    Returns (sequences, singles) where singles are (name, size, mtime) tuples
+    for files that are not part of a sequence. Folders are skipped.
+    """
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not include_hidden and entry.name.startswith("."):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.name, st.st_size, st.st_mtime))
+    except OSError as e:
+        print(f"Error scanning {directory}: {e}")
+        return [], []
+
+    return collapse_entries(directory, entries, extensions=extensions, min_frames=min_frames)
+
+def find_sequence(directory, extensions=IMAGE_EXTS):
+    """
+    Returns the main image sequence in a folder (the one with the most frames),
+    or None. A single numbered image is returned as a one frame sequence.
+    """
+    if not os.path.isdir(directory):
+        return None
+
+    sequences, _ = scan_directory(directory, extensions=extensions, min_frames=1)
+    if not sequences:
+        return None
+    return max(sequences, key=lambda s: (s.count, s.mtime))
@@ -0,0 +1,212 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from core.transferUtils import copy_file, hash_file
+except ImportError:
+    from transferUtils import copy_file, hash_file
+
+#kept in the root of every synced copy, describes what is in it without listing the share
+SYNC_MANIFEST = ".orion_sync.json"
+
+#how many files are copied at once (override with ORI_SYNC_WORKERS)
+SYNC_WORKERS = int(os.environ.get("ORI_SYNC_WORKERS", "8"))
+
+def scan_tree(root, recursive=True, file_filter=None):
+    """
+    Lists every file below root in one scandir pass per folder.
+    Returns {relative path: [size, mtime_ns, None]} (the last slot is for a hash).
+    file_filter(rel_path) can reject files.
+    """
+    found = {}
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                            continue
+                        if not entry.is_file() or entry.name == SYNC_MANIFEST:
+                            continue
+                        rel = os.path.relpath(entry.path, root).replace("\\", "/")
+                        if file_filter and not file_filter(rel):
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    found[rel] = [st.st_size, st.st_mtime_ns, None]
+        except OSError:
+            continue
+    return found
+
+def make_scope(recursive=True, file_filter=None):
+    """What a sync looked at, a manifest only describes files inside the scope it was written with."""
+    return {"recursive": bool(recursive), "filtered": file_filter is not None}
+
+#a manifest written with this scope lists every file of its folder
+FULL_SCOPE = make_scope()
+
+def read_manifest(folder, scope=None):
+    """
+    The file table saved by the last sync into folder, or None if there isn't one
+    (or, with scope, if it was written by a sync that looked at something else).
+    """
+    try:
+        with open(os.path.join(folder, SYNC_MANIFEST), "r") as f:
+            data = json.load(f)
+        if scope is not None and data.get("scope") != scope:
+            return None
+        return data.get("files")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def write_manifest(folder, files, scope=None):
+    path = os.path.join(folder, SYNC_MANIFEST)
+    temp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(folder, exist_ok=True)
+        with open(temp_path, "w") as f:
+            json.dump({"time": time.time(), "scope": scope, "files": files}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"Could not write sync manifest in {folder}: {e}")
+
+def diff_trees(src_root, src_files, dst_files, use_hash=False):
+    """
+    Works out what has to change to make dst match src.
+    Returns (to_copy, to_delete, unchanged, touched) lists of relative paths.
+    With use_hash, a file that was only touched (same size, new mtime) is
+    hashed and, if its content is the same as last time, listed in touched
+    instead of to_copy.
+    """
+    to_copy = []
+    unchanged = []
+    touched = []
+    for rel, entry in src_files.items():
+        old = dst_files.get(rel)
+        if old and old[0] == entry[0] and old[1] == entry[1]:
+            entry[2] = old[2] if len(old) > 2 else None
+            unchanged.append(rel)
+            continue
+        if use_hash and old and old[0] == entry[0] and len(old) > 2 and old[2]:
+            entry[2] = hash_file(os.path.join(src_root, rel))
+            if entry[2] == old[2]:
+                touched.append(rel)
+                continue
+        to_copy.append(rel)
+
+    to_delete = [rel for rel in dst_files if rel not in src_files]
+    return to_copy, to_delete, unchanged, touched
+
+def remove_file(dst_root, rel):
+    """Deletes a synced file and any folders it leaves empty (never dst_root itself)."""
+    path = os.path.join(dst_root, rel)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    folder = os.path.dirname(path)
+    root = os.path.normpath(dst_root)
+    while os.path.normpath(folder) != root:
+        try:
+            os.rmdir(folder)
+        except OSError:
+            break
+        folder = os.path.dirname(folder)
+
+def sync_tree(src, dst, delete=True, use_hash=False, recursive=True, file_filter=None, workers=SYNC_WORKERS,
+              src_manifest=False, dst_manifest=True, dry_run=False):
+    """
+    Makes dst a copy of src, touching only what changed since the last sync.
+    Each side is either listed for real or, with src_manifest/dst_manifest,
+    described by the manifest in it so a share doesn't have to be walked
+    (it is listed if the manifest is missing or was written for another scope).
+    A source manifest is only trusted if it lists the whole folder, and only
+    knows about changes made through sync_tree, so leave src_manifest off for
+    folders people also edit by hand. Changed files are copied
+    in parallel, removed ones are deleted when delete is on.
+    dry_run only works out what would happen.
+    Returns a dict with copied, deleted, unchanged, bytes, errors and seconds.
+    """
+    start = time.time()
+    result = {"copied": [], "deleted": [], "unchanged": 0, "bytes": 0, "errors": [], "seconds": 0.0}
+
+    scope = make_scope(recursive, file_filter)
+    src_files = read_manifest(src, FULL_SCOPE) if src_manifest else None
+    if src_files is None:
+        src_files = scan_tree(src, recursive=recursive, file_filter=file_filter)
+    elif file_filter:
+        src_files = {rel: e for rel, e in src_files.items() if file_filter(rel)}
+
+    dst_files = read_manifest(dst, scope) if dst_manifest else None
+    listed_dst = dst_files is None
+    if dst_files is None:
+        dst_files = scan_tree(dst, recursive=recursive, file_filter=file_filter)
+
+    to_copy, to_delete, unchanged, touched = diff_trees(src, src_files, dst_files, use_hash=use_hash)
+    result["unchanged"] = len(unchanged) + len(touched)
+    if not delete:
+        #files only on the destination stay, and stay in the manifest
+        for rel in to_delete:
+            src_files[rel] = dst_files[rel]
+        to_delete = []
+
+    if dry_run:
+        result["copied"] = to_copy
+        result["deleted"] = to_delete
+        result["bytes"] = sum(src_files[rel][0] for rel in to_copy)
+        result["seconds"] = time.time() - start
+        return result
+
+    def copy_one(rel):
+        size = copy_file(os.path.join(src, rel), os.path.join(dst, rel))
+        if use_hash:
+            entry = src_files[rel]
+            if not entry[2]:
+                entry[2] = hash_file(os.path.join(src, rel))
+        return size
+
+    if to_copy:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orion_sync") as executor:
+            futures = {executor.submit(copy_one, rel): rel for rel in to_copy}
+            for future in as_completed(futures):
+                rel = futures[future]
+                try:
+                    result["bytes"] += future.result()
+                    result["copied"].append(rel)
+                except Exception as e:
+                    result["errors"].append((rel, str(e)))
+                    #leave the old entry (or none) so it is retried next time
+                    if rel in dst_files:
+                        src_files[rel] = dst_files[rel]
+                    else:
+                        src_files.pop(rel, None)
+
+    #same content, just bring the mtime over so the copy and its manifest entry agree
+    for rel in touched:
+        try:
+            os.utime(os.path.join(dst, rel), ns=(src_files[rel][1], src_files[rel][1]))
+        except OSError:
+            src_files[rel] = dst_files[rel]
+
+    for rel in to_delete:
+        try:
+            remove_file(dst, rel)
+            result["deleted"].append(rel)
+        except OSError as e:
+            result["errors"].append((rel, str(e)))
+            src_files[rel] = dst_files[rel]
+
+    #also rewrites it when only mtimes/hashes moved on, so they are cheap to match next time
+    if dst_manifest and (listed_dst or src_files != dst_files):
+        write_manifest(dst, src_files, scope)
+
+    result["seconds"] = time.time() - start
+    return result
@@ -0,0 +1,272 @@
+import os
+import re
+
+#material channel -> name tokens that mean it. Multi word keywords are token runs
+#("coat_rough" matches "coat_rough", "coat-rough" and "coatRough"). Names are host neutral,
+#they happen to match the mtlx standard surface inputs.
+CHANNEL_KEYWORDS = {
+    'base_color': ['diffuse', 'albedo', 'basecolor', 'base_color', 'diff', 'color', 'col', 'base'],
+    'coat': ['clearcoat', 'coat', 'coat_color', 'clearcoat_color'],
+    'coat_roughness': ['clearcoat_roughness', 'coat_roughness', 'coat_rough', 'gloss', 'clearcoat_gloss'],
+    'transmission': ['transmission', 'trans'],
+    'coat_IOR': ['clearcoat_ior', 'coat_ior', 'ior'],
+    'specular_roughness': ['roughness', 'rough', 'rgh'],
+    'specular': ['specular', 'spec', 'specular_color', 'spec_color'],
+    'anisotropy': ['ani', 'anisotropy'],
+    'metalness': ['metallic', 'metalness', 'metal', 'mtl'],
+    'emission_color': ['emission', 'emissive', 'emit', 'emission_color', 'emissive_color'],
+    'subsurface_color': ['sss', 'subsurface', 'sss_color', 'subsurface_color'],
+    'displacement': ['displacement', 'disp', 'height', 'heightmap', 'bump'],
+    'normal': ['normal', 'normalmap', 'nrm', 'nor'],
+    'sheen': ['sheen', 'sheen_color'],
+}
+
+#what kind of value each channel holds, material builders pick their node signature from it
+CHANNEL_TYPES = {
+    'base_color': 'color',
+    'emission_color': 'color',
+    'subsurface_color': 'color',
+    'normal': 'vector',
+}
+
+#bits per channel and float-ness a file type usually has (a guess, the header is never read)
+EXT_DEPTHS = {
+    ".exr": (16, True),
+    ".hdr": (32, True),
+    ".tif": (16, False),
+    ".tiff": (16, False),
+    ".tx": (16, False),
+    ".tex": (16, False),
+    ".png": (8, False),
+    ".tga": (8, False),
+    ".jpg": (8, False),
+    ".jpeg": (8, False),
+    ".bmp": (8, False),
+}
+TEXTURE_EXTS = set(EXT_DEPTHS)
+
+#when a channel exists in several formats the first of these wins
+EXT_PREFERENCE = [".exr", ".tx", ".tif", ".tiff", ".tex", ".hdr", ".png", ".tga", ".jpg", ".jpeg", ".bmp"]
+
+UDIM_TOKEN = "<UDIM>"
+
+_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+_UDIM_RE = re.compile(r"^1\d{3}$")
+
+def _build_lookup():
+    lookup = {}
+    for channel, keywords in CHANNEL_KEYWORDS.items():
+        for k in keywords:
+            lookup.setdefault(tuple(_SPLIT_RE.split(k.lower())), channel)
+    return lookup
+
+#token run -> channel, built once. The longest keyword tells the widest run to try.
+CHANNEL_LOOKUP = _build_lookup()
+MAX_KEYWORD_TOKENS = max(len(k) for k in CHANNEL_LOOKUP)
+
+def tokenize(stem):
+    """'rock_BaseColor.1001' -> ['rock', 'base', 'color', '1001']"""
+    return [t for t in _SPLIT_RE.split(_CAMEL_RE.sub(r"\1_\2", stem).lower()) if t]
+
+def match_channel(tokens):
+    """
+    Finds the channel keyword in a token list. Whole tokens only, so 'base' never
+    matches inside 'basecolor' or 'baseball'. The longest keyword wins, then the
+    one furthest right (names are usually <asset>_<channel>).
+    Returns (channel, start, end) or None.
+    """
+    best = None
+    for size in range(min(MAX_KEYWORD_TOKENS, len(tokens)), 0, -1):
+        for start in range(len(tokens) - size, -1, -1):
+            channel = CHANNEL_LOOKUP.get(tuple(tokens[start:start + size]))
+            if channel:
+                best = (channel, start, start + size)
+                break
+        if best:
+            break
+    return best
+
+def split_texture_name(filename):
+    """
+    Breaks a texture file name into (set name, channel, udim, ext).
+    channel is None if no keyword matched, udim None if it isn't tiled.
+    """
+    stem, ext = os.path.splitext(filename)
+    ext = ext.lower()
+    tokens = tokenize(stem)
+
+    udim = None
+    for i in range(len(tokens) - 1, -1, -1):
+        if _UDIM_RE.match(tokens[i]):
+            udim = int(tokens.pop(i))
+            break
+
+    found = match_channel(tokens)
+    if not found:
+        return "_".join(tokens), None, udim, ext
+    channel, start, end = found
+    #what comes before the keyword names the set, what follows is usually a per channel
+    #suffix (rock_normal_gl, rock_basecolor_8k) that shouldn't split it
+    return "_".join(tokens[:start] or tokens[end:]), channel, udim, ext
+
+def udim_pattern(filename, udim):
+    """'rock_col.1001.exr', 1001 -> 'rock_col.<UDIM>.exr' (the last match, like split_texture_name)."""
+    if udim is None:
+        return filename
+    found = list(re.finditer(rf"(?<!\d){udim}(?!\d)", filename))
+    if not found:
+        return filename
+    start, end = found[-1].span()
+    return filename[:start] + UDIM_TOKEN + filename[end:]
+
+class TextureChannel:
+    """
+    One channel of a texture set, e.g. the base colour of rock, as a single file
+    or a run of UDIM tiles sharing one name pattern. Other formats or naming
+    patterns of the same channel end up in alternates.
+    """
+
+    def __init__(self, channel, directory, ext):
+        self.channel = channel
+        self.directory = directory
+        self.ext = ext
+        self.files = {}
+        self.alternates = []
+
+    def __repr__(self):
+        tiles = f" {len(self.tiles)} tiles" if self.is_udim else ""
+        return f"<TextureChannel {self.channel} {self.ext}{tiles}>"
+
+    @property
+    def is_udim(self):
+        return any(tile is not None for tile in self.files)
+
+    @property
+    def tiles(self):
+        return sorted(tile for tile in self.files if tile is not None)
+
+    @property
+    def path(self):
+        """File path for a material, with <UDIM> in place of the tile number."""
+        if not self.files:
+            return None
+        tile = self.tiles[0] if self.is_udim else None
+        return os.path.join(self.directory, udim_pattern(self.files[tile], tile))
+
+    @property
+    def data_type(self):
+        return CHANNEL_TYPES.get(self.channel, 'float')
+
+    @property
+    def bit_depth(self):
+        return EXT_DEPTHS.get(self.ext, (8, False))[0]
+
+    @property
+    def is_float(self):
+        return EXT_DEPTHS.get(self.ext, (8, False))[1]
+
+    @property
+    def colorspace(self):
+        """Best guess: 'sRGB' for integer colour maps, 'linear' for float colour, 'raw' for data."""
+        if self.data_type != 'color':
+            return 'raw'
+        return 'linear' if self.is_float else 'sRGB'
+
+class TextureSet:
+    """All the channels that share a set name in one folder, e.g. rock_basecolor / rock_roughness."""
+
+    def __init__(self, name, directory):
+        self.name = name
+        self.directory = directory
+        self.channels = {}
+
+    def __repr__(self):
+        return f"<TextureSet {self.name or '(unnamed)'} {sorted(self.channels)}>"
+
+    def __contains__(self, channel):
+        return channel in self.channels
+
+    def __getitem__(self, channel):
+        return self.channels[channel]
+
+    @property
+    def tiles(self):
+        """Every UDIM any channel has."""
+        return sorted({t for c in self.channels.values() for t in c.tiles})
+
+    def missing_tiles(self):
+        """{channel: tiles other channels have but this one lacks}, handy for spotting a half exported set."""
+        every = set(self.tiles)
+        missing = {}
+        for name, c in self.channels.items():
+            if c.is_udim and every - set(c.tiles):
+                missing[name] = sorted(every - set(c.tiles))
+        return missing
+
+    def owns(self, filename):
+        return any(filename in a.files.values() for c in self.channels.values() for a in [c] + c.alternates)
+
+def group_textures(filenames, directory=""):
+    """
+    Groups file names (no folder needed, so a listing can come from anywhere)
+    into texture sets in one pass. Files without a known extension or channel
+    keyword are left out. Returns {set name: TextureSet}.
+    """
+    found = {}
+    for filename in filenames:
+        if filename.startswith('.'):
+            continue
+        name, channel, udim, ext = split_texture_name(filename)
+        if not channel or ext not in TEXTURE_EXTS:
+            continue
+
+        tex_set = found.get(name)
+        if tex_set is None:
+            tex_set = found[name] = TextureSet(name, directory)
+
+        #files only belong together if they share a name around the tile,
+        #rock_col.1001.tif and rock_diffuse_1002.tif are two different maps
+        by_pattern = tex_set.channels.setdefault(channel, {})
+        pattern = udim_pattern(filename, udim)
+        entry = by_pattern.get(pattern)
+        if entry is None:
+            entry = by_pattern[pattern] = TextureChannel(channel, directory, ext)
+        entry.files[udim] = filename
+
+    #one pattern per channel: preferred format first, then the one with most tiles.
+    #the others are kept as alternates
+    def rank(item):
+        pattern, c = item
+        ext_rank = EXT_PREFERENCE.index(c.ext) if c.ext in EXT_PREFERENCE else len(EXT_PREFERENCE)
+        return ext_rank, -len(c.files), pattern
+
+    for tex_set in found.values():
+        for channel, by_pattern in list(tex_set.channels.items()):
+            ordered = [c for _, c in sorted(by_pattern.items(), key=rank)]
+            ordered[0].alternates = ordered[1:]
+            tex_set.channels[channel] = ordered[0]
+    return found
+
+def detect_texture_sets(directory):
+    """group_textures over one listing of directory."""
+    try:
+        with os.scandir(directory) as it:
+            names = [e.name for e in it if e.is_file()]
+    except OSError:
+        return {}
+    return group_textures(names, directory)
+
+def find_texture_set(path):
+    """
+    The texture set a picked file belongs to (e.g. one tile the user selected).
+    Falls back to the biggest set in the folder if the file itself didn't match.
+    """
+    directory, filename = os.path.split(path)
+    sets = detect_texture_sets(directory)
+    for tex_set in sets.values():
+        if tex_set.owns(filename):
+            return tex_set
+    if not sets:
+        return None
+    return max(sets.values(), key=lambda s: len(s.channels))
@@ -0,0 +1,255 @@
+import os
+import sys
+import shutil
+import subprocess
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from core.cacheUtils import DiskCache, get_local_cache_dir, make_content_key
+    from core.sequenceUtils import scan_directory
+except ImportError:
+    from cacheUtils import DiskCache, get_local_cache_dir, make_content_key
+    from sequenceUtils import scan_directory
+
+#card image area size in the launcher
+THUMB_SIZE = (280, 180)
+
+#shared cache budget (override with ORI_THUMB_CACHE_MB)
+THUMB_CACHE_MB = int(os.environ.get("ORI_THUMB_CACHE_MB", "2048"))
+
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".tga", ".dpx", ".exr", ".hdr"}
+VIDEO_EXTS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
+#anything else (scene files etc) can't be decoded, so it uses a sidecar image saved next to it
+SIDECAR_EXTS = (".jpg", ".jpeg", ".png")
+
+class ThumbnailService:
+    """
+    Makes small jpeg thumbnails for images, exrs, videos (poster frame) and
+    scene files (from a sidecar image) with ffmpeg, and keeps them in a
+    content keyed cache folder.
+
+    Each job is its own ffmpeg process, the pool just limits how many run at once.
+    Usable from the launcher (submit), from scripts (generate_many) and from the CLI.
+    """
+
+    def __init__(self, root_dir=None, cache_root=None, ffmpeg_path=None, size=THUMB_SIZE, max_workers=None):
+        self.root_dir = root_dir
+        self.size = size
+        self.ffmpeg_path = ffmpeg_path or self.find_ffmpeg()
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 4))
+
+        #project cache on the share so render nodes and artists see the same thumbnails
+        if not cache_root:
+            cache_root = os.environ.get("ORI_THUMB_CACHE_PATH")
+        if not cache_root and root_dir and os.path.exists(root_dir):
+            cache_root = os.path.join(root_dir, "60_config", "cache", "thumbnails")
+        if not cache_root:
+            cache_root = get_local_cache_dir("thumbnails")
+
+        self.cache = DiskCache(cache_root, max_bytes=THUMB_CACHE_MB * 1024 * 1024, ext=".jpg", track_access=False)
+
+        self._executor = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def find_ffmpeg(self):
+        candidates = [os.environ.get("ORI_FFMPEG_PATH", "")]
+        if self.root_dir:
+            candidates.append(os.path.join(self.root_dir, "60_config", "libs", "ffmpeg.exe"))
+        for c in candidates:
+            if c and os.path.exists(c):
+                return c
+        return shutil.which("ffmpeg") or "ffmpeg"
+
+    #   LOOKUPS
+
+    def resolve_source(self, path):
+        """
+        Returns the file to build the thumbnail from, or None if there is nothing usable.
+        Scene files look for thumbnails/<name>.jpg or <name>.jpg next to them.
+        """
+        if not path:
+            return None
+        ext = os.path.splitext(path)[1].lower()
+
+        if ext in IMAGE_EXTS or ext in VIDEO_EXTS:
+            return path
+
+        base_dir = os.path.dirname(path)
+        base_name = os.path.splitext(os.path.basename(path))[0]
+        for sidecar_ext in SIDECAR_EXTS:
+            for candidate in (os.path.join(base_dir, "thumbnails", base_name + sidecar_ext),
+                              os.path.join(base_dir, base_name + sidecar_ext)):
+                if os.path.exists(candidate):
+                    return candidate
+        return None
+
+    def get_key(self, source):
+        return make_content_key(source, {"size": list(self.size)})
+
+    def get_cached(self, path):
+        """Returns an existing thumbnail for path without generating one."""
+        source = self.resolve_source(path)
+        if not source:
+            return None
+        return self.cache.get(self.get_key(source))
+
+    #   GENERATION
+
+    def build_command(self, source, output_path):
+        ext = os.path.splitext(source)[1].lower()
+        w, h = self.size
+        scale = f"scale={w}:{h}:force_original_aspect_ratio=decrease"
+
+        cmd = [self.ffmpeg_path, "-y", "-v", "error"]
+        if ext == ".exr":
+            #exrs are linear, convert to srgb so they don't look dark
+            cmd += ["-apply_trc", "iec61966_2_1"]
+        cmd += ["-i", source]
+
+        if ext in VIDEO_EXTS:
+            #pick a representative frame from the start instead of a black first frame
+            vf = f"thumbnail=48,{scale}"
+        else:
+            vf = scale
+
+        cmd += ["-vf", vf, "-frames:v", "1", "-update", "1", "-q:v", "4", output_path]
+        return cmd
+
+    def generate(self, path, force=False):
+        """Builds (or finds) the thumbnail for path. Returns the thumbnail path or None."""
+        source = self.resolve_source(path)
+        if not source:
+            return None
+
+        key = self.get_key(source)
+        if not key:
+            return None
+
+        if not force:
+            cached = self.cache.get(key)
+            if cached:
+                return cached
+
+        temp_path = self.cache.temp_path_for(key)
+
+        startupinfo = None
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+        try:
+            result = subprocess.run(self.build_command(source, temp_path), capture_output=True,
+                                    text=True, startupinfo=startupinfo, timeout=120)
+            if result.returncode != 0:
+                print(f"Thumbnail failed for {source}: {result.stderr.strip()}")
+        except Exception as e:
+            print(f"Thumbnail failed for {source}: {e}")
+
+        return self.cache.commit(key, temp_path)
+
+    def get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="orion_thumb")
+        return self._executor
+
+    def submit(self, path, callback=None):
+        """
+        Queues a thumbnail in the background. callback(path, thumb_path) runs on the
+        worker thread, so UI code has to hand the result back to the GUI thread.
+        Repeated requests for the same path share one job.
+        """
+        with self._lock:
+            future = self._pending.get(path)
+            if future is None:
+                future = self.get_executor().submit(self.generate, path)
+                self._pending[path] = future
+                future.add_done_callback(lambda f, p=path: self._pending.pop(p, None))
+
+        if callback:
+            def _done(f, p=path):
+                try:
+                    thumb = f.result()
+                except Exception as e:
+                    print(f"Thumbnail job failed for {p}: {e}")
+                    thumb = None
+                callback(p, thumb)
+            future.add_done_callback(_done)
+        return future
+
+    def generate_many(self, paths, callback=None, force=False):
+        """Builds thumbnails for many files in parallel. Returns {path: thumb_path}."""
+        results = {}
+        executor = self.get_executor()
+        futures = {executor.submit(self.generate, p, force): p for p in paths}
+        for future in as_completed(futures):
+            p = futures[future]
+            try:
+                results[p] = future.result()
+            except Exception as e:
+                print(f"Thumbnail job failed for {p}: {e}")
+                results[p] = None
+            if callback:
+                callback(p, results[p])
+        return results
+
+    def collect_directory(self, directory):
+        """Files in a folder worth a thumbnail: the middle frame of each sequence plus single files."""
+        sequences, singles = scan_directory(directory)
+        paths = [seq.path(seq.middle_frame) for seq in sequences]
+        for name, _, _ in singles:
+            p = os.path.join(directory, name)
+            if self.resolve_source(p):
+                paths.append(p)
+        return paths
+
+    def generate_for_directory(self, directory, recursive=False, callback=None, force=False):
+        paths = []
+        if recursive:
+            for dirpath, dirnames, _ in os.walk(directory):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "thumbnails"]
+                paths.extend(self.collect_directory(dirpath))
+        else:
+            paths = self.collect_directory(directory)
+        return self.generate_many(paths, callback=callback, force=force)
+
+    def shutdown(self, wait=True):
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+def main(argv=None):
+    """Headless entry point, e.g. for a deadline post task or a nightly job."""
+    parser = argparse.ArgumentParser(description="Generate Orion thumbnails.")
+    parser.add_argument("paths", nargs="+", help="Files or folders to thumbnail")
+    parser.add_argument("--recursive", action="store_true", help="Walk into sub folders")
+    parser.add_argument("--workers", type=int, default=None, help="Number of ffmpeg processes at once")
+    parser.add_argument("--cache", default=None, help="Cache folder (defaults to the project cache)")
+    parser.add_argument("--ffmpeg", default=None, help="Path to ffmpeg")
+    parser.add_argument("--root", default=os.environ.get("ORI_ROOT_PATH"), help="Project root")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if cached")
+    args = parser.parse_args(argv)
+
+    service = ThumbnailService(root_dir=args.root, cache_root=args.cache, ffmpeg_path=args.ffmpeg, max_workers=args.workers)
+
+    def report(p, thumb):
+        print(f"{'OK ' if thumb else 'ERR'} {p}")
+
+    made = 0
+    failed = 0
+    for path in args.paths:
+        if os.path.isdir(path):
+            results = service.generate_for_directory(path, recursive=args.recursive, callback=report, force=args.force)
+        else:
+            results = service.generate_many([path], callback=report, force=args.force)
+        made += sum(1 for t in results.values() if t)
+        failed += sum(1 for t in results.values() if not t)
+
+    service.shutdown()
+    print(f"Thumbnails done: {made} ok, {failed} failed. Cache: {service.cache.root}")
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+import os
+import glob
+import shutil
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+#big buffers are much faster than shutil's default on the share (override with ORI_COPY_BUFFER_MB)
+COPY_BUFFER = int(os.environ.get("ORI_COPY_BUFFER_MB", "16")) * 1024 * 1024
+
+#how many files are copied at once
+TRANSFER_WORKERS = int(os.environ.get("ORI_TRANSFER_WORKERS", "4"))
+
+#"size" is a cheap check after every copy, "hash" re-reads the copy and compares sha1s
+VERIFY_MODES = ("none", "size", "hash")
+
+class TransferCancelled(Exception):
+    pass
+
+class TransferJob:
+    """
+    One queued copy or move (or a whole folder for copy_tree).
+    done/size are updated while it runs so the UI can poll or be told about progress.
+    """
+
+    def __init__(self, src, dst, mode="copy"):
+        self.src = src
+        self.dst = dst
+        self.mode = mode
+        self.size = 0
+        self.done = 0
+        self.files = 0
+        self.state = "queued"
+        self.error = None
+        self.result = None
+        self.started = None
+        self.finished = None
+        self.future = Future()
+        self._cancel = threading.Event()
+
+    def __repr__(self):
+        return f"<TransferJob {self.mode} {self.src} -> {self.dst} {self.state}>"
+
+    @property
+    def name(self):
+        return os.path.basename(os.path.normpath(self.src))
+
+    @property
+    def fraction(self):
+        if not self.size:
+            return 1.0 if self.state == "done" else 0.0
+        return min(1.0, self.done / self.size)
+
+    @property
+    def ok(self):
+        return self.state == "done"
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def speed(self):
+        """Bytes per second so far."""
+        if not self.started:
+            return 0.0
+        elapsed = (self.finished or time.time()) - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+def hash_file(path, buffer_size=COPY_BUFFER):
+    sha = hashlib.sha1()
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            sha.update(view[:n])
+    return sha.hexdigest()
+
+def _kernel_copy(src_f, dst_f, size, on_chunk, cancelled):
+    """
+    Lets the OS copy without going through python buffers (linux copy_file_range / sendfile).
+    Returns False if neither is available here so the caller falls back to read/write.
+    """
+    funcs = []
+    if hasattr(os, "copy_file_range"):
+        funcs.append(lambda i, o, n, off: os.copy_file_range(i, o, n, off, off))
+    if hasattr(os, "sendfile"):
+        funcs.append(lambda i, o, n, off: os.sendfile(o, i, off, n))
+
+    in_fd = src_f.fileno()
+    out_fd = dst_f.fileno()
+    for func in funcs:
+        offset = 0
+        try:
+            while offset < size:
+                if cancelled():
+                    raise TransferCancelled()
+                sent = func(in_fd, out_fd, min(COPY_BUFFER, size - offset), offset)
+                if not sent:
+                    break
+                offset += sent
+                on_chunk(sent)
+        except OSError:
+            #not supported for this pair of files (different filesystems, smb...)
+            if offset:
+                on_chunk(-offset)
+            continue
+        if offset == size:
+            return True
+        on_chunk(-offset)
+    return False
+
+def copy_file(src, dst, verify="size", on_chunk=None, cancelled=None, buffer_size=COPY_BUFFER):
+    """
+    Copies src to dst through a temp file next to dst, so a failed or
+    cancelled copy never leaves a half written file under the real name.
+    on_chunk(bytes) is called as data is written. Returns the number of bytes copied.
+    """
+    on_chunk = on_chunk or (lambda n: None)
+    cancelled = cancelled or (lambda: False)
+
+    size = os.path.getsize(src)
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    temp_path = f"{dst}.{os.getpid()}_{threading.get_ident()}.part"
+
+    src_hash = None
+    try:
+        with open(src, "rb") as src_f, open(temp_path, "wb") as dst_f:
+            #hashing needs to see the data, so only the buffered copy can do it
+            if verify == "hash" or not _kernel_copy(src_f, dst_f, size, on_chunk, cancelled):
+                sha = hashlib.sha1() if verify == "hash" else None
+                buf = bytearray(buffer_size)
+                view = memoryview(buf)
+                src_f.seek(0)
+                dst_f.seek(0)
+                dst_f.truncate()
+                while True:
+                    if cancelled():
+                        raise TransferCancelled()
+                    n = src_f.readinto(buf)
+                    if not n:
+                        break
+                    dst_f.write(view[:n])
+                    if sha:
+                        sha.update(view[:n])
+                    on_chunk(n)
+                src_hash = sha.hexdigest() if sha else None
+
+        shutil.copystat(src, temp_path)
+
+        if verify in ("size", "hash") and os.path.getsize(temp_path) != size:
+            raise IOError(f"Size mismatch after copying {src}")
+        if verify == "hash" and hash_file(temp_path, buffer_size) != src_hash:
+            raise IOError(f"Checksum mismatch after copying {src}")
+
+        os.replace(temp_path, dst)
+    except BaseException:
+        try: os.remove(temp_path)
+        except OSError: pass
+        raise
+    return size
+
+def move_file(src, dst, verify="size", on_chunk=None, cancelled=None):
+    """Renames when src and dst are on the same drive, otherwise copies then deletes src."""
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    try:
+        os.rename(src, dst)
+        if on_chunk:
+            on_chunk(os.path.getsize(dst))
+        return
+    except OSError:
+        if os.path.exists(dst):
+            raise
+    copy_file(src, dst, verify=verify, on_chunk=on_chunk, cancelled=cancelled)
+    os.remove(src)
+
+def swap_in(staging_dir, dst_dir):
+    """
+    Replaces dst_dir with a finished staging folder, then clears the old one out of the way.
+    If the new folder can't be moved in (e.g. windows and a reader holding a handle),
+    the old one is put back before the error is raised.
+    """
+    base = os.path.normpath(dst_dir)
+    #old folders a previous swap couldn't delete (files were still open then)
+    for leftover in glob.glob(glob.escape(base) + ".*.old"):
+        shutil.rmtree(leftover, ignore_errors=True)
+
+    old = None
+    if os.path.exists(dst_dir):
+        old = f"{base}.{os.getpid()}_{threading.get_ident()}.old"
+        os.rename(dst_dir, old)
+    try:
+        os.rename(staging_dir, dst_dir)
+    except OSError:
+        if old:
+            try:
+                os.rename(old, dst_dir)
+            except OSError as e:
+                print(f"Could not put {dst_dir} back, the previous version is in {old}: {e}")
+        raise
+    if old:
+        shutil.rmtree(old, ignore_errors=True)
+
+def list_tree(src_dir):
+    """(relative path, size) for every file below src_dir."""
+    found = []
+    for root, dirs, files in os.walk(src_dir):
+        for f in files:
+            path = os.path.join(root, f)
+            try:
+                found.append((os.path.relpath(path, src_dir), os.path.getsize(path)))
+            except OSError:
+                continue
+    return found
+
+class TransferManager:
+    """
+    Queue of file copies/moves run on a small thread pool, so several files
+    (or all the files of a folder) go over the network at the same time and
+    the caller never waits on them.
+
+    callback(job) and progress(job) are called on worker threads, UI code
+    has to hand them back to its own thread (e.g. with a queued signal).
+    """
+
+    def __init__(self, max_workers=TRANSFER_WORKERS, verify="size"):
+        if verify not in VERIFY_MODES:
+            raise ValueError(f"verify must be one of {VERIFY_MODES}")
+        self.max_workers = max_workers
+        self.verify = verify
+        self.jobs = []
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="orion_transfer")
+            return self._executor
+
+    #   QUEUE
+
+    def submit(self, src, dst, mode="copy", callback=None, progress=None):
+        """Queues one file. mode is 'copy' or 'move'. Returns the TransferJob."""
+        job = TransferJob(src, dst, mode)
+        try:
+            job.size = os.path.getsize(src)
+        except OSError:
+            pass
+        job.files = 1
+        self._track(job)
+
+        def work():
+            func = move_file if mode == "move" else copy_file
+            func(src, dst, verify=self.verify, on_chunk=self._chunk_counter(job, progress), cancelled=job.cancelled)
+            return dst
+
+        self.get_executor().submit(self._run, job, work, callback, progress)
+        return job
+
+    def submit_call(self, src, dst, func, mode="call", callback=None):
+        """
+        Queues func() as a job, for share work that isn't a plain copy (e.g. a
+        hardlink publish) but still shouldn't block the caller. job.result is
+        what func returns, job.error what it raised.
+        """
+        job = TransferJob(src, dst, mode)
+        self._track(job)
+        self.get_executor().submit(self._run, job, func, callback, None)
+        return job
+
+    def copy_tree(self, src_dir, dst_dir, replace=False, callback=None, progress=None, prepare=None):
+        """
+        Copies every file of src_dir into dst_dir, files in parallel.
+        With replace the copy goes into a staging folder first and is swapped in
+        at the end, so dst_dir is never half old and half new. prepare(staging_dir)
+        can add files (e.g. a manifest) before the swap.
+        Returns one TransferJob covering the whole folder.
+        """
+        job = TransferJob(src_dir, dst_dir, "tree")
+        self._track(job)
+        #the folder job waits on its file jobs, so it can't take a pool thread itself
+        threading.Thread(target=self._run, args=(job, lambda: self._copy_tree(job, replace, progress, prepare), callback, progress),
+                         name="orion_transfer_tree", daemon=True).start()
+        return job
+
+    def _copy_tree(self, job, replace, progress, prepare=None):
+        files = list_tree(job.src)
+        job.files = len(files)
+        job.size = sum(size for _, size in files)
+
+        target = f"{os.path.normpath(job.dst)}.{os.getpid()}_{threading.get_ident()}.staging" if replace else job.dst
+        os.makedirs(target, exist_ok=True)
+        on_chunk = self._chunk_counter(job, progress)
+
+        executor = self.get_executor()
+        futures = [executor.submit(copy_file, os.path.join(job.src, rel), os.path.join(target, rel), self.verify, on_chunk, job.cancelled)
+                   for rel, _ in files]
+        errors = []
+        for future in futures:
+            try:
+                future.result()
+            except TransferCancelled:
+                pass
+            except Exception as e:
+                errors.append(e)
+                job.cancel()
+
+        if job.cancelled() or errors:
+            if replace:
+                shutil.rmtree(target, ignore_errors=True)
+            if errors:
+                raise errors[0]
+            raise TransferCancelled()
+
+        if prepare:
+            prepare(target)
+        if replace:
+            swap_in(target, job.dst)
+        return job.dst
+
+    def _track(self, job):
+        with self._lock:
+            #forget finished jobs so a long session doesn't grow forever
+            self.jobs = [j for j in self.jobs if j.state in ("queued", "running")]
+            self.jobs.append(job)
+
+    def _chunk_counter(self, job, progress):
+        lock = threading.Lock()
+        def on_chunk(n):
+            with lock:
+                job.done += n
+            if progress:
+                progress(job)
+        return on_chunk
+
+    def _run(self, job, work, callback, progress):
+        job.state = "running"
+        job.started = time.time()
+        try:
+            if job.cancelled():
+                raise TransferCancelled()
+            job.result = work()
+            job.state = "done"
+        except TransferCancelled:
+            job.state = "cancelled"
+        except Exception as e:
+            job.state = "failed"
+            job.error = e
+            print(f"Transfer failed {job.src} -> {job.dst}: {e}")
+        job.finished = time.time()
+        job.future.set_result(job)
+        if callback:
+            try:
+                callback(job)
+            except Exception as e:
+                print(f"Transfer callback failed for {job.src}: {e}")
+
+    #   INFO
+
+    def active(self):
+        with self._lock:
+            return [j for j in self.jobs if j.state in ("queued", "running")]
+
+    def wait(self, jobs=None, timeout=None):
+        """Blocks until jobs (default: everything queued) are finished. For scripts, not UIs."""
+        for job in (jobs or list(self.jobs)):
+            job.future.result(timeout=timeout)
+
+    def cancel_all(self):
+        for job in self.active():
+            job.cancel()
+
+    def shutdown(self, wait=True):
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
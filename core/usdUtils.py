@@ -0,0 +1,100 @@
+import time
+
+from pxr import Sdf
+
+def plan_namespace_strip(layer, namespace_prefix):
+    """
+    Walks every prim spec of layer (iteratively, so deep hierarchies can't hit
+    the recursion limit) and works out which ones lose namespace_prefix.
+    A prim keeps its namespace if stripping it would clash with a sibling or
+    leave an invalid name (e.g. starting with a digit);
+    the first of several prims stripping to the same name wins.
+    Returns (renames, skipped, prim count): renames is a list of
+    (path, new name) ordered deepest first so every path is still valid
+    when its rename runs, skipped a list of paths left alone.
+    """
+    renames = []
+    skipped = []
+    count = 0
+    stack = [layer.pseudoRoot]
+    while stack:
+        parent = stack.pop()
+        children = list(parent.nameChildren)
+        count += len(children)
+        stack.extend(children)
+
+        names = [c.name for c in children]
+        planned = {}
+        for name in names:
+            if name.startswith(namespace_prefix):
+                new_name = name[len(namespace_prefix):]
+                if Sdf.Path.IsValidIdentifier(new_name):
+                    planned[name] = new_name
+                else:
+                    skipped.append(parent.path.AppendChild(name))
+
+        #stripping one prim can clash with a kept sibling, or with another stripped one.
+        #dropping a rename brings its old name back, so go again until nothing clashes
+        while True:
+            holders = {}
+            for name in names:
+                holders.setdefault(planned.get(name, name), []).append(name)
+            clashes = [h for h in holders.values() if len(h) > 1]
+            if not clashes:
+                break
+            for holder in clashes:
+                keep_first = all(n in planned for n in holder)
+                for name in holder[1:] if keep_first else holder:
+                    if name in planned:
+                        del planned[name]
+                        skipped.append(parent.path.AppendChild(name))
+
+        for name, new_name in planned.items():
+            renames.append((parent.path.AppendChild(name), new_name))
+
+    renames.sort(key=lambda r: r[0].pathElementCount, reverse=True)
+    return renames, skipped, count
+
+def apply_renames(layer, renames):
+    """
+    Applies planned renames under one change block, so the layer sends a single
+    change notice instead of one per prim. (An Sdf.BatchNamespaceEdit does the same
+    job but validates every edit against all the others, which gets very slow on
+    tens of thousands of prims.) Returns the paths that could not be renamed.
+    """
+    failed = []
+    with Sdf.ChangeBlock():
+        for path, new_name in renames:
+            spec = layer.GetPrimAtPath(path)
+            try:
+                spec.name = new_name
+            except Exception:
+                failed.append(path)
+    return failed
+
+def strip_namespaces(layer, namespace_prefix):
+    """
+    Removes namespace_prefix from every prim name in layer (and the defaultPrim).
+    Does not save. Returns a report dict with prims, renamed, skipped (paths)
+    and plan/apply seconds.
+    """
+    report = {"prims": 0, "renamed": 0, "skipped": [], "plan_seconds": 0.0, "apply_seconds": 0.0}
+    if not namespace_prefix:
+        return report
+
+    start = time.perf_counter()
+    renames, skipped, count = plan_namespace_strip(layer, namespace_prefix)
+    report["plan_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    failed = apply_renames(layer, renames)
+    #fix the defaultPrim metadata at the top of the file
+    default_prim = layer.defaultPrim
+    #(only if that prim really was renamed, a skipped one may share its stripped name with a sibling)
+    if default_prim and default_prim.startswith(namespace_prefix) and not layer.GetPrimAtPath("/" + default_prim) \
+            and layer.GetPrimAtPath("/" + default_prim[len(namespace_prefix):]):
+        layer.defaultPrim = default_prim[len(namespace_prefix):]
+    report["apply_seconds"] = time.perf_counter() - start
+
+    report.update({"prims": count, "renamed": len(renames) - len(failed), "skipped": [str(p) for p in skipped + failed]})
+    return report
@@ -19,6 +19,7 @@ if pipeline_path and pipeline_path not in sys.path:
 
 try:
     from core.orionUtils import OrionUtils
+    from core.sequenceUtils import find_sequence
 except ImportError:
     hou.ui.displayMessage("Could not import OrionUtils. Check sys.path.")
 
@@ -444,25 +445,13 @@ class OrionHoudiniUI(QtWidgets.QWidget):
             hou.ui.displayMessage("Plate folder not found.")
             return
 
-        found_seq = None
-        for item in os.listdir(plate_root):
-
-            if item.lower().endswith((".exr", ".jpg", ".png", ".tif", ".tiff")):
-                found_seq = os.path.join(plate_root, item)
-                break
+        found_seq = find_sequence(plate_root)
         
         if found_seq:
             stage = self.get_stage()
             lop = stage.createNode("backgroundplate", node_name=f"plate_{shot_code}")
             
-            import re
-            match = re.search(r"(\d+)(\.[a-zA-Z]+)$", found_seq)
-            if match:
-                padding = len(match.group(1))
-                path_stub = found_seq[:match.start(1)] + f"$F{padding}" + match.group(2)
-                final_path = path_stub
-            else:
-                final_path = found_seq
+            final_path = found_seq.pattern("houdini").replace("\\", "/")
             
             #PARAMETER 
             parm = lop.parm("plate")
@@ -1,10 +1,14 @@
 import os
-import subprocess
 import sys
 from pathlib import Path
 import argparse
 
-def launch_houdini(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None):
+def launch_houdini(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None, orion=None, click_time=None):
+    """
+    Builds the Houdini environment and starts it.
+    Pass an existing OrionUtils as orion to launch warm from a running launcher
+    (skips re-reading .env and the schema check). Returns the Popen object or None.
+    """
     
     user = os.getlogin()
     
@@ -17,6 +21,7 @@ def launch_houdini(file_path=None, shot_code=None, frame_start=None, frame_end=N
 
     try:
         from core.orionUtils import OrionUtils
+        from core.launchUtils import spawn_dcc
     except ImportError as e:
         print(f"CRITICAL ERROR: Could not import OrionUtils. Checked path: {pipeline_root}")
         print(f"Error details: {e}")
@@ -29,7 +34,9 @@ def launch_houdini(file_path=None, shot_code=None, frame_start=None, frame_end=N
         print(f"Error details: {e}")
         return
     
-    orion = OrionUtils()
+    warm = orion is not None
+    if not warm:
+        orion = OrionUtils()
 
     ORI_PROJECT_PATH = orion.get_root_dir()
     print(f"Pipeline Root Detected: {ORI_PROJECT_PATH}")
@@ -70,10 +77,7 @@ def launch_houdini(file_path=None, shot_code=None, frame_start=None, frame_end=N
     if file_path:
         cmd.append(file_path) # Add file to launch args
 
-    try:
-        subprocess.Popen(cmd, env=env)
-    except FileNotFoundError:
-        print("Error: Houdini executable not found.")
+    return spawn_dcc(cmd, env, "Houdini", click_time=click_time, mode="in-process" if warm else "subprocess")
 
 if __name__ == "__main__":
     # ARGUMENT PARSER
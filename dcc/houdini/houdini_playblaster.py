@@ -4,7 +4,6 @@ import glob
 import subprocess
 import json
 import re
-import math
 import tempfile
 import shutil
 from datetime import datetime
@@ -33,6 +32,12 @@ except ImportError:
         print("OrionUtils not found. Discord notifications will be disabled.")
         OrionUtils = None
 
+try:
+    from core.mosaicUtils import compute_mosaic_layout, get_compare_cache, get_comparison_key
+except ImportError:
+    print("mosaicUtils not found. Comparisons will be disabled.")
+    compute_mosaic_layout = None
+
 class OrionHouPlayblaster(QtWidgets.QWidget):
     
     #your original json path
@@ -588,6 +593,9 @@ class OrionHouPlayblaster(QtWidgets.QWidget):
         if len(selection) < 2:
             self.set_status("Select at least 2 videos to compare.")
             return
+        if compute_mosaic_layout is None:
+            self.set_status("Comparison tools not found on the pipeline path.")
+            return
 
         paths = sorted([self.existing_videos[item.text()] for item in selection])
         num_inputs = len(paths)
@@ -596,18 +604,33 @@ class OrionHouPlayblaster(QtWidgets.QWidget):
         if not os.path.exists(output_dir): os.makedirs(output_dir)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(output_dir, f"{self.shot_context}_comparison_{timestamp}.mp4").replace("\\", "/")
 
-        #grid calc
-        grid_div_width = math.ceil(math.sqrt(num_inputs))
-        grid_div_height = (num_inputs // grid_div_width) + min(math.ceil(num_inputs % grid_div_width), 1)
+        #grid calc (even dimensions for the x264 codec)
+        layout = compute_mosaic_layout(num_inputs)
+        max_width = layout["tile_width"]
+        max_height = layout["tile_height"]
 
-        #force even dimensions for the x264 codec
-        max_width = int(math.trunc(1920 / grid_div_width))
-        if max_width % 2 != 0: max_width -= 1
-        
-        max_height = int(math.trunc(1080 / grid_div_height))
-        if max_height % 2 != 0: max_height -= 1
+        font_path = "C\\:/Windows/Fonts/arial.ttf" 
+        encode_args = "-c:v libx264 -crf 18"
+
+        #cached by inputs + layout, so re-reviewing the same versions skips ffmpeg
+        cache = get_compare_cache()
+        cache_key = get_comparison_key(paths, layout, {"fontsize": 24, "encode": encode_args, "pad": True})
+        cached_path = cache.get(cache_key)
+        if cache_key:
+            output_path = os.path.join(output_dir, f"{self.shot_context}_comparison_{cache_key[:10]}.mp4").replace("\\", "/")
+        else:
+            output_path = os.path.join(output_dir, f"{self.shot_context}_comparison_{timestamp}.mp4").replace("\\", "/")
+
+        if cached_path:
+            self.set_status("Opening cached comparison...")
+            if not os.path.exists(output_path):
+                try: shutil.copy2(cached_path, output_path)
+                except Exception as e: print(f"Could not copy cached comparison to {output_path}: {e}")
+            self.finish_comparison(cached_path, output_path, timestamp)
+            return
+
+        render_path = cache.temp_path_for(cache_key).replace("\\", "/") if cache_key else output_path
 
         inputs_expression = [f'-i "{p}"' for p in paths]
         inputs_string = ' '.join(inputs_expression)
@@ -619,7 +642,6 @@ class OrionHouPlayblaster(QtWidgets.QWidget):
             basename = os.path.basename(path)
             #escape for ffmpeg drawtext
             safe_text = basename.replace("'", "").replace(":", "\\:")
-            font_path = "C\\:/Windows/Fonts/arial.ttf" 
             
             #scale, pad to uniform size, set standard pixel format, and draw text
             cur_index_string = (
@@ -636,20 +658,11 @@ class OrionHouPlayblaster(QtWidgets.QWidget):
         index_string = ' '.join(index_expression)
         index_list_string = ''.join(index_list)
 
-        pos_expression = []
-        for i in range(num_inputs):
-            x_pos = i % grid_div_width
-            y_pos = i // grid_div_width
-
-            x_str = '+'.join([f'w{j}' for j in range(x_pos)]) if x_pos > 0 else '0'
-            y_str = '+'.join([f'h{j}' for j in range(y_pos)]) if y_pos > 0 else '0'
-            pos_expression.append(f'{x_str}_{y_str}')
+        layout_string = layout["layout"]
 
-        layout_string = '|'.join(pos_expression)
-
-        cmd = (f'"{self.ffmpeg_path}" {inputs_string} -filter_complex '
+        cmd = (f'"{self.ffmpeg_path}" -y {inputs_string} -filter_complex '
                f'"{index_string} {index_list_string}xstack=inputs={num_inputs}:layout={layout_string}:fill=black[out]" '
-               f'-map "[out]" -c:v libx264 -crf 18 "{output_path}"')
+               f'-map "[out]" {encode_args} "{render_path}"')
 
         self.set_status("Generating Mosaic Comparison...")
         
@@ -661,20 +674,29 @@ class OrionHouPlayblaster(QtWidgets.QWidget):
         #capture output to see errors
         result = subprocess.run(cmd, shell=True, startupinfo=startupinfo, capture_output=True, text=True)
         
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-            os.startfile(output_path)
-            
-            #trigger the discord upload if the checkbox is ticked
-            if self.chk_publish_comp.isChecked():
-                self.handle_upload_logic(output_path, task="COMPARISON", ver=timestamp)
-            else:
-                self.set_status("Comparison complete.")
+        if os.path.exists(render_path) and os.path.getsize(render_path) > 0:
+            open_path = render_path
+            if cache_key:
+                open_path = cache.commit(cache_key, render_path)
+                try: shutil.copy2(open_path, output_path)
+                except Exception as e: print(f"Could not copy comparison to {output_path}: {e}")
+            self.finish_comparison(open_path, output_path, timestamp)
         else:
             self.set_status("Error generating comparison. Check console.")
             print("FFMPEG COMPARISON ERROR")
             print("Command Executed:", cmd)
             print("FFMPEG Output:", result.stderr)
 
+    def finish_comparison(self, open_path, output_path, timestamp):
+        os.startfile(open_path)
+        
+        #trigger the discord upload if the checkbox is ticked
+        if self.chk_publish_comp.isChecked():
+            upload_path = output_path if os.path.exists(output_path) else open_path
+            self.handle_upload_logic(upload_path, task="COMPARISON", ver=timestamp)
+        else:
+            self.set_status("Comparison complete.")
+
 
 def show_ui():
     global orion_hou_pb_win
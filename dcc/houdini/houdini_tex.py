@@ -1,6 +1,18 @@
 import hou
 import os
-import re
+import sys
+
+try:
+    from core.textureUtils import find_texture_set
+except ImportError:
+    pipeline_path = os.environ.get("ORI_PIPELINE_PATH")
+    if pipeline_path and pipeline_path not in sys.path:
+        sys.path.append(pipeline_path)
+    from core.textureUtils import find_texture_set
+
+#mtlximage signature for each kind of channel
+SIGNATURES = {'color': "color3", 'float': "float", 'vector': "vector3"}
+MTLX_COLORSPACES = {'sRGB': "srgb_texture", 'linear': "lin_rec709"}
 
 def create_karma_material_from_selection():
     selection = hou.selectedNodes()
@@ -21,11 +33,10 @@ def create_karma_material_from_selection():
     if not texture_path or texture_path == "":
         return
 
-    directory = os.path.dirname(texture_path)
-    try:
-        files = os.listdir(directory)
-    except OSError:
-        hou.ui.displayMessage("Could not read directory.")
+    #one listing, grouped into channels x UDIM tiles, and only the set the picked file is part of
+    tex_set = find_texture_set(texture_path)
+    if not tex_set:
+        hou.ui.displayMessage("Could not find any textures next to the selected file.")
         return
 
     # CORE NODES
@@ -58,112 +69,68 @@ def create_karma_material_from_selection():
             material_out = net.createNode("collect", "Material_Output")
             material_out.setInput(0, shader, 0)
 
-    # KEYWORD MAPPING 
-    texture_map = {
-        'base_color': ['diffuse', 'albedo', 'basecolor', 'diff', 'color', 'base'],
-        'coat': ['clearcoat', 'coat'],
-        'coat_roughness': ['clearcoat_roughness', 'coat_rough', 'gloss', 'clearcoat_gloss'],
-        'transmission': ['transmission', 'trans'],
-        'coat_IOR': ['clearcoat_ior', 'coat_ior', 'ior'],
-        'specular_roughness': ['roughness', 'rough', 'rgh'],
-        'specular': ['specular', 'spec'],
-        'anisotropy': ['ani', 'anisotropy'],
-        'metalness': ['metallic', 'metal', 'mtl'],
-        'emission_color': ['emission', 'emissive', 'emit'],
-        'subsurface_color': ['sss', 'subsurface'],
-        'displacement': ['displacement', 'disp', 'height', 'heightmap', 'bump'],
-        'sheen': ['sheen']
-    }
-
-    assigned_inputs = []
     created_nodes = [] 
-    
-    # UDIM Regex
-    udim_pattern = re.compile(r"[._](1[0-9]{3})[._]")
 
     # ASSIGN TEXTURES
-    for f in files:
-        if f.startswith('.'): continue
-
-        lower_name = f.lower()
-        full_path = os.path.join(directory, f)
+    for target_input, channel in tex_set.channels.items():
         
-        # UDIM Replacement
-        match = udim_pattern.search(f)
-        if match:
-            udim_num = match.group(1)
-            full_path = full_path.replace(udim_num, "<UDIM>")
-
-        # get input
-        target_input = None
-        for input_name, keywords in texture_map.items():
-            if any(k in lower_name for k in keywords):
-                target_input = input_name
-                break
+        # img node
+        img = net.createNode("mtlximage", f"tex_{target_input}")
+        img.parm("file").set(channel.path)
+        # colour maps get their colour space, data maps stay raw
+        if MTLX_COLORSPACES.get(channel.colorspace):
+            try:
+                img.parm("filecolorspace").set(MTLX_COLORSPACES[channel.colorspace])
+            except:
+                pass
+        created_nodes.append(img)
         
-        if target_input and target_input not in assigned_inputs:
+        #WIRING 
+        
+        # Displacement
+        if target_input == 'displacement':
+            img.parm("signature").set(SIGNATURES[channel.data_type])
             
-            # img node
-            img = net.createNode("mtlximage", f"tex_{target_input}")
-            img.parm("file").set(full_path)
-            created_nodes.append(img)
+            # check 4 existing disp
+            disp = net.node("mtlxdisplacement")
+            if not disp:
+                disp = net.createNode("mtlxdisplacement", "displacement_setup")
             
-            #WIRING 
+            disp.setInput(0, img, 0)
+            disp.parm("scale").set(0.01)
             
-            # Displacement
-            if target_input == 'displacement':
-                img.parm("signature").set("float")
-                
-                # check 4 existing disp
-                disp = net.node("mtlxdisplacement")
-                if not disp:
-                    disp = net.createNode("mtlxdisplacement", "displacement_setup")
-                
-                disp.setInput(0, img, 0)
-                disp.parm("scale").set(0.01)
-                
-                # wire 2 collector
-                if material_out.type().name() == "Material_Outputs_and_AOVs":
-                    material_out.setInput(1, disp, 0)
-                elif material_out.type().name() == "usdmaterial":
-                     material_out.setInput(1, disp, 0)
-                
-                created_nodes.append(disp)
-
-            # Normal
-            elif target_input == 'normal':
-                img.parm("signature").set("vector3")
-                
-                nrm = net.createNode("mtlxnormalmap", "normal_map_setup")
-                nrm.setInput(0, img, 0)
-                
-                # wire to shader 
-                try:
-                    idx = shader.inputIndex(target_input)
-                    if idx == -1: idx = 40 
-                    shader.setInput(idx, nrm, 0)
-                except:
-                    pass
-                
-                created_nodes.append(nrm)
-
-            # Roughness / Metalness
-            elif target_input in ['specular',  'metalness', 'specular_roughness']:
-                img.parm("signature").set("float")
-                try:
-                    shader.setInput(shader.inputIndex(target_input), img, 0)
-                except:
-                    pass
+            # wire 2 collector
+            if material_out.type().name() == "Material_Outputs_and_AOVs":
+                material_out.setInput(1, disp, 0)
+            elif material_out.type().name() == "usdmaterial":
+                 material_out.setInput(1, disp, 0)
+            
+            created_nodes.append(disp)
 
-            # Color / Emission
-            else:
-                img.parm("signature").set("color3")
-                try:
-                    shader.setInput(shader.inputIndex(target_input), img, 0)
-                except:
-                    pass
+        # Normal
+        elif target_input == 'normal':
+            img.parm("signature").set(SIGNATURES[channel.data_type])
+            
+            nrm = net.createNode("mtlxnormalmap", "normal_map_setup")
+            nrm.setInput(0, img, 0)
+            
+            # wire to shader 
+            try:
+                idx = shader.inputIndex(target_input)
+                if idx == -1: idx = 40 
+                shader.setInput(idx, nrm, 0)
+            except:
+                pass
             
-            assigned_inputs.append(target_input)
+            created_nodes.append(nrm)
+
+        # Color / Emission / Roughness / Metalness...
+        else:
+            img.parm("signature").set(SIGNATURES[channel.data_type])
+            try:
+                shader.setInput(shader.inputIndex(target_input), img, 0)
+            except:
+                pass
 
     net.layoutChildren(created_nodes)
     print("Texture setup complete on selected node.")
@@ -1,24 +1,34 @@
 import mari
 import os
-import shutil
 import sys
 import re
 from PySide2 import QtWidgets, QtCore, QtGui
 
 try:
     from core.orionUtils import OrionUtils
+    from core.transferUtils import TransferManager
+    from core.publishUtils import publish_folder, write_folder_manifest, LinkUnavailable
 except ImportError:
     current_dir = os.path.dirname(__file__)
     pipeline_root = os.path.abspath(os.path.join(current_dir, "..", ".."))
     if pipeline_root not in sys.path:
         sys.path.append(pipeline_root)
     from core.orionUtils import OrionUtils
+    from core.transferUtils import TransferManager
+    from core.publishUtils import publish_folder, write_folder_manifest, LinkUnavailable
 
 class MariExporter(QtWidgets.QDialog):
     def __init__(self):
         super(MariExporter, self).__init__()
         
         self.orion = OrionUtils()
+
+        #publishes copy the UDIMs in the background, the timer reports progress
+        self.transfers = TransferManager()
+        self.publish_job = None
+        self.publish_timer = QtCore.QTimer(self)
+        self.publish_timer.setInterval(200)
+        self.publish_timer.timeout.connect(self.check_publish)
         
         self.setWindowTitle("Orion Mari Exporter")
         self.resize(350, 450)
@@ -322,18 +332,59 @@ class MariExporter(QtWidgets.QDialog):
             self.info_label.setText(f"Err: {ver_to_pub} missing")
             return
 
+        if self.publish_job:
+            self.info_label.setText("Publish already running")
+            return
+
+        #hardlink the UDIMs into PUBLISHED, no data copied and swapped in with one rename.
+        #still one share round trip per file, so it runs in the background too
+        self.publish_job = self.transfers.submit_call(src_dir, dst_dir, lambda: publish_folder(src_dir, dst_dir), mode="link")
+        self.publish_btn.setEnabled(False)
         self.info_label.setText(f"Publishing {ver_to_pub}...")
-        mari.app.processEvents()
+        self.publish_timer.start()
 
-        try:
-            if os.path.exists(dst_dir):
-                shutil.rmtree(dst_dir)
-            shutil.copytree(src_dir, dst_dir)
-            
-            self.info_label.setText(f"Published: {ver_to_pub}")
-            print(f"[Orion] Published: {src_dir} -> {dst_dir}")
-        except Exception as e:
-            self.info_label.setText(f"Fail: {str(e)}")
+    def copy_publish(self, src_dir, dst_dir):
+        #copied into a staging folder and swapped in when every file made it,
+        #so PUBLISHED is never left half old and half new
+        self.publish_job = self.transfers.copy_tree(src_dir, dst_dir, replace=True,
+                                                    prepare=lambda staging: write_folder_manifest(src_dir, staging, "copy"))
+        self.publish_timer.start()
+
+    def check_publish(self):
+        job = self.publish_job
+        if job is None:
+            self.publish_timer.stop()
+            return
+
+        ver = os.path.basename(job.src)
+        if job.state in ("queued", "running"):
+            if job.mode == "link":
+                self.info_label.setText(f"Publishing {ver}...")
+            else:
+                self.info_label.setText(f"Publishing {ver}... {job.fraction:.0%}")
+            return
+
+        self.publish_timer.stop()
+        self.publish_job = None
+        if job.mode == "link" and isinstance(job.error, LinkUnavailable):
+            print(f"[Orion] Hardlinks not available ({job.error}), copying instead")
+            self.copy_publish(job.src, job.dst)
+            return
+        self.update_ui_state()
+        if job.ok and job.mode == "link":
+            self.info_label.setText(f"Published: {ver}")
+            print(f"[Orion] Published (linked): {job.src} -> {job.dst}")
+        elif job.ok:
+            self.info_label.setText(f"Published: {ver}")
+            print(f"[Orion] Published: {job.src} -> {job.dst} ({job.files} files)")
+        else:
+            #e.g. someone has a file in PUBLISHED open, reported as is, PUBLISHED is left as it was
+            self.info_label.setText(f"Fail: {job.error or job.state}")
+
+    def closeEvent(self, event):
+        #a running publish keeps going, its staging folder is only swapped in once complete
+        self.publish_timer.stop()
+        super(MariExporter, self).closeEvent(event)
 
 def show_ui():
     global exporter_win
@@ -1,10 +1,14 @@
 import os
-import subprocess
 import sys
 from pathlib import Path
 import argparse
 
-def launch_mari(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None):
+def launch_mari(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None, orion=None, click_time=None):
+    """
+    Builds the Mari environment and starts it.
+    Pass an existing OrionUtils as orion to launch warm from a running launcher
+    (skips re-reading .env and the schema check). Returns the Popen object or None.
+    """
     
     user = os.getlogin()
     
@@ -17,6 +21,7 @@ def launch_mari(file_path=None, shot_code=None, frame_start=None, frame_end=None
 
     try:
         from core.orionUtils import OrionUtils
+        from core.launchUtils import spawn_dcc
     except ImportError as e:
         print(f"CRITICAL ERROR: Could not import OrionUtils. Checked path: {pipeline_root}")
         print(f"Error details: {e}")
@@ -29,7 +34,9 @@ def launch_mari(file_path=None, shot_code=None, frame_start=None, frame_end=None
         print(f"Error details: {e}")
         return
     
-    orion = OrionUtils()
+    warm = orion is not None
+    if not warm:
+        orion = OrionUtils()
 
     ORI_PROJECT_PATH = orion.get_root_dir()
     print(f"Pipeline Root Detected: {ORI_PROJECT_PATH}")
@@ -65,10 +72,7 @@ def launch_mari(file_path=None, shot_code=None, frame_start=None, frame_end=None
     if file_path:
         cmd.append(file_path)
 
-    try:
-        subprocess.Popen(cmd, env=env)
-    except FileNotFoundError:
-        print("Error: Mari executable not found.")
+    return spawn_dcc(cmd, env, "Mari", click_time=click_time, mode="in-process" if warm else "subprocess")
 
 if __name__ == "__main__":
     #ARGUMENT PARSER
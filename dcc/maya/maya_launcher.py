@@ -1,10 +1,14 @@
 import os
-import subprocess
 import sys
 from pathlib import Path
 import argparse
 
-def launch_maya(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None):
+def launch_maya(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None, orion=None, click_time=None):
+    """
+    Builds the Maya environment and starts it.
+    Pass an existing OrionUtils as orion to launch warm from a running launcher
+    (skips re-reading .env and the schema check). Returns the Popen object or None.
+    """
     
     user = os.getlogin()
     
@@ -17,6 +21,7 @@ def launch_maya(file_path=None, shot_code=None, frame_start=None, frame_end=None
 
     try:
         from core.orionUtils import OrionUtils
+        from core.launchUtils import spawn_dcc, walk_dirs, LaunchManifest
     except ImportError as e:
         print(f"CRITICAL ERROR: Could not import OrionUtils. Checked path: {pipeline_root}")
         print(f"Error details: {e}")
@@ -29,7 +34,9 @@ def launch_maya(file_path=None, shot_code=None, frame_start=None, frame_end=None
         print(f"Error details: {e}")
         return
     
-    orion = OrionUtils()
+    warm = orion is not None
+    if not warm:
+        orion = OrionUtils()
 
     ORI_PROJECT_PATH = orion.get_root_dir()
     print(f"Pipeline Root Detected: {ORI_PROJECT_PATH}")
@@ -68,18 +75,19 @@ def launch_maya(file_path=None, shot_code=None, frame_start=None, frame_end=None
     env["MAYA_MODULE_PATH"] = os.path.join(ROOT_PATH, "modules") + os.pathsep + env.get("MAYA_SCRIPT_PATH", "")
     env["MAYA_PLUG_IN_PATH"] = os.path.join(ROOT_PATH, "plug-ins") + os.pathsep + env.get("MAYA_PLUG_IN_PATH", "")
     
-    base_scripts_path = os.path.join(ROOT_PATH, "scripts")
-    all_script_paths = [base_scripts_path]
-    for root, dirs, files in os.walk(base_scripts_path):
-        for d in dirs:
-            #ignore cache and hidden folders
-            if d.startswith(".") or d == "__pycache__":
-                continue
-            #add path to subfolder to list
-            all_script_paths.append(os.path.join(root, d))
-    
-    #join all into string, seperated
-    new_script_paths = os.pathsep.join(all_script_paths)
+    #script folders are cached locally and only walked again when they change
+    manifest = LaunchManifest("maya")
+    env_key = f"env:{ROOT_PATH}"
+    new_script_paths = manifest.get_env(env_key)
+    if new_script_paths is None:
+        base_scripts_path = os.path.join(ROOT_PATH, "scripts")
+        #scripts folder + every subfolder (skips cache and hidden folders)
+        all_script_paths = walk_dirs(base_scripts_path)
+        
+        #join all into string, seperated
+        new_script_paths = os.pathsep.join(all_script_paths)
+        manifest.set_env(env_key, new_script_paths, all_script_paths)
+        manifest.save()
     
     #add to script path
     env["MAYA_SCRIPT_PATH"] = new_script_paths + os.pathsep + env.get("MAYA_SCRIPT_PATH", "")
@@ -108,10 +116,7 @@ def launch_maya(file_path=None, shot_code=None, frame_start=None, frame_end=None
     if file_path:
         cmd.append(file_path) # Add file to launch args
 
-    try:
-        subprocess.Popen(cmd, env=env)
-    except FileNotFoundError:
-        print("Error: Maya executable not found.")
+    return spawn_dcc(cmd, env, "Maya", click_time=click_time, mode="in-process" if warm else "subprocess")
 
 if __name__ == "__main__":
     # ARGUMENT PARSER
@@ -29,6 +29,11 @@ except ImportError:
         print("OrionUtils not found. Discord notifications will be disabled.")
         OrionUtils = None
 
+try:
+    from core.sequenceUtils import find_sequence
+except ImportError:
+    find_sequence = None
+
 class OrionPlayblaster(QtWidgets.QWidget):
 
     WEBHOOK_URL = "https://discord.com/api/webhooks/1430360190037004518/HO2P_UE5CQ3f4PluRjv7W5neC5S08I-bPah8VOP1TgYhdUxisTCzbv337RPgWkO5jAS3"
@@ -312,29 +317,14 @@ class OrionPlayblaster(QtWidgets.QWidget):
             self.lbl_version.setText(ver)
 
     def find_plate_sequence(self):
-        if not self.shot_path: return None
+        if not self.shot_path or not find_sequence: return None
         plate_dir = os.path.join(self.shot_path, "CAMERA", "PLATES")
-        if not os.path.exists(plate_dir): return None
-        
-        extensions = ["exr", "png", "jpg", "jpeg", "tif", "tiff"]
-        found_file = None
-        for item in os.listdir(plate_dir):
-            if item.startswith("."): continue
-            ext = item.split(".")[-1].lower()
-            if ext in extensions:
-                found_file = item
-                break
         
-        if not found_file: return None
-        parts = found_file.split(".")
-        if len(parts) < 3: return None
-
-        base_name = ".".join(parts[:-2])
-        ext = parts[-1]
-        if not parts[-2].isdigit(): return None
-        padding = len(parts[-2])
-        pattern = f"{base_name}.%{0}{padding}d.{ext}"
-        return os.path.join(plate_dir, pattern).replace("\\", "/")
+        seq = find_sequence(plate_dir)
+        if not seq: return None
+        if seq.has_gaps():
+            print(f"Warning: plate has missing frames: {seq.frame_range_string()}")
+        return seq.pattern("printf").replace("\\", "/")
 
     def run_playblast(self):
         #validity
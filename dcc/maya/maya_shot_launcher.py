@@ -27,6 +27,7 @@ if pipeline_path and pipeline_path not in sys.path:
 
 try:
     from core.orionUtils import OrionUtils
+    from core.sequenceUtils import find_sequence
     try: 
         from maya.plugin.timeSliderBookmark.timeSliderBookmark import createBookmark
     except ImportError:
@@ -509,16 +510,12 @@ class OrionMayaUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             print("Plate folder not found.")
             return
 
-        found_seq = None
-        for item in os.listdir(plate_root):
-            if item.lower().endswith((".exr", ".jpg", ".png", ".tif", ".tiff")):
-                found_seq = os.path.join(plate_root, item)
-                break
+        found_seq = find_sequence(plate_root)
         
         if found_seq:
             try:
-                #img plane
-                image_plane = cmds.imagePlane(camera=camera, fileName=found_seq)[0]
+                #img plane (first frame, maya works out the rest from frame extension)
+                image_plane = cmds.imagePlane(camera=camera, fileName=found_seq.path(found_seq.start))[0]
                 
                 #frame extension
                 cmds.setAttr(f"{image_plane}.useFrameExtension", 1)
@@ -1,6 +1,7 @@
 import sys
 import os
 import re
+import time
 import shutil
 import maya.cmds as cmds
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
@@ -29,6 +30,8 @@ try:
 except ImportError:
     print("Warning: Could not import OrionUtils.")
 
+from core.usdUtils import strip_namespaces
+
 class OrionUSDManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(OrionUSDManager, self).__init__(parent=parent)
@@ -584,39 +587,19 @@ class OrionUSDManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             cmds.warning(f"Could not open USD file for formatting: {usd_file_path}")
             return
 
-        #recursive function for prim manipulation
-        def process_prim(prim_spec):
-            #prevent crashing if this prim was deleted as a sibling collision earlier
-            if prim_spec.expired:
-                return
-
-            #strip namespace prefix if it exists
-            if namespace_prefix and prim_spec.name.startswith(namespace_prefix):
-                new_name = prim_spec.name.replace(namespace_prefix, "", 1)
-                
-                try:
-                    prim_spec.name = new_name
-                except Exception as e:
-                    #collision detected if sibling shares the same name
-                    #leave the namespace intact on this specific prim
-                    print(f"Collision skipped: Kept namespace for '{prim_spec.name}'.")
-                    pass
-
-            #walk down to all children
-            for child in list(prim_spec.nameChildren):
-                process_prim(child)
-
-        #start processing from the root prims
-        for root_prim in list(layer.rootPrims):
-            process_prim(root_prim)
-
-        #fix the defaultPrim metadata at the top of the file
-        if layer.defaultPrim and namespace_prefix and layer.defaultPrim.startswith(namespace_prefix):
-            layer.defaultPrim = layer.defaultPrim.replace(namespace_prefix, "", 1)
+        #plans every rename up front (collisions keep their namespace) and applies them in one go
+        report = strip_namespaces(layer, namespace_prefix)
+        for path in report["skipped"]:
+            print(f"Collision skipped: Kept namespace for '{path}'.")
 
         #save back to disk
+        start = time.perf_counter()
         layer.Save()
+        save_seconds = time.perf_counter() - start
+
         print(f"Orion USD Manager: Successfully formatted namespaces in {usd_file_path}")
+        print(f"Orion USD Manager: {report['renamed']}/{report['prims']} prims renamed, {len(report['skipped'])} kept "
+              f"(plan {report['plan_seconds']:.2f}s, rename {report['apply_seconds']:.2f}s, save {save_seconds:.2f}s)")
 
     #PUBLISH
 
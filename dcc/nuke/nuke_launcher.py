@@ -1,11 +1,14 @@
 import os
-import subprocess
 import sys
 from pathlib import Path
-import shutil
 import argparse
 
-def launch_nuke(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None):
+def launch_nuke(file_path=None, shot_code=None, frame_start=None, frame_end=None, discord_thread_id=None, shot_path=None, orion=None, click_time=None):
+    """
+    Builds the Nuke environment and starts it.
+    Pass an existing OrionUtils as orion to launch warm from a running launcher
+    (skips re-reading .env and the schema check). Returns the Popen object or None.
+    """
     
     user = os.getlogin()
     
@@ -20,12 +23,15 @@ def launch_nuke(file_path=None, shot_code=None, frame_start=None, frame_end=None
 
     try:
         from core.orionUtils import OrionUtils
+        from core.launchUtils import spawn_dcc, walk_dirs, LaunchManifest
     except ImportError as e:
         print(f"CRITICAL ERROR: Could not import OrionUtils. Checked path: {pipeline_root}")
         print(f"Error details: {e}")
         return
     
-    orion = OrionUtils()
+    warm = orion is not None
+    if not warm:
+        orion = OrionUtils()
     
     ORI_PROJECT_PATH = orion.get_root_dir()
     print(f"Pipeline Root Detected: {ORI_PROJECT_PATH}")
@@ -52,28 +58,31 @@ def launch_nuke(file_path=None, shot_code=None, frame_start=None, frame_end=None
     WORKSPACE_SRC = os.path.join(USER_PATH, "Workspaces")
     WORKSPACE_DST = f"C:\\Users\\{user}\\.nuke\\Workspaces\\Nuke"
     
+    #launch env is cached locally and only rebuilt when the config folders change
+    manifest = LaunchManifest("nuke")
+
     try:
-        shutil.copytree(WORKSPACE_SRC, WORKSPACE_DST, dirs_exist_ok=True)
+        #only copies workspaces that changed since the last launch
+        manifest.sync_tree(WORKSPACE_SRC, WORKSPACE_DST)
     except Exception as e:
         print(f"Unable to copy workspaces: {e}")
     
     # OCIO_PATH = r"P:\all_work\studentGroups\ORION_CORPORATION\60_config\colorManagement\aces_1.2\config.ocio"
 
     BASE_PLUGINS_PATH = os.path.join(ORI_ROOT_PATH, "60_config", "softwarePrefs", "nuke", "plugins")
-    NEW_PLUGINS_PATH = [BASE_PLUGINS_PATH]
-    for root, dirs, files in os.walk(BASE_PLUGINS_PATH):
-        for d in dirs:
-            #ignore cache and hidden folders
-            if d.startswith(".") or d == "__pycache__":
-                continue
-            #add path to subfolder to list
-            NEW_PLUGINS_PATH.append(os.path.join(root, d))
-    
-    #join all into string, seperated
-    PLUGINS_PATH = os.pathsep.join(NEW_PLUGINS_PATH)
-    
-    all_nuke_paths = [USER_PATH, PLUGINS_PATH, ROOT_PATH, PIPELINE_PATH]
-    ORI_NUKE_PATHS = os.pathsep.join(all_nuke_paths)
+    env_key = f"env:{ORI_ROOT_PATH}:{user}"
+    ORI_NUKE_PATHS = manifest.get_env(env_key)
+    if ORI_NUKE_PATHS is None:
+        #plugins folder + every subfolder (skips cache and hidden folders)
+        NEW_PLUGINS_PATH = walk_dirs(BASE_PLUGINS_PATH)
+        
+        #join all into string, seperated
+        PLUGINS_PATH = os.pathsep.join(NEW_PLUGINS_PATH)
+        
+        all_nuke_paths = [USER_PATH, PLUGINS_PATH, ROOT_PATH, PIPELINE_PATH]
+        ORI_NUKE_PATHS = os.pathsep.join(all_nuke_paths)
+        manifest.set_env(env_key, ORI_NUKE_PATHS, NEW_PLUGINS_PATH)
+    manifest.save()
 
     #copy the current system environment
     env = os.environ.copy()
@@ -95,10 +104,7 @@ def launch_nuke(file_path=None, shot_code=None, frame_start=None, frame_end=None
     if file_path:
         cmd.append(file_path)
 
-    try:
-        subprocess.Popen(cmd, env=env)
-    except FileNotFoundError:
-        print("Error: Nuke executable not found.")
+    return spawn_dcc(cmd, env, "Nuke", click_time=click_time, mode="in-process" if warm else "subprocess")
 
 if __name__ == "__main__":
     #ARGUMENT PARSER
@@ -1,3 +1,4 @@
+import os
 import sys
 import time
 import traceback
@@ -7,10 +8,29 @@ ORION_UTILS_DIR = "P:\\all_work\\studentGroups\\ORION_CORPORATION\\00_pipeline\\
 if ORION_UTILS_DIR not in sys.path:
     sys.path.append(ORION_UTILS_DIR)
 
+def generate_thumbnails(deadline_plugin, job):
+    """Builds launcher thumbnails for the rendered frames while the files are still hot."""
+    try:
+        from core.thumbnailUtils import ThumbnailService
+
+        #orionTech lives in <root>/00_pipeline/orionTech
+        root_dir = os.path.dirname(os.path.dirname(ORION_UTILS_DIR.rstrip("\\")))
+        service = ThumbnailService(root_dir=root_dir)
+        for output_dir in job.JobOutputDirectories:
+            if os.path.isdir(output_dir):
+                results = service.generate_for_directory(output_dir)
+                made = sum(1 for t in results.values() if t)
+                deadline_plugin.LogInfo(f"Orion thumbnails: {made}/{len(results)} made for {output_dir}")
+        service.shutdown()
+    except Exception as e:
+        deadline_plugin.LogWarning(f"!!! Thumbnail Error (on_job_finish): {e}\n{traceback.format_exc()}")
+
 def __main__(*args):
     deadline_plugin = args[0]
     job = deadline_plugin.GetJob()
 
+    generate_thumbnails(deadline_plugin, job)
+
     try:
         notify_enabled_str = job.GetJobExtraInfoKeyValueWithDefault("OrionDiscordNotify", "false")
         if notify_enabled_str.lower() != 'true':
@@ -1,7 +1,14 @@
 from PySide2 import QtGui, QtCore, QtWidgets
 from PySide2.QtCore import QFile
 from PySide2.QtUiTools import *
-import os, subprocess, re, tempfile, shutil, requests, json, math
+import os, sys, subprocess, re, tempfile, shutil, requests, json
+
+#pipeline helpers for the comparison cache
+pipeline_path = os.environ.get("ORI_PIPELINE_PATH")
+if pipeline_path and pipeline_path not in sys.path:
+    sys.path.append(pipeline_path)
+
+from core.mosaicUtils import compute_mosaic_layout, get_compare_cache, get_comparison_key
 
 class FastFlipbook(QtWidgets.QDialog):
     def __init__(self):
@@ -266,11 +273,24 @@ class FastFlipbook(QtWidgets.QDialog):
         output_path = os.path.join(self.hip, 'flipbooks', output_file_name).replace(r'\\', r'/')
 
         # Set Grid Size
-        grid_div_width = math.ceil(math.sqrt(num_inputs))
-        grid_div_height = (num_inputs // grid_div_width) + min(math.ceil(num_inputs % grid_div_width), 1)
-
-        max_width = math.trunc(1920 / grid_div_width)
-        max_height = math.trunc(1080 / grid_div_height)
+        layout = compute_mosaic_layout(num_inputs, even_dims=False)
+        max_width = layout["tile_width"]
+        max_height = layout["tile_height"]
+
+        # Cached comparison (keyed on the input files, not the output name)
+        cache = get_compare_cache()
+        cache_key = get_comparison_key(paths, layout, {"fontsize": 16, "encode": "h264_nvenc"})
+        if cache_key is None:
+            # an input went away after the list was filled (no key without every input)
+            missing = [os.path.basename(p) for p in paths if not os.path.isfile(p)]
+            print(f"Can't compare, missing flipbooks: {', '.join(missing) or 'unreadable input'}")
+            return
+        cached_path = cache.get(cache_key)
+        if cached_path:
+            # still leave the comparison next to the flipbooks like a fresh render does
+            shutil.copy2(cached_path, output_path)
+            os.startfile(output_path)
+            return
 
         # INPUTS
         inputs_expression = []
@@ -297,44 +317,20 @@ class FastFlipbook(QtWidgets.QDialog):
         index_list_string = ''.join(index_list)
 
         # MOSAIC POSITIONS
-        pos_expression = []
-
-        for input_index in range(0, num_inputs):
-            x_pos = input_index % grid_div_width
-            y_pos = input_index // grid_div_width
+        layout_string = layout["layout"]
+        render_path = cache.temp_path_for(cache_key).replace('\\', '/')
 
-            # create xpos string
-            x_expression = []
-
-            if x_pos != 0:
-                for i in range(0, x_pos):
-                    x_expression.append(f'w{i}')
-            else:
-                x_expression.append('0')
-            x_string = '+'.join(x_expression)
+        cmd = f'"{self.ffmpeg_path}" -y {inputs_string} -filter_complex "{index_string} {index_list_string}xstack=inputs={num_inputs}:layout={layout_string}:fill=black[out]" -map "[out]" -c:v h264_nvenc "{render_path}"'
 
-            # create ypos string
-            y_expression = []
+        subprocess.run(cmd, shell=True)
 
-            if y_pos != 0:
-                for i in range(0, y_pos):
-                    y_expression.append(f'h{i}')
-            else:
-                y_expression.append('0')
-            y_string = '+'.join(y_expression)
-
-            cur_pos_string = f'{x_string}_{y_string}'
-            pos_expression.append(cur_pos_string)
-
-        layout_string = '|'.join(pos_expression)
-
-        cmd = f'"{self.ffmpeg_path}" {inputs_string} -filter_complex "{index_string} {index_list_string}xstack=inputs={num_inputs}:layout={layout_string}:fill=black[out]" -map "[out]" -c:v h264_nvenc {output_path}'
-
-        print(os.path.exists(output_path))
-
-        if not os.path.exists(output_path):
-            subprocess.run(cmd, shell=True)
-        os.startfile(f'{output_path}')
+        cached_path = cache.commit(cache_key, render_path)
+        if not cached_path:
+            print("Comparison failed, check ffmpeg output.")
+            return
+        # keep a copy next to the flipbooks like before
+        shutil.copy2(cached_path, output_path)
+        os.startfile(output_path)
             
 
 
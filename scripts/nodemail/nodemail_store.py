@@ -0,0 +1,331 @@
+import os
+import sys
+import json
+import glob
+import time
+import uuid
+import zlib
+import lzma
+import hashlib
+import threading
+from datetime import datetime
+
+#each recipient gets their own folder: <root>/<recipient>/
+#   <id>.head.json  small header (sender, time, note, node names, size, blob), written last so a mail only shows up once complete
+#   index.json      headers already seen, only ever written by the recipient
+#payloads are compressed blobs named by their hash in <root>/blobs/, so the same nodes sent to
+#several people are stored once. <id>.payload files are from before blobs and still readable.
+INDEX_NAME = "index.json"
+HEAD_EXT = ".head.json"
+PAYLOAD_EXT = ".payload"
+BLOBS_DIR = "blobs"
+
+#zlib is quick and does well on .nk text, lzma squeezes more at a slower send (ORI_NODEMAIL_CODEC)
+CODECS = {
+    "zlib": (lambda b: zlib.compress(b, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+DEFAULT_CODEC = os.environ.get("ORI_NODEMAIL_CODEC", "zlib")
+
+#blobs nobody points at are only removed once this old, so a send in progress
+#(blob written, header not yet) never loses its blob
+GC_MIN_AGE = 3600
+
+def write_atomic(path, text):
+    temp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+class NodeMailStore:
+    """
+    Nodemail folder split per recipient, with headers kept apart from the
+    node payloads so opening an inbox never reads the (possibly huge) nodes.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def inbox_path(self, user):
+        return os.path.join(self.root, user)
+
+    #   BLOBS
+
+    def blob_path(self, digest, codec):
+        return os.path.join(self.root, BLOBS_DIR, digest[:2], f"{digest}.{codec}")
+
+    def put_blob(self, payload, codec=DEFAULT_CODEC):
+        """
+        Stores a payload compressed under its hash, once.
+        Returns (hash, codec, compressed size).
+        """
+        if codec not in CODECS:
+            codec = "zlib"
+        data = payload.encode("utf-8")
+        digest = hashlib.sha1(data).hexdigest()
+        path = self.blob_path(digest, codec)
+
+        if os.path.exists(path):
+            #already sent to someone, just mark it as used again so gc leaves it alone
+            try: os.utime(path)
+            except OSError: pass
+            return digest, codec, os.path.getsize(path)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        packed = CODECS[codec][0](data)
+        temp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(packed)
+        os.replace(temp_path, path)
+        return digest, codec, len(packed)
+
+    def read_blob(self, digest, codec):
+        with open(self.blob_path(digest, codec), "rb") as f:
+            return CODECS[codec][1](f.read()).decode("utf-8")
+
+    #   SEND
+
+    def send(self, sender, recipient, note, payload, node_names=None):
+        """Drops a mail into the recipient's folder and returns its header."""
+        ts = datetime.now()
+        mail_id = f"{ts.strftime('%Y%m%d_%H%M%S')}_{sender}_{uuid.uuid4().hex[:6]}"
+        folder = self.inbox_path(recipient)
+        os.makedirs(folder, exist_ok=True)
+
+        #blob first, the header is what makes the mail visible
+        digest, codec, packed_size = self.put_blob(payload)
+        header = {
+            "id": mail_id,
+            "sender": sender,
+            "recipient": recipient,
+            "time": ts.isoformat(),
+            "note": note,
+            "nodes": list(node_names or []),
+            "size": len(payload.encode("utf-8")),
+            "blob": digest,
+            "codec": codec,
+            "stored_size": packed_size,
+        }
+        write_atomic(os.path.join(folder, mail_id + HEAD_EXT), json.dumps(header))
+        return header
+
+    #   INBOX
+
+    def read_index(self, user):
+        try:
+            with open(os.path.join(self.inbox_path(user), INDEX_NAME), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def write_index(self, user, index):
+        try:
+            write_atomic(os.path.join(self.inbox_path(user), INDEX_NAME), json.dumps(index))
+        except OSError as e:
+            print(f"Could not write nodemail index: {e}")
+
+    def list_inbox(self, user):
+        """
+        Headers for user's mail, newest first. One listing of the user's own
+        folder, plus a read of each header that isn't in the index yet.
+        """
+        folder = self.inbox_path(user)
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return []
+
+        index = self.read_index(user)
+        present = {n[:-len(HEAD_EXT)] for n in names if n.endswith(HEAD_EXT)}
+
+        changed = False
+        for mail_id in present - set(index):
+            try:
+                with open(os.path.join(folder, mail_id + HEAD_EXT), "r") as f:
+                    index[mail_id] = json.load(f)
+                changed = True
+            except (OSError, ValueError) as e:
+                print(f"Read Error {mail_id}: {e}")
+
+        #deleted from another session
+        for mail_id in set(index) - present:
+            del index[mail_id]
+            changed = True
+
+        if changed:
+            self.write_index(user, index)
+
+        return sorted(index.values(), key=lambda h: h.get("time", ""), reverse=True)
+
+    def inbox_stamp(self, user):
+        """
+        Changes whenever a mail lands in or leaves user's folder (headers are
+        renamed into place, which bumps the folder mtime). One stat, cheap to poll.
+        """
+        try:
+            return os.stat(self.inbox_path(user)).st_mtime_ns
+        except OSError:
+            return None
+
+    def load_payload(self, header):
+        """Reads the copied nodes for a mail, only needed when pasting."""
+        try:
+            if header.get("blob"):
+                return self.read_blob(header["blob"], header.get("codec", "zlib"))
+            with open(os.path.join(self.inbox_path(header["recipient"]), header["id"] + PAYLOAD_EXT), "r") as f:
+                return f.read()
+        except (OSError, ValueError, KeyError, zlib.error, lzma.LZMAError) as e:
+            print(f"Could not read mail {header['id']}: {e}")
+            return None
+
+    def delete(self, header):
+        """Removes the mail, its blob goes once no other mail uses it (see collect_garbage)."""
+        folder = self.inbox_path(header["recipient"])
+        #header first so a half deleted mail doesn't show up
+        for ext in (HEAD_EXT, PAYLOAD_EXT):
+            try:
+                os.remove(os.path.join(folder, header["id"] + ext))
+            except FileNotFoundError:
+                pass
+
+        index = self.read_index(header["recipient"])
+        if index.pop(header["id"], None) is not None:
+            self.write_index(header["recipient"], index)
+
+    #   GARBAGE COLLECTION
+
+    def referenced_blobs(self):
+        """Every blob hash a header in any inbox still points at."""
+        used = set()
+        for entry in os.scandir(self.root):
+            if not entry.is_dir() or entry.name == BLOBS_DIR:
+                continue
+            for name in os.listdir(entry.path):
+                if not name.endswith(HEAD_EXT):
+                    continue
+                try:
+                    with open(os.path.join(entry.path, name), "r") as f:
+                        digest = json.load(f).get("blob")
+                except (OSError, ValueError):
+                    #unreadable header, keep everything rather than risk losing its blob
+                    return None
+                if digest:
+                    used.add(digest)
+        return used
+
+    def collect_garbage(self, min_age=GC_MIN_AGE):
+        """
+        Deletes blobs no header points at. Returns (removed count, bytes freed).
+        Reads every header on the share, so it runs from the command line below
+        (e.g. a nightly task), never from a UI.
+        """
+        used = self.referenced_blobs()
+        if used is None:
+            return 0, 0
+
+        removed = 0
+        freed = 0
+        now = time.time()
+        blobs_root = os.path.join(self.root, BLOBS_DIR)
+        for dirpath, _, files in os.walk(blobs_root):
+            for name in files:
+                #skips temp files of sends still writing
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, name)
+                digest = name.split(".")[0]
+                try:
+                    st = os.stat(path)
+                    if digest in used or now - st.st_mtime < min_age:
+                        continue
+                    os.remove(path)
+                    removed += 1
+                    freed += st.st_size
+                except OSError:
+                    continue
+        return removed, freed
+
+    #   OLD FORMAT
+
+    def migrate_legacy(self, user):
+        """
+        Moves user's mail from the old flat <recipient>_<sender>_<time>.json
+        files into their folder. Only files named for user are opened.
+        """
+        moved = 0
+        for path in glob.glob(os.path.join(self.root, f"{user}_*.json")):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Read Error {path}: {e}")
+                continue
+            if data.get("recipient") != user:
+                continue
+
+            mail_id = os.path.splitext(os.path.basename(path))[0]
+            folder = self.inbox_path(user)
+            os.makedirs(folder, exist_ok=True)
+            payload = data.get("copied_node", "")
+            try:
+                digest, codec, packed_size = self.put_blob(payload)
+                header = {
+                    "id": mail_id,
+                    "sender": data.get("sender", "Unknown"),
+                    "recipient": user,
+                    "time": data.get("time", ""),
+                    "note": data.get("note", ""),
+                    "nodes": [],
+                    "size": len(payload.encode("utf-8")),
+                    "blob": digest,
+                    "codec": codec,
+                    "stored_size": packed_size,
+                }
+                write_atomic(os.path.join(folder, mail_id + HEAD_EXT), json.dumps(header))
+                os.remove(path)
+                moved += 1
+            except OSError as e:
+                print(f"Could not move old mail {path}: {e}")
+        return moved
+
+class InboxWatcher:
+    """
+    Polls one inbox and reports only what changed since the last poll, so a
+    UI can add the new mail instead of rebuilding the whole list.
+    Qt free, the UIs drive it from a QTimer.
+    """
+
+    def __init__(self, store, user):
+        self.store = store
+        self.user = user
+        self.known = set()
+        self.stamp = None
+
+    def poll(self, force=False):
+        """Returns (new headers newest first, ids that went away). Costs one stat when nothing changed."""
+        #taken before listing, so a mail landing mid listing is picked up next time
+        stamp = self.store.inbox_stamp(self.user)
+        if not force and stamp is not None and stamp == self.stamp:
+            return [], set()
+        self.stamp = stamp
+
+        headers = self.store.list_inbox(self.user)
+        ids = {h["id"] for h in headers}
+        added = [h for h in headers if h["id"] not in self.known]
+        removed = self.known - ids
+        self.known = ids
+        return added, removed
+
+    def forget(self, mail_id):
+        self.known.discard(mail_id)
+
+    def reset(self):
+        self.known = set()
+        self.stamp = None
+
+if __name__ == "__main__":
+    #sweeps unused payloads, meant for a scheduled task on the server
+    #e.g. python nodemail_store.py P:/.../60_config/nodemail/nuke
+    for root in sys.argv[1:]:
+        removed, freed = NodeMailStore(root).collect_garbage()
+        print(f"{root}: removed {removed} unused payloads ({freed / 1024:.0f} KB)")
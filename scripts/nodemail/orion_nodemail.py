@@ -1,8 +1,6 @@
 import base64
 import sys
-import json
 import os
-import glob
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +11,14 @@ try:
 except ImportError:
     from PySide6 import QtWidgets, QtCore, QtGui
 
+try:
+    from nodemail_store import NodeMailStore, InboxWatcher
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from nodemail_store import NodeMailStore, InboxWatcher
+
+#how often the inbox folder is checked for new mail (ms)
+POLL_INTERVAL = int(os.environ.get("ORI_NODEMAIL_POLL_MS", "3000"))
 
 #software detection
 try:
@@ -160,11 +166,11 @@ class MailItem(QtWidgets.QWidget):
         super().__init__(parent)
         
         self.filename = filename
+        #header only, the nodes are loaded from the store when pasting
         self.data = data
         self.sender = data.get("sender", "Unknown")
         self.timestamp = data.get("time", "")
         self.note = data.get("note", "")
-        self.node_payload = data.get("copied_node", "")
 
         self.default_style = """
             QWidget { 
@@ -231,6 +237,10 @@ class MailItem(QtWidgets.QWidget):
         
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
 
+        nodes = data.get("nodes", [])
+        if nodes:
+            self.setToolTip(f"{len(nodes)} nodes: " + ", ".join(nodes))
+
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
             self.clicked.emit(self)
@@ -270,6 +280,11 @@ class NodeMailUI(QtWidgets.QMainWindow):
         usernames = self.orion.get_usernames()
         self.user = os.getenv("USERNAME", "user")
 
+        self.store = NodeMailStore(self.nodemail_path)
+        self.store.migrate_legacy(self.user)
+        self.watcher = InboxWatcher(self.store, self.user)
+        self.mail_items = {}
+
         self.setObjectName("NodeMailWindow")
         self.setWindowTitle(f"NodeMail ({subdir}) - {self.user}")
         self.setMinimumWidth(800)
@@ -281,6 +296,12 @@ class NodeMailUI(QtWidgets.QMainWindow):
         self.update_selection_display()
         self.refresh_inbox()
 
+        #new mail shows up on its own, the timer costs one stat while nothing changes
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(POLL_INTERVAL)
+        self.poll_timer.timeout.connect(self.check_inbox)
+        self.poll_timer.start()
+
     def load_orion_utils(self):
         if not self.pipeline_root:
             print("ORI_PIPELINE_PATH env var not set.")
@@ -393,30 +414,36 @@ class NodeMailUI(QtWidgets.QMainWindow):
             item = self.inbox_vbox.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-
-        QtWidgets.QApplication.processEvents()
-        
-        pattern = os.path.join(self.nodemail_path, "*.json")
-        files = glob.glob(pattern)
-        files.sort(key=os.path.getmtime, reverse=True)
-
-        found = 0
-        for f in files:
-            try:
-                with open(f, 'r') as jf:
-                    data = json.load(jf)
-                
-                if data.get("recipient") == self.user:
-                    item = MailItem(f, data, parent=self.inbox_container)
-                    item.clicked.connect(self.on_item_clicked)
-                    self.inbox_vbox.addWidget(item)
-                    found += 1
-            except Exception as e:
-                print(f"Read Error {f}: {e}")
-        
+        self.mail_items = {}
         self.inbox_vbox.addStretch()
+
+        #only this user's headers are read, payloads stay on disk until pasted
+        self.watcher.reset()
+        self.check_inbox()
         self.inbox_container.setVisible(True)
 
+    def check_inbox(self):
+        """Adds new mail to the top and drops mail deleted elsewhere, nothing else is rebuilt."""
+        added, removed = self.watcher.poll()
+
+        for mail_id in removed:
+            item = self.mail_items.pop(mail_id, None)
+            if item is None:
+                continue
+            if item is self.current_selected_item:
+                self.current_selected_item = None
+                self.btn_paste.setEnabled(False)
+                self.btn_delete.setEnabled(False)
+            self.inbox_vbox.removeWidget(item)
+            item.deleteLater()
+
+        #newest first, so each one goes in just below the one before it
+        for pos, header in enumerate(added):
+            item = MailItem(header["id"], header, parent=self.inbox_container)
+            item.clicked.connect(self.on_item_clicked)
+            self.inbox_vbox.insertWidget(pos, item)
+            self.mail_items[header["id"]] = item
+
     def on_item_clicked(self, item):
         if self.current_selected_item:
             try:
@@ -436,7 +463,9 @@ class NodeMailUI(QtWidgets.QMainWindow):
             return
         
         try:
-            os.remove(self.current_selected_item.filename)
+            self.store.delete(self.current_selected_item.data)
+            self.watcher.forget(self.current_selected_item.filename)
+            self.mail_items.pop(self.current_selected_item.filename, None)
             self.inbox_vbox.removeWidget(self.current_selected_item)
             self.current_selected_item.deleteLater()
             
@@ -450,7 +479,7 @@ class NodeMailUI(QtWidgets.QMainWindow):
         if not self.current_selected_item:
             return
         
-        data = self.current_selected_item.node_payload
+        data = self.store.load_payload(self.current_selected_item.data)
         success = BRIDGE.paste_nodes(data)
         
         if success:
@@ -477,22 +506,8 @@ class NodeMailUI(QtWidgets.QMainWindow):
             BRIDGE.message("Select nodes first!")
             return
 
-        ts = datetime.now()
-        packet = {
-            "sender": self.user,
-            "recipient": recip,
-            "time": ts.isoformat(),
-            "note": note,
-            "copied_node": node_data
-        }
-
-        fname = f"{recip}_{self.user}_{ts.strftime('%Y%m%d_%H%M%S')}.json"
-        fpath = os.path.join(self.nodemail_path, fname)
-
         try:
-            with open(fpath, "w") as f:
-                json.dump(packet, f, indent=4)
-            
+            self.store.send(self.user, recip, note, node_data, BRIDGE.get_selection_names())
             BRIDGE.message(f"Sent to {recip}")
             self.input_note.clear()
         except Exception as e:
@@ -1,7 +1,5 @@
 import sys
-import json
 import os
-import glob
 import tempfile
 import base64
 from datetime import datetime
@@ -19,6 +17,15 @@ try:
 except ImportError:
     hou = None
 
+try:
+    from nodemail_store import NodeMailStore, InboxWatcher
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from nodemail_store import NodeMailStore, InboxWatcher
+
+#how often the inbox folder is checked for new mail (ms)
+POLL_INTERVAL = int(os.environ.get("ORI_NODEMAIL_POLL_MS", "3000"))
+
 #MAIL ITEM WIDGET
 class MailItem(QtWidgets.QWidget):
     clicked = QtCore.Signal(object) 
@@ -27,6 +34,7 @@ class MailItem(QtWidgets.QWidget):
         super(MailItem, self).__init__()
         
         self.filename = filename
+        #header only, the nodes are loaded from the store when pasting
         self.data = data
         
         #extract data for UI
@@ -34,7 +42,6 @@ class MailItem(QtWidgets.QWidget):
         self.recipient = data.get("recipient", "Unknown")
         self.timestamp = data.get("time", "")
         self.note = data.get("note", "")
-        self.node_payload = data.get("copied_node", "")
 
         #styles
         self.default_style = """
@@ -167,6 +174,11 @@ class NodeMailUI(QtWidgets.QMainWindow):
             except:
                 pass
 
+        self.store = NodeMailStore(self.nodemail_path)
+        self.store.migrate_legacy(self.user)
+        self.watcher = InboxWatcher(self.store, self.user)
+        self.mail_items = {}
+
         self.setObjectName("NodeMailWindow")
         self.setWindowTitle("NodeMail Houdini - Logged in as: " + self.user)
         self.setMinimumWidth(800)
@@ -179,6 +191,12 @@ class NodeMailUI(QtWidgets.QMainWindow):
         self.update_selection_display()
         self.refresh_inbox()
 
+        #new mail shows up on its own, the timer costs one stat while nothing changes
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(POLL_INTERVAL)
+        self.poll_timer.timeout.connect(self.check_inbox)
+        self.poll_timer.start()
+
     def build_ui(self, usernames):
         central_widget = QtWidgets.QWidget()
         self.setCentralWidget(central_widget)
@@ -291,30 +309,36 @@ class NodeMailUI(QtWidgets.QMainWindow):
             if widget:
                 widget.deleteLater()
 
-        #find files
-        search_pattern = os.path.join(self.nodemail_path, "*.json")
-        files = glob.glob(search_pattern)
-        
-        #sort by time
-        files.sort(key=os.path.getmtime, reverse=True)
+        self.mail_items = {}
+        self.current_selected_item = None
+        self.paste_button.setEnabled(False)
+        self.delete_button.setEnabled(False)
 
-        found_count = 0
-        for f in files:
-            try:
-                with open(f, 'r') as json_file:
-                    data = json.load(json_file)
-                
-                #check if this mail is for the current user
-                recipient = data.get("recipient", "")
-                
-                if recipient == self.user:
-                    mail_item = MailItem(filename=f, data=data)
-                    mail_item.clicked.connect(self.handle_mail_click)
-                    #insert at top (index 0)
-                    self.inbox_vbox.insertWidget(found_count, mail_item)
-                    found_count += 1
-            except Exception as e:
-                print("Error reading mail file " + f + ": " + str(e))
+        #only this user's headers are read, payloads stay on disk until pasted
+        self.watcher.reset()
+        self.check_inbox()
+
+    def check_inbox(self):
+        """Adds new mail to the top and drops mail deleted elsewhere, nothing else is rebuilt."""
+        added, removed = self.watcher.poll()
+
+        for mail_id in removed:
+            mail_item = self.mail_items.pop(mail_id, None)
+            if mail_item is None:
+                continue
+            if mail_item is self.current_selected_item:
+                self.current_selected_item = None
+                self.paste_button.setEnabled(False)
+                self.delete_button.setEnabled(False)
+            self.inbox_vbox.removeWidget(mail_item)
+            mail_item.deleteLater()
+
+        #newest first, so each one goes in just below the one before it
+        for pos, header in enumerate(added):
+            mail_item = MailItem(filename=header["id"], data=header)
+            mail_item.clicked.connect(self.handle_mail_click)
+            self.inbox_vbox.insertWidget(pos, mail_item)
+            self.mail_items[header["id"]] = mail_item
 
     def handle_mail_click(self, clicked_item):
         #deselect old
@@ -333,11 +357,13 @@ class NodeMailUI(QtWidgets.QMainWindow):
         if self.current_selected_item:
             #delete file
             try:
-                os.remove(self.current_selected_item.filename)
+                self.store.delete(self.current_selected_item.data)
             except OSError as e:
                 print("Could not delete file: " + str(e))
             
             #remove from ui
+            self.watcher.forget(self.current_selected_item.filename)
+            self.mail_items.pop(self.current_selected_item.filename, None)
             self.inbox_vbox.removeWidget(self.current_selected_item)
             self.current_selected_item.deleteLater()
             self.current_selected_item = None
@@ -351,7 +377,7 @@ class NodeMailUI(QtWidgets.QMainWindow):
         if not self.current_selected_item:
             return
             
-        b64_data = self.current_selected_item.node_payload
+        b64_data = self.store.load_payload(self.current_selected_item.data)
         if not b64_data:
             if hou: hou.ui.displayMessage("Error: Email contains no node data.")
             return
@@ -447,27 +473,10 @@ class NodeMailUI(QtWidgets.QMainWindow):
         else:
             b64_node_data = "dummy_data_for_testing"
 
-        #generate unique filename
-        timestamp = datetime.now()
-        time_str_iso = timestamp.isoformat()
-        time_str_file = timestamp.strftime("%Y%m%d_%H%M%S")
-        
-        filename = "{}_{}_{}.json".format(recipient, self.user, time_str_file)
-        save_path = os.path.join(self.nodemail_path, filename)
-
-        mail_packet = {
-            "sender": self.user,
-            "recipient": recipient,
-            "time": time_str_iso,
-            "note": note,
-            "copied_node": b64_node_data
-        }
-
         try:
-            with open(save_path, "w") as f:
-                json.dump(mail_packet, f, indent=4)
+            self.store.send(self.user, recipient, note, b64_node_data, [n.name() for n in hou.selectedNodes()] if hou else [])
             
-            print("Successfully sent mail to: " + save_path)
+            print("Successfully sent mail to: " + recipient)
             if hou: hou.ui.displayMessage("Sent to " + recipient + "!")
             self.note_edit.clear()
             
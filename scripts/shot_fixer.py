@@ -1,13 +1,11 @@
 import sys
 import os
-import re
-import json
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QTableWidget, QTableWidgetItem, 
                              QHeaderView, QLabel, QMessageBox, QTabWidget, QInputDialog)
 from PyQt5.QtGui import QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
 
 # ORION PIPELINE SETUP
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,13 +14,163 @@ if pipeline_root not in sys.path:
     sys.path.append(pipeline_root)
 
 from core.orionUtils import OrionUtils
+from core.auditUtils import get_proposed_name, load_shots, load_assets, audit_shot, audit_asset
+from core.fixerUtils import FixBatch, plan_shot_fix, plan_asset_fix, list_journals, get_journal_dir
+
+#folders are analysed in parallel, each one is a handful of stats and a json read on the share
+SCAN_WORKERS = int(os.environ.get("ORI_FIXER_WORKERS", "16"))
+
+class ScanRunner(QObject):
+    """
+    Runs folder analysis on a thread pool and hands each result back to the
+    GUI thread as it finishes. Results from an older scan are dropped.
+    Also runs fix batches, reporting through progress/finished.
+    """
+    result = pyqtSignal(int, int, object) # scan token, row, state
+    progress = pyqtSignal(int, int) # done, total
+    finished = pyqtSignal(object, object) # result, error
+
+    def __init__(self, max_workers=SCAN_WORKERS):
+        super().__init__()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="orion_fixer")
+        self.token = 0
+
+    def start(self, jobs, func):
+        """jobs is a list of (row, args), func(*args) runs on a worker."""
+        self.token += 1
+        token = self.token
+        for row, args in jobs:
+            future = self.executor.submit(func, *args)
+            future.add_done_callback(lambda f, r=row: self.emit_result(token, r, f))
+        return token
+
+    def emit_result(self, token, row, future):
+        #worker thread, the signal is queued to the GUI thread
+        try:
+            state = future.result()
+        except Exception as e:
+            state = {"issues": [f"Scan Error: {e}"], "db_status": "Unknown", "id_status": "Unknown",
+                     "path_status": "Unknown", "action_needed": False}
+        self.result.emit(token, row, state)
+
+    def run(self, func, *args):
+        """func(*args) on a worker, finished carries its result or the exception it raised."""
+        def work():
+            try:
+                self.finished.emit(func(*args), None)
+            except Exception as e:
+                self.finished.emit(None, e)
+        self.executor.submit(work)
+
+#   SHARED FIXING
+class FixerTab(QWidget):
+    """
+    Fix All for both tabs: every fix is planned up front, confirmed once and
+    run as one journaled batch (see core.fixerUtils.FixBatch) off the GUI thread.
+    """
+    kind = None
+
+    def setup_runner(self, on_result):
+        self.runner = ScanRunner()
+        self.runner.result.connect(on_result)
+        self.runner.progress.connect(self.on_fix_progress)
+        self.runner.finished.connect(self.on_batch_finished)
+        self.scan_token = 0
+        self.batch = None
+
+    def rescan(self):
+        pass
+
+    def add_fix_buttons(self, btn_layout):
+        self.btn_rollback = QPushButton("Undo Last Fix")
+        self.btn_rollback.clicked.connect(self.rollback_last)
+        btn_layout.addWidget(self.btn_rollback)
+
+    def set_busy(self, busy):
+        self.btn_fix_all.setEnabled(not busy)
+        self.btn_rollback.setEnabled(not busy)
+        self.table.setEnabled(not busy)
+
+    def enabled_rows(self, action_col):
+        return [r for r in range(self.table.rowCount())
+                if self.table.cellWidget(r, action_col) and self.table.cellWidget(r, action_col).isEnabled()]
+
+    def resume_unfinished(self):
+        """
+        Offers to finish (or undo) a batch that was cut off.
+        Returns False if the user cancelled, True if it's fine to go on.
+        """
+        unfinished = list_journals(get_journal_dir(self.orion), self.kind, unfinished=True)
+        if not unfinished:
+            return True
+        batch = FixBatch.load(self.orion, unfinished[0])
+        answer = QMessageBox.question(self, "Unfinished Fix",
+                                      f"A previous fix did not finish ({batch.summary()}).\n\n"
+                                      "Yes: finish it\nNo: roll it back",
+                                      QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel)
+        if answer == QMessageBox.Yes:
+            self.start_batch(batch)
+        elif answer == QMessageBox.No:
+            self.start_rollback(batch)
+        return False
+
+    def start_batch(self, batch):
+        if not batch.active():
+            self.show_failed(batch.failed())
+            return
+        self.batch = batch
+        self.set_busy(True)
+        self.lbl_path.setText(f"Fixing {batch.summary()}")
+        self.runner.run(batch.run, self.runner.progress.emit)
+
+    def start_rollback(self, batch):
+        self.batch = batch
+        self.set_busy(True)
+        self.lbl_path.setText(f"Rolling back {batch.summary()}")
+        self.runner.run(batch.rollback)
+
+    def rollback_last(self):
+        journals = [p for p in list_journals(get_journal_dir(self.orion), self.kind)
+                    if FixBatch.load(self.orion, p).phase != "rolled_back"]
+        if not journals:
+            QMessageBox.information(self, "Undo", "Nothing to undo.")
+            return
+        batch = FixBatch.load(self.orion, journals[0])
+        if QMessageBox.question(self, "Undo", f"Roll back the last fix ({batch.summary()})?\n"
+                                "Folders and tags it created are kept.",
+                                QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+            self.start_rollback(batch)
+
+    def on_fix_progress(self, done, total):
+        self.lbl_path.setText(f"Fixing folders {done}/{total}")
+
+    def on_batch_finished(self, failed, error):
+        self.set_busy(False)
+        if error:
+            QMessageBox.critical(self, "Fix Failed", f"The DB was not changed and renames were undone:\n{error}")
+        elif failed:
+            self.show_failed(failed)
+        self.batch = None
+        self.rescan()
+
+    def show_failed(self, failed):
+        if not failed:
+            return
+        lines = [f"{item['name']}: {item['error']}" for item in failed[:20]]
+        if len(failed) > 20:
+            lines.append(f"... and {len(failed) - 20} more")
+        QMessageBox.warning(self, "Not Fixed", "\n".join(lines))
 
 #   SHOT TAB (Refactored Existing Logic)  
-class ShotFixerTab(QWidget):
+class ShotFixerTab(FixerTab):
+    kind = "shot"
+
     def __init__(self, orion_inst, root_path):
         super().__init__()
         self.orion = orion_inst
         self.root_path = root_path
+        self.row_states = {}
+        self.setup_runner(self.on_folder_analyzed)
         self.init_ui()
         self.scan_folders()
 
@@ -52,180 +200,138 @@ class ShotFixerTab(QWidget):
         self.btn_fix_all.setStyleSheet("background-color: #e67e22; color: white; font-weight: bold; padding: 8px;")
         self.btn_fix_all.clicked.connect(self.fix_all)
         btn_layout.addStretch()
+        self.add_fix_buttons(btn_layout)
         btn_layout.addWidget(self.btn_fix_all)
         layout.addLayout(btn_layout)
 
         self.setLayout(layout)
 
     def get_proposed_name(self, folder_name):
-        match = re.search(r'(\d+)$', folder_name)
-        if match:
-            number = int(match.group(1))
-            return f"stc_{number:04d}"
-        return folder_name
-
-    def analyze_folder(self, folder_name, full_path):
-        state = {
-            "issues": [],
-            "db_status": "Unknown",
-            "id_status": "Unknown",
-            "action_needed": False
-        }
-        
-        proposed = self.get_proposed_name(folder_name)
-        
-        # 1. Name Check
-        if folder_name != proposed:
-            state["issues"].append("Wrong Name")
-
-        # 2. DB Check
-        in_db_as_proposed = self.orion.check_shot_exists_in_db(proposed)
-        in_db_as_current = self.orion.check_shot_exists_in_db(folder_name)
-
-        if in_db_as_proposed:
-            state["db_status"] = "Good"
-            shot_data = self.orion.get_shot(proposed)
-            if shot_data:
-                shot_id = shot_data['id']
-                # Check for complex/UUID IDs vs Simple IDs if strict mode wanted, 
-                # but broadly we just ensure ID exists.
-                if len(shot_id) > 20 and shot_id != proposed:
-                    state["id_status"] = "UUID"
-                else:
-                    state["id_status"] = "Simple"
-        elif in_db_as_current:
-            state["db_status"] = "Old Name in DB"
-            state["issues"].append("DB needs Update")
-        else:
-            state["db_status"] = "Missing"
-            state["issues"].append("Register in DB")
-
-        # 3. Structure Check
-        missing_subs = False
-        for sub in self.orion.SHOT_SUBFOLDERS:
-            if not os.path.exists(os.path.join(full_path, sub)):
-                missing_subs = True
-                break
-        if missing_subs:
-            state["issues"].append("Missing Folders")
-
-        # 4. Meta & Path Check
-        expected_rel_path = self.orion.get_relative_path(full_path)
-        json_path = os.path.join(full_path, "orion_meta.json")
-        
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
-                    if data.get("original_path") != expected_rel_path:
-                        state["issues"].append("JSON Path Update")
-                    if data.get("code") != proposed:
-                         state["issues"].append("JSON Code Update")
-            except:
-                state["issues"].append("JSON Corrupt")
-        else:
-            state["issues"].append("Missing JSON")
+        return get_proposed_name(folder_name)
 
-        if not os.path.exists(os.path.join(full_path, f".id_{proposed}")) and \
-           not any(f.startswith(".id_") for f in os.listdir(full_path)):
-            state["issues"].append("Missing ID Tag")
+    def load_shots_table(self):
+        return load_shots(self.orion)
 
-        if state["issues"]:
-            state["action_needed"] = True
-            
-        return state
+    def analyze_folder(self, folder_name, full_path, shots=None):
+        """The checks themselves live in core.auditUtils so the nightly audit runs the same ones."""
+        return audit_shot(self.orion, folder_name, full_path, shots)
+
+    def rescan(self):
+        self.scan_folders()
 
     def scan_folders(self):
+        """Lists the shot folders, then fills each row in as its analysis comes back."""
         self.table.setRowCount(0)
+        self.row_states = {}
         if not os.path.exists(self.root_path):
             return
 
+        shots = self.load_shots_table()
+
         folders = sorted(os.listdir(self.root_path))
+        jobs = []
         row = 0
         for folder in folders:
             full_path = os.path.join(self.root_path, folder)
             if not os.path.isdir(full_path) or folder.lower() == "old": 
                 continue 
 
-            state = self.analyze_folder(folder, full_path)
             proposed = self.get_proposed_name(folder)
             rel_path = self.orion.get_relative_path(full_path)
 
             self.table.insertRow(row)
             self.table.setItem(row, 0, QTableWidgetItem(folder))
             self.table.setItem(row, 1, QTableWidgetItem(proposed))
-            
-            item_health = QTableWidgetItem(", ".join(state["issues"]) if state["issues"] else "Healthy")
-            if state["action_needed"]:
-                item_health.setBackground(QColor("#c0392b"))
-                item_health.setForeground(QColor("white"))
-            else:
-                item_health.setBackground(QColor("#27ae60"))
-                item_health.setForeground(QColor("white"))
-            self.table.setItem(row, 2, item_health)
-
-            self.table.setItem(row, 3, QTableWidgetItem(state["db_status"]))
-            self.table.setItem(row, 4, QTableWidgetItem(state["id_status"]))
+            self.table.setItem(row, 2, QTableWidgetItem("Scanning..."))
             
             btn_fix = QPushButton("Fix")
             btn_fix.clicked.connect(lambda ch, r=row: self.fix_row(r))
-            if not state["action_needed"]:
-                btn_fix.setEnabled(False)
+            btn_fix.setEnabled(False)
             self.table.setCellWidget(row, 5, btn_fix)
             
             self.table.setItem(row, 6, QTableWidgetItem(rel_path))
+            jobs.append((row, (folder, full_path, shots)))
             row += 1
 
+        self.lbl_path.setText(f"Scanning Shots: {self.root_path} (0/{len(jobs)})")
+        self.pending = len(jobs)
+        self.scan_token = self.runner.start(jobs, self.analyze_folder)
+
+    def on_folder_analyzed(self, token, row, state):
+        if token != self.scan_token or row >= self.table.rowCount():
+            return
+        self.row_states[row] = state
+
+        item_health = QTableWidgetItem(", ".join(state["issues"]) if state["issues"] else "Healthy")
+        if state["action_needed"]:
+            item_health.setBackground(QColor("#c0392b"))
+            item_health.setForeground(QColor("white"))
+        else:
+            item_health.setBackground(QColor("#27ae60"))
+            item_health.setForeground(QColor("white"))
+        self.table.setItem(row, 2, item_health)
+
+        self.table.setItem(row, 3, QTableWidgetItem(state["db_status"]))
+        self.table.setItem(row, 4, QTableWidgetItem(state["id_status"]))
+        self.table.cellWidget(row, 5).setEnabled(state["action_needed"])
+
+        self.pending -= 1
+        done = self.table.rowCount() - self.pending
+        self.lbl_path.setText(f"Scanning Shots: {self.root_path} ({done}/{self.table.rowCount()})" if self.pending
+                              else f"Scanning Shots: {self.root_path}")
+
+    def plan(self, rows):
+        """A FixBatch for the given table rows, checked against a fresh copy of the shots table."""
+        shots = self.load_shots_table()
+        if shots is None:
+            QMessageBox.critical(self, "DB Error", "Could not read the shots table.")
+            return None
+        claimed = set()
+        items = []
+        for r in rows:
+            if r not in self.row_states:
+                continue
+            items.append(plan_shot_fix(self.orion, self.root_path, self.table.item(r, 0).text(),
+                                       self.table.item(r, 1).text(), self.row_states[r], shots, claimed))
+        return FixBatch(self.orion, "shot", items)
+
     def fix_row(self, row):
-        current_name = self.table.item(row, 0).text()
-        proposed_name = self.table.item(row, 1).text()
-        health = self.table.item(row, 2).text()
-        db_status = self.table.item(row, 3).text()
-        
-        current_physical_path = os.path.join(self.root_path, current_name)
-        final_physical_path = current_physical_path
+        if not self.resume_unfinished():
+            return
+        batch = self.plan([row])
+        if not batch or not batch.items:
+            return
+        item = batch.items[0]
 
         # 1. Rename
-        if "Wrong Name" in health:
-            if QMessageBox.question(self, "Rename", f"Rename {current_name} -> {proposed_name}?", QMessageBox.Yes|QMessageBox.No) == QMessageBox.Yes:
-                new_path = os.path.join(self.root_path, proposed_name)
-                try:
-                    os.rename(current_physical_path, new_path)
-                    final_physical_path = new_path
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", str(e))
-                    return
-
-        # 2. DB Updates
-        if db_status == "Old Name in DB":
-            self.orion.rename_shot_code_in_db(current_name, proposed_name)
-        elif db_status == "Missing":
-            self.orion.create_shot(proposed_name, 1001, 1100, "Migrated")
-
-        # 3. Structure & Tags
-        if "Missing" in health or "JSON" in health or "Update" in health:
-            self.orion.create_shot_structure(proposed_name) # Ensure folders exist
-            
-            # Fetch ID to ensure tag consistency
-            shot_data = self.orion.get_shot(proposed_name)
-            shot_id = shot_data['id'] if shot_data else proposed_name
-            
-            self.orion.create_meta_tag(final_physical_path, proposed_name, shot_id=shot_id)
-            self.orion.register_shot_path(proposed_name, final_physical_path)
-
-        self.scan_folders()
+        if item["rename"]:
+            if QMessageBox.question(self, "Rename", f"Rename {item['name']} -> {item['code']}?", QMessageBox.Yes|QMessageBox.No) != QMessageBox.Yes:
+                item["rename"] = False
+                item["dst"] = item["src"]
+        self.start_batch(batch)
 
     def fix_all(self):
-        for r in range(self.table.rowCount()):
-            if self.table.cellWidget(r, 5).isEnabled():
-                self.fix_row(r)
+        if not self.resume_unfinished():
+            return
+        batch = self.plan(self.enabled_rows(5))
+        if not batch or not batch.items:
+            return
+        skipped = len(batch.failed())
+        msg = f"Fix {batch.summary()}?"
+        if skipped:
+            msg += f"\n{skipped} can't be fixed and will be skipped."
+        if QMessageBox.question(self, "Fix All", msg, QMessageBox.Yes|QMessageBox.No) == QMessageBox.Yes:
+            self.start_batch(batch)
 
 #   ASSET TAB (New Functionality)  
-class AssetFixerTab(QWidget):
+class AssetFixerTab(FixerTab):
+    kind = "asset"
+
     def __init__(self, orion_inst):
         super().__init__()
         self.orion = orion_inst
         self.root_path = os.path.join(self.orion.get_root_dir(), "30_assets")
+        self.setup_runner(self.on_asset_analyzed)
         self.init_ui()
         self.scan_assets()
 
@@ -252,173 +358,102 @@ class AssetFixerTab(QWidget):
         self.btn_fix_all.setStyleSheet("background-color: #3498db; color: white; font-weight: bold; padding: 8px;")
         self.btn_fix_all.clicked.connect(self.fix_all)
         btn_layout.addStretch()
+        self.add_fix_buttons(btn_layout)
         btn_layout.addWidget(self.btn_fix_all)
         layout.addLayout(btn_layout)
         
         self.setLayout(layout)
 
-    def analyze_asset(self, name, full_path):
-        state = {
-            "issues": [],
-            "action_needed": False,
-            "db_status": "Unknown",
-            "path_status": "Unknown"
-        }
-
-        # 1. DB Check
-        asset_record = self.orion.get_asset(name)
-        if not asset_record:
-            state["db_status"] = "Missing"
-            state["issues"].append("Register in DB")
-        else:
-            state["db_status"] = "Exists"
-
-        # 2. Path Check
-        real_rel_path = self.orion.get_relative_path(full_path)
-        if asset_record:
-            db_path = asset_record['path']
-            if db_path != real_rel_path:
-                state["path_status"] = "Mismatch"
-                state["issues"].append("Update DB Path")
-            else:
-                state["path_status"] = "Synced"
-        else:
-            state["path_status"] = "N/A"
-
-        # 3. Meta Files Check
-        meta_json = os.path.join(full_path, "orion_meta.json")
-        has_id_marker = any(f.startswith(".id_") for f in os.listdir(full_path))
-        
-        if not os.path.exists(meta_json):
-            state["issues"].append("Missing Meta JSON")
-        if not has_id_marker:
-            state["issues"].append("Missing ID Tag")
+    def load_assets_table(self):
+        return load_assets(self.orion)
 
-        if state["issues"]:
-            state["action_needed"] = True
+    def analyze_asset(self, name, full_path, assets=None):
+        return audit_asset(self.orion, name, full_path, assets)
 
-        return state
+    def rescan(self):
+        self.scan_assets()
 
     def scan_assets(self):
         self.table.setRowCount(0)
         if not os.path.exists(self.root_path):
             return
 
+        assets = self.load_assets_table()
+
         items = sorted(os.listdir(self.root_path))
+        jobs = []
         row = 0
         for item in items:
             full_path = os.path.join(self.root_path, item)
             if not os.path.isdir(full_path) or item.startswith("."):
                 continue
 
-            state = self.analyze_asset(item, full_path)
             rel_path = self.orion.get_relative_path(full_path)
 
             self.table.insertRow(row)
             self.table.setItem(row, 0, QTableWidgetItem(item))
-
-            # Health
-            health_str = ", ".join(state["issues"]) if state["issues"] else "Healthy"
-            item_health = QTableWidgetItem(health_str)
-            if state["action_needed"]:
-                item_health.setBackground(QColor("#c0392b"))
-                item_health.setForeground(QColor("white"))
-            else:
-                item_health.setBackground(QColor("#27ae60"))
-                item_health.setForeground(QColor("white"))
-            self.table.setItem(row, 1, item_health)
-
-            self.table.setItem(row, 2, QTableWidgetItem(state["db_status"]))
-            self.table.setItem(row, 3, QTableWidgetItem(state["path_status"]))
+            self.table.setItem(row, 1, QTableWidgetItem("Scanning..."))
 
             btn_fix = QPushButton("Fix")
             btn_fix.clicked.connect(lambda ch, r=row: self.fix_row(r))
-            if not state["action_needed"]: btn_fix.setEnabled(False)
+            btn_fix.setEnabled(False)
             self.table.setCellWidget(row, 4, btn_fix)
 
             self.table.setItem(row, 5, QTableWidgetItem(rel_path))
+            jobs.append((row, (item, full_path, assets)))
             row += 1
 
-    def fix_row(self, row):
-        name = self.table.item(row, 0).text()
-        full_path = os.path.join(self.root_path, name)
-        
-        # 1. Determine ID and Type (Try to read existing meta first)
-        asset_id = None
-        asset_type = "Prop" # Default
-        meta_json = os.path.join(full_path, "orion_meta.json")
-        
-        if os.path.exists(meta_json):
-            try:
-                with open(meta_json, 'r') as f:
-                    d = json.load(f)
-                    asset_id = d.get("id")
-                    asset_type = d.get("asset_type", "Prop")
-            except: pass
-        
-        # If no ID found in meta, check .id_ marker
-        if not asset_id:
-            for f in os.listdir(full_path):
-                if f.startswith(".id_"):
-                    asset_id = f.replace(".id_", "")
-                    break
-        
-        # If still no ID, generate one
-        if not asset_id:
-            asset_id = str(uuid.uuid4())
+        self.lbl_path.setText(f"Scanning Assets: {self.root_path} (0/{len(jobs)})")
+        self.pending = len(jobs)
+        self.scan_token = self.runner.start(jobs, self.analyze_asset)
 
-        # 2. Fix DB
-        conn = self.orion.get_db_connection()
-        try:
-            rel_path = self.orion.get_relative_path(full_path)
-            
-            # Check if exists to decide INSERT or UPDATE
-            exists = conn.execute("SELECT 1 FROM assets WHERE name = ?", (name,)).fetchone()
-            
-            if not exists:
-                # Register new
-                conn.execute(
-                    "INSERT INTO assets (id, name, type, path, description, thumbnail_path) VALUES (?, ?, ?, ?, ?, ?)",
-                    (asset_id, name, asset_type, rel_path, "", "")
-                )
-                print(f"Registered asset: {name}")
-            else:
-                # Update Path
-                conn.execute("UPDATE assets SET path = ?, id = ? WHERE name = ?", (rel_path, asset_id, name))
-                print(f"Updated asset path: {name}")
-            
-            conn.commit()
-        except Exception as e:
-            QMessageBox.critical(self, "DB Error", str(e))
+    def on_asset_analyzed(self, token, row, state):
+        if token != self.scan_token or row >= self.table.rowCount():
             return
-        finally:
-            conn.close()
-
-        # 3. Fix Meta & Structure
-        # Ensure standard folders exist
-        for task_group, subfolders in self.orion.ASSET_TASKS.items():
-            group_path = os.path.join(full_path, task_group)
-            os.makedirs(group_path, exist_ok=True)
-            for sub in subfolders:
-                os.makedirs(os.path.join(group_path, sub), exist_ok=True)
-                
-        # Write Meta Tag
-        self.orion.asset_create_meta_tag(full_path, name, {"type": "asset", "asset_type": asset_type}, asset_id=asset_id)
-        
-        # Ensure .id_ marker
-        marker = os.path.join(full_path, f".id_{asset_id}")
-        if not os.path.exists(marker):
-            with open(marker, 'w') as f: f.write(name)
-            if os.name == 'nt':
-                import subprocess
-                subprocess.run(["attrib", "+h", marker], check=False, shell=True)
 
-        self.scan_assets()
+        # Health
+        health_str = ", ".join(state["issues"]) if state["issues"] else "Healthy"
+        item_health = QTableWidgetItem(health_str)
+        if state["action_needed"]:
+            item_health.setBackground(QColor("#c0392b"))
+            item_health.setForeground(QColor("white"))
+        else:
+            item_health.setBackground(QColor("#27ae60"))
+            item_health.setForeground(QColor("white"))
+        self.table.setItem(row, 1, item_health)
+
+        self.table.setItem(row, 2, QTableWidgetItem(state["db_status"]))
+        self.table.setItem(row, 3, QTableWidgetItem(state["path_status"]))
+        self.table.cellWidget(row, 4).setEnabled(state["action_needed"])
+
+        self.pending -= 1
+        done = self.table.rowCount() - self.pending
+        self.lbl_path.setText(f"Scanning Assets: {self.root_path} ({done}/{self.table.rowCount()})" if self.pending
+                              else f"Scanning Assets: {self.root_path}")
+
+    def plan(self, rows):
+        assets = self.load_assets_table()
+        if assets is None:
+            QMessageBox.critical(self, "DB Error", "Could not read the assets table.")
+            return None
+        items = [plan_asset_fix(self.orion, self.root_path, self.table.item(r, 0).text(), assets) for r in rows]
+        return FixBatch(self.orion, "asset", items)
+
+    def fix_row(self, row):
+        if not self.resume_unfinished():
+            return
+        batch = self.plan([row])
+        if batch:
+            self.start_batch(batch)
 
     def fix_all(self):
-        for r in range(self.table.rowCount()):
-            if self.table.cellWidget(r, 4).isEnabled():
-                self.fix_row(r)
+        if not self.resume_unfinished():
+            return
+        batch = self.plan(self.enabled_rows(4))
+        if not batch or not batch.items:
+            return
+        if QMessageBox.question(self, "Fix All", f"Fix {batch.summary()}?", QMessageBox.Yes|QMessageBox.No) == QMessageBox.Yes:
+            self.start_batch(batch)
 
 #   MAIN WINDOW  
 class OrionFixerWindow(QWidget):
@@ -0,0 +1,5 @@
+import os
+import sys
+
+#tests import the pipeline the same way the tools do, as core.xxxUtils
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
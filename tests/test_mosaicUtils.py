@@ -0,0 +1,53 @@
+import pytest
+
+from core.mosaicUtils import compute_mosaic_layout
+
+@pytest.mark.parametrize("num_inputs, cols, rows", [
+    (1, 1, 1),
+    (2, 2, 1),
+    (3, 2, 2),
+    (4, 2, 2),
+    (5, 3, 2),
+    (6, 3, 2),
+    (7, 3, 3),
+    (8, 3, 3),
+    (9, 3, 3),
+])
+def test_grid_shape(num_inputs, cols, rows):
+    layout = compute_mosaic_layout(num_inputs)
+    assert (layout["cols"], layout["rows"]) == (cols, rows)
+    assert len(layout["positions"]) == num_inputs
+    assert layout["cols"] * layout["rows"] >= num_inputs
+
+def test_tile_size_fills_canvas():
+    layout = compute_mosaic_layout(4, 1920, 1080)
+    assert (layout["tile_width"], layout["tile_height"]) == (960, 540)
+
+def test_even_dims():
+    #1000 / 3 = 333, 1000 / 2 = 500, 999 / 2 = 499
+    layout = compute_mosaic_layout(5, 1000, 999)
+    assert (layout["tile_width"], layout["tile_height"]) == (332, 498)
+
+    layout = compute_mosaic_layout(5, 1000, 999, even_dims=False)
+    assert (layout["tile_width"], layout["tile_height"]) == (333, 499)
+
+def test_even_dims_for_every_count():
+    for n in range(1, 10):
+        layout = compute_mosaic_layout(n, 1919, 1079)
+        assert layout["tile_width"] % 2 == 0
+        assert layout["tile_height"] % 2 == 0
+
+def test_positions():
+    layout = compute_mosaic_layout(5)
+    assert layout["positions"] == ["0_0", "w0_0", "w0+w1_0", "0_h0", "w0_h0"]
+    assert layout["layout"] == "0_0|w0_0|w0+w1_0|0_h0|w0_h0"
+
+def test_single_input():
+    layout = compute_mosaic_layout(1)
+    assert layout["positions"] == ["0_0"]
+    assert (layout["tile_width"], layout["tile_height"]) == (1920, 1080)
+
+@pytest.mark.parametrize("num_inputs", [0, -1])
+def test_needs_an_input(num_inputs):
+    with pytest.raises(ValueError):
+        compute_mosaic_layout(num_inputs)
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from core import publishUtils
+from core.publishUtils import LinkUnavailable, publish_folder, read_manifest
+
+def make_version(root):
+    src = os.path.join(root, "v001")
+    os.makedirs(os.path.join(src, "sub"))
+    for rel in ("a.1001.exr", os.path.join("sub", "b.1001.exr")):
+        with open(os.path.join(src, rel), "w") as f:
+            f.write(rel)
+    return src
+
+def test_publish_folder_links(tmp_path):
+    src = make_version(str(tmp_path))
+    dst = os.path.join(str(tmp_path), "PUBLISHED")
+    publish_folder(src, dst)
+    assert os.path.samefile(os.path.join(src, "a.1001.exr"), os.path.join(dst, "a.1001.exr"))
+    assert sorted(read_manifest(dst)["files"]) == ["a.1001.exr", "sub/b.1001.exr"]
+    assert sorted(os.listdir(str(tmp_path))) == ["PUBLISHED", "v001"]
+
+def test_no_links_asks_for_a_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(publishUtils, "PUBLISH_MODE", "copy")
+    src = make_version(str(tmp_path))
+    with pytest.raises(LinkUnavailable):
+        publish_folder(src, os.path.join(str(tmp_path), "PUBLISHED"))
+    assert os.listdir(str(tmp_path)) == ["v001"]
+
+def test_swap_errors_are_not_link_errors(tmp_path, monkeypatch):
+    def locked(staging, dst):
+        raise PermissionError("in use")
+    monkeypatch.setattr(publishUtils, "swap_in", locked)
+    src = make_version(str(tmp_path))
+    with pytest.raises(PermissionError) as info:
+        publish_folder(src, os.path.join(str(tmp_path), "PUBLISHED"))
+    assert not isinstance(info.value, LinkUnavailable)
+    assert os.listdir(str(tmp_path)) == ["v001"]
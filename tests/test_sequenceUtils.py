@@ -0,0 +1,37 @@
+from core.sequenceUtils import collapse_entries, split_frame
+
+def entries(*names):
+    return [(name, 100, 0.0) for name in names]
+
+def test_split_frame():
+    assert split_frame("plate.1001.exr") == ("plate.", "1001", ".exr")
+    assert split_frame("plate_0001.exr") == ("plate_", "0001", ".exr")
+    assert split_frame("shot_v002.1001.exr") == ("shot_v002.", "1001", ".exr")
+
+def test_no_frame():
+    assert split_frame("plate.exr") is None
+    assert split_frame("take2.exr") is None
+
+def test_versions_are_not_frames():
+    assert split_frame("shot_v001.exr") is None
+    assert split_frame("shot.V012.exr") is None
+
+def test_versioned_stills_stay_single():
+    names = ["shot_v001.exr", "shot_v002.exr", "shot_v003.exr"]
+    sequences, singles = collapse_entries("/renders", entries(*names))
+    assert sequences == []
+    assert [e[0] for e in singles] == names
+
+def test_collapse_sequence():
+    sequences, singles = collapse_entries("/renders", entries("plate.1001.exr", "plate.1002.exr", "plate.1003.exr", "notes.txt"))
+    assert len(sequences) == 1
+    seq = sequences[0]
+    assert (seq.head, seq.tail, seq.padding) == ("plate.", ".exr", 4)
+    assert seq.frames == [1001, 1002, 1003]
+    assert [e[0] for e in singles] == ["notes.txt"]
+
+def test_min_frames():
+    sequences, singles = collapse_entries("/renders", entries("plate.1001.exr"))
+    assert sequences == []
+    sequences, singles = collapse_entries("/renders", entries("plate.1001.exr"), min_frames=1)
+    assert sequences[0].frames == [1001]
@@ -0,0 +1,60 @@
+import os
+
+from core.textureUtils import group_textures, split_texture_name, udim_pattern, UDIM_TOKEN
+
+def test_split_texture_name():
+    assert split_texture_name("rock_BaseColor.1001.exr") == ("rock", "base_color", 1001, ".exr")
+    assert split_texture_name("rock_normal_gl.png") == ("rock", "normal", None, ".png")
+    assert split_texture_name("Rock_Roughness_1002.TIF") == ("rock", "specular_roughness", 1002, ".tif")
+    assert split_texture_name("readme.txt")[1] is None
+
+def test_udim_pattern():
+    assert udim_pattern("rock_col.1001.exr", 1001) == f"rock_col.{UDIM_TOKEN}.exr"
+    assert udim_pattern("rock1001_col.1001.exr", 1001) == f"rock1001_col.{UDIM_TOKEN}.exr"
+    assert udim_pattern("rock_col.exr", None) == "rock_col.exr"
+
+def test_groups_a_set():
+    sets = group_textures([
+        "rock_BaseColor.1001.exr", "rock_BaseColor.1002.exr",
+        "rock_Roughness.1001.exr", "rock_Roughness.1002.exr",
+        "rock_Normal.1001.exr",
+        "notes.txt", ".DS_Store",
+    ], "/tex")
+    assert list(sets) == ["rock"]
+    rock = sets["rock"]
+    assert sorted(rock.channels) == ["base_color", "normal", "specular_roughness"]
+    assert rock["base_color"].tiles == [1001, 1002]
+    assert rock["base_color"].path == os.path.join("/tex", "rock_BaseColor.<UDIM>.exr")
+    assert rock.missing_tiles() == {"normal": [1002]}
+
+def test_preferred_format_wins():
+    rock = group_textures(["rock_col.png", "rock_col.exr", "rock_col.jpg"])["rock"]
+    assert rock["base_color"].ext == ".exr"
+    assert [a.ext for a in rock["base_color"].alternates] == [".png", ".jpg"]
+
+def test_patterns_are_not_merged():
+    #same channel and format, two naming schemes: tile 1002 must not point at a file that doesn't exist
+    rock = group_textures(["rock_BaseColor.1001.exr", "rock_BaseColor.1002.exr", "rock.1001.basecolor.exr"], "/tex")["rock"]
+    color = rock["base_color"]
+    assert color.files == {1001: "rock_BaseColor.1001.exr", 1002: "rock_BaseColor.1002.exr"}
+    assert color.path == os.path.join("/tex", "rock_BaseColor.<UDIM>.exr")
+    assert len(color.alternates) == 1
+    assert color.alternates[0].files == {1001: "rock.1001.basecolor.exr"}
+
+def test_same_tile_in_two_patterns():
+    rock = group_textures(["rock_diffuse_1001.tif", "rock_col.1001.tif"])["rock"]
+    color = rock["base_color"]
+    kept = [color.files[1001]] + [a.files[1001] for a in color.alternates]
+    assert sorted(kept) == ["rock_col.1001.tif", "rock_diffuse_1001.tif"]
+    assert rock.owns("rock_diffuse_1001.tif")
+    assert rock.owns("rock_col.1001.tif")
+
+def test_tiled_and_single_file_stay_apart():
+    color = group_textures(["rock_col.exr", "rock_col.1001.exr", "rock_col.1002.exr"])["rock"]["base_color"]
+    assert color.tiles == [1001, 1002]
+    assert [a.files for a in color.alternates] == [{None: "rock_col.exr"}]
+
+def test_separate_sets():
+    sets = group_textures(["rock_col.exr", "rock_rough.exr", "moss_col.exr"])
+    assert sorted(sets) == ["moss", "rock"]
+    assert "specular_roughness" not in sets["moss"]
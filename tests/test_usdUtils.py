@@ -0,0 +1,96 @@
+import pytest
+
+pytest.importorskip("pxr")
+from pxr import Sdf
+
+from core.usdUtils import plan_namespace_strip, strip_namespaces
+
+def make_layer(paths, default_prim=None):
+    layer = Sdf.Layer.CreateAnonymous(".usda")
+    for path in paths:
+        Sdf.CreatePrimInLayer(layer, path)
+    if default_prim:
+        layer.defaultPrim = default_prim
+    return layer
+
+def child_names(layer, path):
+    return sorted(c.name for c in layer.GetPrimAtPath(path).nameChildren)
+
+def chain(depth, name):
+    return "/" + "/".join(f"{name}{i}" for i in range(depth))
+
+def test_strips_prefix():
+    layer = make_layer(["/ns_root/ns_geo/ns_mesh", "/ns_root/plain"])
+    report = strip_namespaces(layer, "ns_")
+    assert layer.GetPrimAtPath("/root/geo/mesh")
+    assert layer.GetPrimAtPath("/root/plain")
+    assert report["prims"] == 4
+    assert report["renamed"] == 3
+    assert report["skipped"] == []
+
+def test_empty_prefix_does_nothing():
+    layer = make_layer(["/ns_root"])
+    assert strip_namespaces(layer, "")["renamed"] == 0
+    assert layer.GetPrimAtPath("/ns_root")
+
+def test_renames_run_deepest_first():
+    layer = make_layer(["/ns_a/ns_b/ns_c"])
+    renames, skipped, count = plan_namespace_strip(layer, "ns_")
+    assert [str(path) for path, _ in renames] == ["/ns_a/ns_b/ns_c", "/ns_a/ns_b", "/ns_a"]
+    assert [name for _, name in renames] == ["c", "b", "a"]
+
+def test_clash_with_kept_sibling():
+    layer = make_layer(["/grp/ns_a", "/grp/a", "/grp/ns_b"])
+    report = strip_namespaces(layer, "ns_")
+    assert child_names(layer, "/grp") == ["a", "b", "ns_a"]
+    assert report["skipped"] == ["/grp/ns_a"]
+
+def test_stripped_names_swapping_places():
+    #ns_a -> a and ns_ns_a -> ns_a only reuse a name that is going away
+    layer = make_layer(["/grp/ns_a", "/grp/ns_ns_a"])
+    report = strip_namespaces(layer, "ns_")
+    assert child_names(layer, "/grp") == ["a", "ns_a"]
+    assert report["skipped"] == []
+
+def test_two_stripped_to_the_same_name():
+    #ns_a can't become a (kept sibling), so it keeps its name, and then ns_ns_a
+    #stripping to ns_a clashes with it too
+    layer = make_layer(["/grp/a", "/grp/ns_a", "/grp/ns_ns_a"])
+    report = strip_namespaces(layer, "ns_")
+    assert child_names(layer, "/grp") == ["a", "ns_a", "ns_ns_a"]
+    assert sorted(report["skipped"]) == ["/grp/ns_a", "/grp/ns_ns_a"]
+    assert report["renamed"] == 0
+
+def test_invalid_identifiers_are_skipped():
+    layer = make_layer(["/grp/ns_1abc", "/grp/ns_ok"])
+    renames, skipped, count = plan_namespace_strip(layer, "ns_")
+    assert [str(p) for p in skipped] == ["/grp/ns_1abc"]
+    assert [(str(p), n) for p, n in renames] == [("/grp/ns_ok", "ok")]
+
+def test_deep_chain_plan():
+    depth = 1500
+    layer = make_layer([chain(depth, "ns_p")])
+    renames, skipped, count = plan_namespace_strip(layer, "ns_")
+    assert count == depth
+    assert len(renames) == depth
+    assert renames[0][0].pathElementCount == depth
+    assert skipped == []
+
+def test_deep_chain_strip():
+    depth = 1500
+    #only the leaf is namespaced, the walk still has to get all the way down
+    layer = make_layer([chain(depth - 1, "p") + "/ns_leaf"])
+    report = strip_namespaces(layer, "ns_")
+    assert report["prims"] == depth
+    assert report["renamed"] == 1
+    assert layer.GetPrimAtPath(chain(depth - 1, "p") + "/leaf")
+
+def test_default_prim_is_updated():
+    layer = make_layer(["/ns_root/geo"], default_prim="ns_root")
+    strip_namespaces(layer, "ns_")
+    assert layer.defaultPrim == "root"
+
+def test_default_prim_kept_when_root_is_skipped():
+    layer = make_layer(["/ns_root", "/root"], default_prim="ns_root")
+    strip_namespaces(layer, "ns_")
+    assert layer.defaultPrim == "ns_root"
@@ -3,7 +3,6 @@ import os
 import subprocess
 import json
 
-import shutil
 
 import re
 import uuid
@@ -47,6 +46,23 @@ except ImportError:
         print(f"CRITICAL ERROR: Could not import SystemUtils.\nChecked path: {orion_package_root}\nError: {e}")
         sys.exit()
 
+try:
+    from core.sequenceUtils import collapse_entries
+    from core.listingUtils import ListingCache, list_dir, list_exports, scan_item_tree
+    from core.thumbnailUtils import ThumbnailService
+    from core.cacheUtils import DiskCache, MemoryLRU, get_local_cache_dir, make_cache_key
+    from core.launchUtils import CLICK_TIME_ENV
+    from core.transferUtils import TransferManager
+    from core.publishUtils import link_publish, record_publish, forget_publish
+except ImportError:
+    from orionTech.core.sequenceUtils import collapse_entries
+    from orionTech.core.listingUtils import ListingCache, list_dir, list_exports, scan_item_tree
+    from orionTech.core.thumbnailUtils import ThumbnailService
+    from orionTech.core.cacheUtils import DiskCache, MemoryLRU, get_local_cache_dir, make_cache_key
+    from orionTech.core.launchUtils import CLICK_TIME_ENV
+    from orionTech.core.transferUtils import TransferManager
+    from orionTech.core.publishUtils import link_publish, record_publish, forget_publish
+
 orion_utils = OrionUtils(check_schema=False)
 pref_utils = PrefsUtils(orion_utils)
 system_utils = SystemUtils(orion_utils, pref_utils)
@@ -80,6 +96,27 @@ except ImportError as e:
     print(f"Warning: Could not import mari_launcher: {e}")
     launch_mari = None
 
+#in-process launches, set ORI_WARM_LAUNCH=0 to start a python launcher subprocess per click instead
+WARM_LAUNCH = os.environ.get("ORI_WARM_LAUNCH", "1") != "0"
+
+#software: (launch function, launcher script for the subprocess path)
+DCC_LAUNCHERS = {
+    "maya": (launch_maya, os.path.join("dcc", "maya", "maya_launcher.py")),
+    "nuke": (launch_nuke, os.path.join("dcc", "nuke", "nuke_launcher.py")),
+    "houdini": (launch_houdini, os.path.join("dcc", "houdini", "houdini_launcher.py")),
+    "mari": (launch_mari, os.path.join("dcc", "mari", "mari_launcher.py")),
+}
+
+#file extension: software
+DCC_EXTENSIONS = {
+    ".ma": "maya",
+    ".mb": "maya",
+    ".nk": "nuke",
+    ".hip": "houdini",
+    ".hipnc": "houdini",
+    ".mari": "mari",
+}
+
 #success flag
 import_success = False
 
@@ -89,14 +126,18 @@ for attempt in range(3):
         #try to import module
         from PyQt5.QtWidgets import (
             QApplication, QWidget, QLabel, QPushButton,
-            QVBoxLayout, QHBoxLayout, QFrame, QGridLayout,
-            QSizePolicy, QScrollArea, QSplitter, QInputDialog,
+            QVBoxLayout, QHBoxLayout, QFrame,
+            QScrollArea, QSplitter, QInputDialog,
             QMessageBox, QLineEdit, QSpinBox, QTextEdit,
             QFormLayout, QFileDialog, QMenu, QAction, QComboBox, 
-            QAbstractButton, QStackedWidget, QCheckBox
+            QAbstractButton, QStackedWidget, QCheckBox,
+            QListView, QAbstractItemView, QStyledItemDelegate, QStyle
+        )
+        from PyQt5.QtCore import (
+            Qt, pyqtSignal, QSize, QRect, QPoint, QObject, QRunnable, QThreadPool,
+            QAbstractListModel, QModelIndex, QSortFilterProxyModel
         )
-        from PyQt5.QtCore import Qt, pyqtSignal, QSize, QRect
-        from PyQt5.QtGui import QPixmap, QPainter
+        from PyQt5.QtGui import QPixmap, QPainter, QImage, QImageReader, QColor, QFont, QPen
         
         #if we get here imports worked
         import_success = True
@@ -133,8 +174,28 @@ for attempt in range(3):
 if not import_success:
     sys.exit()
     
-#dictionary to cache loaded thumbnails
-THUMB_CACHE = {}
+#two tier thumbnail cache: scaled pixmaps in memory, scaled jpegs on the local disk
+#(override budgets with ORI_THUMB_MEMORY_MB / ORI_THUMB_LOCAL_MB)
+THUMB_MEMORY_MB = int(os.environ.get("ORI_THUMB_MEMORY_MB", "256"))
+THUMB_LOCAL_MB = int(os.environ.get("ORI_THUMB_LOCAL_MB", "512"))
+
+THUMB_CACHE = MemoryLRU(max_bytes=THUMB_MEMORY_MB * 1024 * 1024)
+THUMB_DISK_CACHE = None
+
+#background image decoding (created on first use)
+IMAGE_DECODER = None
+
+#background folder listing etc (created on first use)
+BACKGROUND_RUNNER = None
+
+
+#background thumbnail generation (created on first use)
+THUMB_SERVICE = None
+THUMB_LOADER = None
+
+#background publish/unpublish copies (created on first use)
+TRANSFER_MANAGER = None
+TRANSFER_BRIDGE = None
 
 # STYLE NOTES:
 # ORION ORANGE = #FF6000
@@ -150,33 +211,336 @@ def get_scrollbar_style(bg_color):
         QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
     """
 
+def get_thumb_disk_cache():
+    global THUMB_DISK_CACHE
+    if THUMB_DISK_CACHE is None:
+        THUMB_DISK_CACHE = DiskCache(get_local_cache_dir("launcher_thumbs"), max_bytes=THUMB_LOCAL_MB * 1024 * 1024, ext=".jpg")
+    return THUMB_DISK_CACHE
+
+def get_thumb_cache_stats():
+    """Hit rates for both thumbnail cache tiers."""
+    return {"memory": THUMB_CACHE.stats(), "disk": get_thumb_disk_cache().stats()}
+
 def get_cached_pixmap(path, target_size):
     """
-    Loads, scales, and caches pixmaps for fast reuse.
+    Returns the scaled pixmap for path if it is already in memory, else None.
+    Anything else goes through the ImageDecoder so the GUI thread never decodes.
     """
-    if not path or not os.path.exists(path):
+    if not path:
         return None
+    return THUMB_CACHE.get((path, target_size.width(), target_size.height()))
 
-    #id to store path and size
+def cache_pixmap(path, target_size, image):
+    """Turns a decoded QImage into a pixmap (GUI thread only) and keeps it in memory."""
+    pixmap = QPixmap.fromImage(image)
     key = (path, target_size.width(), target_size.height())
-    #check if in dictionary, return already present entry
-    if key in THUMB_CACHE:
-        return THUMB_CACHE[key]
-
-    pixmap = QPixmap(path)
-    if pixmap.isNull():
-        return None
-    #scale to fit target size
-    pixmap = pixmap.scaled(
-        target_size,
-        Qt.KeepAspectRatio,
-        Qt.SmoothTransformation
-    )
-
-    #store in cache
-    THUMB_CACHE[key] = pixmap
+    THUMB_CACHE.put(key, pixmap, pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8))
     return pixmap
 
+def read_scaled_image(path, width, height):
+    """
+    Decodes path at (at most) width x height. The reader shrinks the image
+    while decoding where the format allows it, instead of loading full res and scaling.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    src_size = reader.size()
+    if src_size.isValid() and (src_size.width() > width or src_size.height() > height):
+        reader.setScaledSize(src_size.scaled(width, height, Qt.KeepAspectRatio))
+    return reader.read()
+
+def load_scaled_image(path, width, height):
+    """
+    Returns a QImage of path fitting width x height, going through the local disk tier.
+    Only uses QImage so it is safe to call from worker threads.
+    """
+    if not path or not os.path.exists(path):
+        return QImage()
+
+    #local disk tier, keyed by path + size + mtime so edits invalidate it
+    disk_cache = get_thumb_disk_cache()
+    disk_key = make_cache_key([path], {"w": width, "h": height})
+    cached_path = disk_cache.get(disk_key)
+
+    image = read_scaled_image(cached_path, width, height) if cached_path else QImage()
+    if image.isNull():
+        image = read_scaled_image(path, width, height)
+        if image.isNull():
+            return image
+
+        if disk_key:
+            temp_path = disk_cache.temp_path_for(disk_key)
+            if image.save(temp_path, "JPG", 90):
+                disk_cache.commit(disk_key, temp_path)
+    return image
+
+class DecodeJob(QRunnable):
+    """One image to decode on the decoder pool."""
+
+    def __init__(self, decoder, token, path, width, height):
+        super().__init__()
+        #the decoder keeps the python reference until the result comes back
+        self.setAutoDelete(False)
+        self.decoder = decoder
+        self.token = token
+        self.path = path
+        self.width = width
+        self.height = height
+        self.cancelled = False
+
+    def run(self):
+        image = QImage()
+        if not self.cancelled:
+            try:
+                image = load_scaled_image(self.path, self.width, self.height)
+            except Exception as e:
+                print(f"Error decoding {self.path}: {e}")
+        #always report back so the decoder can drop the job
+        self.decoder.decoded.emit(self.token, image)
+
+def get_image_decoder():
+    global IMAGE_DECODER
+    if IMAGE_DECODER is None:
+        IMAGE_DECODER = ImageDecoder()
+    return IMAGE_DECODER
+
+class ImageDecoder(QObject):
+    """
+    Decodes thumbnails on a small thread pool and hands the QImages back
+    to the requesting cards on the GUI thread. Requests can be cancelled,
+    e.g. when a card scrolls out of view before its turn comes.
+    """
+    decoded = pyqtSignal(int, QImage)
+
+    def __init__(self, max_threads=4):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(1, min(max_threads, QThreadPool.globalInstance().maxThreadCount())))
+        self.jobs = {}
+        self.waiting = {}
+        self.next_token = 0
+        #emitted from worker threads, queued onto the GUI thread
+        self.decoded.connect(self.on_decoded)
+
+    def request(self, card, path, target_size):
+        self.next_token += 1
+        token = self.next_token
+        job = DecodeJob(self, token, path, target_size.width(), target_size.height())
+        self.jobs[token] = job
+        self.waiting[token] = card
+        self.pool.start(job)
+        return token
+
+    def cancel(self, token):
+        self.waiting.pop(token, None)
+        job = self.jobs.get(token)
+        if job is None:
+            return
+        job.cancelled = True
+        #not started yet, take it out of the queue
+        if self.pool.tryTake(job):
+            self.jobs.pop(token, None)
+
+    def cancel_all(self):
+        for token in list(self.waiting):
+            self.cancel(token)
+
+    def on_decoded(self, token, image):
+        self.jobs.pop(token, None)
+        card = self.waiting.pop(token, None)
+        if card is None:
+            return
+        try:
+            card.on_image_decoded(image)
+        except RuntimeError:
+            #card was deleted while waiting
+            pass
+
+class BackgroundJob(QRunnable):
+    """Runs one function on the background runner pool."""
+
+    def __init__(self, runner, token, func, args):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.runner = runner
+        self.token = token
+        self.func = func
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            print(f"Background job {self.func.__name__} failed: {e}")
+            result = None
+        self.runner.finished.emit(self.token, result)
+
+def get_background_runner():
+    global BACKGROUND_RUNNER
+    if BACKGROUND_RUNNER is None:
+        BACKGROUND_RUNNER = BackgroundRunner()
+    return BACKGROUND_RUNNER
+
+class BackgroundRunner(QObject):
+    """
+    Runs slow functions (folder scans on the share) off the GUI thread and
+    calls back on the GUI thread with the result. Cancelled tokens are
+    dropped, so a late scan of a folder the user already left never shows up.
+    """
+    finished = pyqtSignal(int, object)
+
+    def __init__(self, max_threads=4):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self.jobs = {}
+        self.callbacks = {}
+        self.next_token = 0
+        self.finished.connect(self.on_finished)
+
+    def run(self, func, *args, callback=None):
+        self.next_token += 1
+        token = self.next_token
+        job = BackgroundJob(self, token, func, args)
+        self.jobs[token] = job
+        if callback:
+            self.callbacks[token] = callback
+        self.pool.start(job)
+        return token
+
+    def cancel(self, token):
+        self.callbacks.pop(token, None)
+        job = self.jobs.get(token)
+        if job is not None and self.pool.tryTake(job):
+            self.jobs.pop(token, None)
+
+    def on_finished(self, token, result):
+        self.jobs.pop(token, None)
+        callback = self.callbacks.pop(token, None)
+        if callback:
+            callback(result)
+
+def list_gallery_items(folder_path, exclude_dirs=None):
+    """
+    Lists a task folder for the gallery, newest first.
+    Returns a list of (mtime, name, full path, sequence or None). Runs off the GUI thread.
+    """
+    #one scandir pass
+    _, files = list_dir(folder_path)
+    return gallery_items_from_files(folder_path, files, exclude_dirs)
+
+def gallery_items_from_files(folder_path, files, exclude_dirs=None):
+    """Same as list_gallery_items but from an existing (name, size, mtime) listing."""
+    exclude_dirs = exclude_dirs or []
+
+    #numbered images are collapsed into sequences
+    sequences, singles = collapse_entries(folder_path, files)
+
+    items = []
+    for seq in sequences:
+        items.append((seq.mtime, seq.name, seq.path(seq.start), seq))
+    for name, size, mtime in singles:
+        if name in exclude_dirs: continue
+        items.append((mtime, name, os.path.join(folder_path, name), None))
+
+    items.sort(key=lambda x: x[0], reverse=True)
+    return items
+
+def warm_launch(launch_func, file_path, context, orion, click_time):
+    """Runs a DCC launch function inside the launcher process (on a worker thread)."""
+    return launch_func(file_path=file_path, orion=orion, click_time=click_time, **context)
+
+def get_thumbnail_service():
+    global THUMB_SERVICE
+    if THUMB_SERVICE is None:
+        THUMB_SERVICE = ThumbnailService(root_dir=orion_utils.get_root_dir())
+    return THUMB_SERVICE
+
+def get_thumbnail_loader():
+    global THUMB_LOADER
+    if THUMB_LOADER is None:
+        THUMB_LOADER = ThumbnailLoader()
+    return THUMB_LOADER
+
+class ThumbnailLoader(QObject):
+    """
+    Asks the thumbnail service for thumbnails and hands the results
+    from its worker threads back to the cards on the GUI thread.
+    """
+    ready = pyqtSignal(str, str)
+
+    def __init__(self):
+        super().__init__()
+        self.waiting = {}
+        self.ready.connect(self.on_ready)
+
+    def request(self, card, source_path):
+        self.waiting.setdefault(source_path, []).append(card)
+        get_thumbnail_service().submit(source_path, self.emit_ready)
+
+    def emit_ready(self, path, thumb):
+        #called on a worker thread, signal is queued to the GUI thread
+        self.ready.emit(path, thumb or "")
+
+    def on_ready(self, path, thumb):
+        for card in self.waiting.pop(path, []):
+            try:
+                card.on_thumbnail_ready(thumb)
+            except RuntimeError:
+                #card was deleted while waiting
+                pass
+
+def get_transfer_manager():
+    global TRANSFER_MANAGER
+    if TRANSFER_MANAGER is None:
+        TRANSFER_MANAGER = TransferManager()
+    return TRANSFER_MANAGER
+
+def get_transfer_bridge():
+    global TRANSFER_BRIDGE
+    if TRANSFER_BRIDGE is None:
+        TRANSFER_BRIDGE = TransferBridge()
+    return TRANSFER_BRIDGE
+
+class TransferBridge(QObject):
+    """
+    Queues copies/moves on the transfer manager and re-emits their progress
+    and results on the GUI thread. Progress is throttled so a big copy
+    doesn't flood the event loop.
+    """
+    progress = pyqtSignal(object)
+    finished = pyqtSignal(object)
+
+    def __init__(self, interval=0.1):
+        super().__init__()
+        self.interval = interval
+        self.last_emit = {}
+        self.callbacks = {}
+        self.finished.connect(self.on_finished)
+
+    def submit(self, src, dst, mode="copy", callback=None):
+        job = get_transfer_manager().submit(src, dst, mode=mode, callback=self.emit_finished, progress=self.emit_progress)
+        if callback:
+            self.callbacks[id(job)] = callback
+        return job
+
+    def emit_progress(self, job):
+        #called on a worker thread
+        now = time.time()
+        if now - self.last_emit.get(id(job), 0) < self.interval:
+            return
+        self.last_emit[id(job)] = now
+        self.progress.emit(job)
+
+    def emit_finished(self, job):
+        self.finished.emit(job)
+
+    def on_finished(self, job):
+        self.last_emit.pop(id(job), None)
+        callback = self.callbacks.pop(id(job), None)
+        if callback:
+            callback(job)
+
 def get_path_variants(path):
     r"""
     Returns a dictionary with 'work' and 'home' keys containing the path
@@ -358,59 +722,6 @@ class ExportItemWidget(QFrame):
         self.update_style()
 
 #Represents Shot / Asset with thumbnail
-class ShotButton(QPushButton):
-    def __init__(self, text, color, full_data=None):
-        super().__init__()
-        self.setMinimumHeight(100)
-        self.text_label = text
-        self.full_data = full_data or {}
-        self.is_active = False
-        self.default_color = color
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(15, 10, 15, 10)
-
-        self.lbl = QLabel(text)
-        self.box = QLabel()
-        self.box.setFixedSize(142, 80)
-        self.box.setAlignment(Qt.AlignCenter)
-        self.box.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-
-        layout.addWidget(self.lbl)
-        layout.addStretch()
-        layout.addWidget(self.box)
-        self.update_style()
-
-    def set_active(self, active):
-        self.is_active = active
-        self.update_style()
-
-    def update_style(self):
-        if self.is_active:
-            btn_style = "QPushButton { background-color: white; border-radius: 8px; border: none; text-align: left; }"
-            txt_color = "#222"
-        else:
-            btn_style = "QPushButton { background-color: #3c3c3c; border-radius: 8px; border: none; text-align: left; } QPushButton:hover { background-color: #4d4d4d; }"
-            txt_color = "white"
-
-        self.setStyleSheet(btn_style)
-        self.lbl.setStyleSheet(f"color: {txt_color}; font-weight: bold; font-size: 14px; border: none; background: transparent;")
-
-        self.box.setStyleSheet("border: 1px solid #555; border-radius: 4px;")
-        
-        # Load thumbnail 
-        thumb_path = self.full_data.get("thumbnail_path")
-        if thumb_path and isinstance(thumb_path, str) and thumb_path.strip():
-            clean_path = thumb_path.strip().replace("\\", "/")
-            self.box.setStyleSheet(f"""
-                border-image: url('{clean_path}') 0 0 0 0 stretch stretch;
-                border-radius: 4px;
-                border: 1px solid #555;
-            """)
-            self.box.setText("") 
-        else:
-            self.box.setStyleSheet(f"background-color: {self.default_color}; border-radius: 4px;")
-
 class SpecButton(QPushButton):
     def __init__(self, text, color):
         super().__init__()
@@ -567,9 +878,8 @@ class SpecialismGroup(QWidget):
             if child.widget(): child.widget().deleteLater()
 
         if os.path.exists(self.full_path):
-            items = sorted([d for d in os.listdir(self.full_path) if os.path.isdir(os.path.join(self.full_path, d))])
-            ignore = ["__pycache__"]
-            items = [i for i in items if i not in ignore and not i.startswith(".")]
+            #usually already prefetched with the rest of the shot
+            items, _ = self.parent_ui.list_folder(self.full_path)
 
             for task in items:
                 color = "#ff33cc" 
@@ -601,6 +911,7 @@ class SpecialismGroup(QWidget):
                 os.makedirs(export_path, exist_ok=True)
                 os.makedirs(published_path, exist_ok=True)
 
+                self.parent_ui.listing_cache.invalidate(self.full_path)
                 self.populate_tasks() 
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
@@ -710,83 +1021,58 @@ class ContextSwitch(QFrame):
             self.btn_assets.setStyleSheet(inactive)
             self.btn_shots.setStyleSheet(active)
 
-class ThumbnailCard(QFrame):
-    clicked = pyqtSignal(object)
-    double_clicked = pyqtSignal(object)
-    action_triggered = pyqtSignal(str, object)
+#role used to get the GalleryItem back out of the model
+GALLERY_ITEM_ROLE = Qt.UserRole + 1
 
-    def __init__(self, filename, full_path, fallback_color, file_type="standard"):
-        super().__init__()
+#card and image sizes in the gallery
+CARD_SIZE = QSize(300, 250)
+THUMB_AREA = QSize(280, 180)
 
+class GalleryItem:
+    """
+    One file (or collapsed sequence) in the gallery. Plain data, the
+    GalleryDelegate paints it, so big folders don't create any widgets.
+    """
+
+    def __init__(self, filename, full_path, fallback_color, sequence=None, mtime=0):
         self.filename = filename
         self.full_path = full_path
-        self.file_type = file_type
-
-        self.is_selected = False
+        self.fallback_color = fallback_color
+        self.sequence = sequence
+        self.mtime = mtime
         self.is_published = False
-        self.pixmap_loaded = False
-
-        self.setFixedHeight(250)
-        self.setFixedWidth(300)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.setObjectName("ThumbnailCard")
 
-        # Resolve thumbnail path
-        self.thumb_path = self._resolve_thumbnail_path()
-
-        # Layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(6)
-
-        # Image area
-        self.image_area = QLabel()
-        self.image_area.setFixedHeight(180)
-        self.image_area.setFixedWidth(280)
-        self.image_area.setAlignment(Qt.AlignCenter)
-        #clicks pass through
-        self.image_area.setAttribute(Qt.WA_TransparentForMouseEvents) 
-        self.image_area.setStyleSheet(
-            f"background-color: {fallback_color}; border-radius: 6px;"
-        )
-
-        layout.addWidget(self.image_area)
-
-        # Filename
-        self.name_lbl = QLabel(filename)
-        self.name_lbl.setWordWrap(True)
-        self.name_lbl.setAttribute(Qt.WA_TransparentForMouseEvents) 
-        self.name_lbl.setStyleSheet(
-            "color: white; font-weight: bold; font-size: 12px;"
-        )
-        layout.addWidget(self.name_lbl)
-
-        # Published label
-        self.status_lbl = QLabel("PUBLISHED ✓")
-        self.status_lbl.setAttribute(Qt.WA_TransparentForMouseEvents) 
-        self.status_lbl.setStyleSheet(
-            "color: #00ff00; font-size: 11px; font-weight: bold;"
-        )
-        self.status_lbl.hide()
-        layout.addWidget(self.status_lbl)
+        # Thumbnail source (middle frame for sequences)
+        if self.sequence:
+            self.source_path = self.sequence.path(self.sequence.middle_frame)
+            self.info = f"{self.sequence.frame_range_string()}  ({self.sequence.count} frames)"
+        else:
+            self.source_path = self.full_path
+            self.info = ""
 
-        self.update_border()
+        self.thumb_path = None
+        self.thumb_requested = False
+        self.no_thumbnail = False
+        self.decode_token = None
 
+        #set by the model, cleared when the model drops the item
+        self.model = None
+        self.row = -1
 
-    # Thumbnail resolution
     def _resolve_thumbnail_path(self):
         """
-        Determines the best thumbnail path to use.
+        Determines the best thumbnail path to use without the thumbnail service.
         """
-        base_dir = os.path.dirname(self.full_path)
-        base_name, ext = os.path.splitext(self.filename)
+        base_dir = os.path.dirname(self.source_path)
+        base_name, ext = os.path.splitext(os.path.basename(self.source_path))
         ext = ext.lower()
 
-        valid_img_exts = {'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.exr'}
+        #formats Qt can read directly
+        valid_img_exts = {'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'}
 
         #already an image, prefer it
         if ext in valid_img_exts:
-            return self.full_path
+            return self.source_path
 
         # Look for generated thumbnails
         thumb = os.path.join(base_dir, "thumbnails", base_name + ".jpg")
@@ -800,75 +1086,271 @@ class ThumbnailCard(QFrame):
 
         return None
 
-    # Lazy loading
-    def showEvent(self, event):
+    def on_thumbnail_ready(self, thumb):
         """
-        Lazy-load the pixmap only when widget becomes visible.
-        """
-        super().showEvent(event)
-        if not self.pixmap_loaded:
-            self.load_thumbnail()
-
-    def load_thumbnail(self):
-        """
-        Loads thumbnail pixmap using cache.
+        Called on the GUI thread once the service has a 280x180 thumbnail.
+        Falls back to reading the file directly if none could be made.
         """
+        self.thumb_path = thumb or self._resolve_thumbnail_path()
         if not self.thumb_path:
+            self.no_thumbnail = True
+        if self.model:
+            self.model.thumbnail_changed(self)
+
+    def on_image_decoded(self, image):
+        self.decode_token = None
+        if self.model:
+            self.model.decoding.discard(self)
+        if image.isNull():
+            self.no_thumbnail = True
+            return
+        cache_pixmap(self.thumb_path, THUMB_AREA, image)
+        if self.model:
+            self.model.thumbnail_changed(self)
+
+class GalleryModel(QAbstractListModel):
+    """
+    List of GalleryItems. Thumbnails are only requested from data(), which
+    the view only calls for rows it is actually painting.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+        #items with a decode queued, so scrolling can cancel them cheaply
+        self.decoding = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+
+        if role == Qt.DisplayRole:
+            return item.filename
+        if role == Qt.ToolTipRole:
+            return item.full_path
+        if role == GALLERY_ITEM_ROLE:
+            return item
+        if role == Qt.DecorationRole:
+            pixmap = get_cached_pixmap(item.thumb_path, THUMB_AREA)
+            if pixmap is None:
+                self.request_thumbnail(item)
+            return pixmap
+        return None
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self.cancel_decodes()
+        for item in self.items:
+            item.model = None
+        self.items = list(items)
+        for row, item in enumerate(self.items):
+            item.model = self
+            item.row = row
+        self.endResetModel()
+
+    def clear(self):
+        self.set_items([])
+
+    def item(self, row):
+        if 0 <= row < len(self.items):
+            return self.items[row]
+        return None
+
+    def request_thumbnail(self, item):
+        if item.no_thumbnail:
+            return
+        if not item.thumb_requested:
+            item.thumb_requested = True
+            get_thumbnail_loader().request(item, item.source_path)
+        elif item.thumb_path and not item.decode_token:
+            item.decode_token = get_image_decoder().request(item, item.thumb_path, THUMB_AREA)
+            self.decoding.add(item)
+
+    def thumbnail_changed(self, item):
+        index = self.index(item.row)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def cancel_decodes(self, keep_rows=None):
+        """Cancels queued decodes, except for rows in keep_rows (a range of visible rows)."""
+        for item in list(self.decoding):
+            if keep_rows is not None and item.row in keep_rows:
+                continue
+            get_image_decoder().cancel(item.decode_token)
+            item.decode_token = None
+            self.decoding.discard(item)
+
+    def set_published(self, row, published=True):
+        item = self.item(row)
+        if item:
+            item.is_published = published
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+class GalleryDelegate(QStyledItemDelegate):
+    """Paints a gallery item as a card: thumbnail, name, frame range and published state."""
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def paint(self, painter, option, index):
+        item = index.data(GALLERY_ITEM_ROLE)
+        if item is None:
             return
 
-        pixmap = get_cached_pixmap(self.thumb_path, self.image_area.size())
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRect(option.rect.topLeft(), CARD_SIZE).adjusted(2, 2, -2, -2)
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        #card background + border
+        painter.setBrush(QColor("#333333" if hovered and not selected and not item.is_published else "#1e1e1e"))
+        if selected:
+            painter.setPen(QPen(QColor("#FF6000"), 3))
+        elif item.is_published:
+            painter.setPen(QPen(QColor("#00ff00"), 3))
+        else:
+            painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(rect, 10, 10)
+
+        #image area
+        image_rect = QRect(rect.x() + 8, rect.y() + 8, THUMB_AREA.width(), THUMB_AREA.height())
+        pixmap = index.data(Qt.DecorationRole)
         if pixmap:
-            self.image_area.setPixmap(pixmap)
-            self.image_area.setStyleSheet(
-                "background-color: transparent; border-radius: 6px;"
-            )
-            self.pixmap_loaded = True
+            x = image_rect.x() + (image_rect.width() - pixmap.width()) // 2
+            y = image_rect.y() + (image_rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(item.fallback_color))
+            painter.drawRoundedRect(image_rect, 6, 6)
+
+        #filename
+        text_y = image_rect.bottom() + 6
+        font = QFont(option.font)
+        font.setBold(True)
+        font.setPixelSize(12)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        name_rect = QRect(image_rect.x(), text_y, image_rect.width(), 16)
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         painter.fontMetrics().elidedText(item.filename, Qt.ElideMiddle, name_rect.width()))
+        text_y += 18
+
+        # Sequence info (frame range + count)
+        if item.info:
+            font.setBold(False)
+            font.setPixelSize(10)
+            painter.setFont(font)
+            painter.setPen(QColor("#888"))
+            painter.drawText(QRect(image_rect.x(), text_y, image_rect.width(), 14), Qt.AlignLeft | Qt.AlignVCenter, item.info)
+            text_y += 16
 
-    # Interaction
-    def mousePressEvent(self, event):
-        #left click for selection
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self)
-        super().mousePressEvent(event)
+        # Published label
+        if item.is_published:
+            font.setBold(True)
+            font.setPixelSize(11)
+            painter.setFont(font)
+            painter.setPen(QColor("#00ff00"))
+            painter.drawText(QRect(image_rect.x(), text_y, image_rect.width(), 14), Qt.AlignLeft | Qt.AlignVCenter, "PUBLISHED ✓")
 
-    def contextMenuEvent(self, event):
-        #right click menu
-        self.show_context_menu(event.globalPos())
+        painter.restore()
 
-    def mouseDoubleClickEvent(self, event):
-        if self.full_path:
-            self.double_clicked.emit(self)
-        super().mouseDoubleClickEvent(event)
+class GalleryView(QListView):
+    """
+    Grid of gallery cards. Only visible rows are painted, queued thumbnail
+    decodes for rows that scroll away are cancelled.
+    """
+    item_double_clicked = pyqtSignal(object)
+    action_triggered = pyqtSignal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setMovement(QListView.Static)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSpacing(10)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet(get_scrollbar_style("#121212") + "QListView { background: transparent; outline: none; }")
+
+        self.gallery_model = GalleryModel(self)
+        self.setModel(self.gallery_model)
+        self.setItemDelegate(GalleryDelegate(self))
+
+        self.doubleClicked.connect(self.on_double_clicked)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.show_context_menu)
+        self.verticalScrollBar().valueChanged.connect(self.cancel_offscreen_decodes)
+
+    def selected_item(self):
+        indexes = self.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return indexes[0].data(GALLERY_ITEM_ROLE)
+
+    def visible_rows(self):
+        """Range of rows currently inside the viewport."""
+        rect = self.viewport().rect()
+        first = self.indexAt(rect.topLeft() + QPoint(CARD_SIZE.width() // 2, CARD_SIZE.height() // 2))
+        last = self.indexAt(rect.bottomRight() - QPoint(CARD_SIZE.width() // 2, CARD_SIZE.height() // 2))
+        start = first.row() if first.isValid() else 0
+        end = last.row() if last.isValid() else self.gallery_model.rowCount() - 1
+        #one row of cards either side so a short scroll doesn't cancel what is about to show
+        per_row = max(1, rect.width() // (CARD_SIZE.width() + self.spacing() * 2))
+        return range(max(0, start - per_row), end + per_row + 1)
+
+    def cancel_offscreen_decodes(self):
+        self.gallery_model.cancel_decodes(keep_rows=self.visible_rows())
+
+    def on_double_clicked(self, index):
+        item = index.data(GALLERY_ITEM_ROLE)
+        if item and item.full_path:
+            self.item_double_clicked.emit(item)
+
+    def show_context_menu(self, pos):
+        index = self.indexAt(pos)
+        item = index.data(GALLERY_ITEM_ROLE) if index.isValid() else None
+        if item is None:
+            return
+        self.setCurrentIndex(index)
 
-    def show_context_menu(self, global_pos):
         menu = QMenu(self)
         menu.setStyleSheet("""
             QMenu { background-color: #333; color: white; border: 1px solid #555; }
             QMenu::item:selected { background-color: #555; }
         """)
 
-        #Publish Action
-        if self.file_type == "export":
-            action_text = "Unpublish" if self.is_published else "Publish"
-            action_pub = QAction(action_text, self)
-            action_pub.triggered.connect(
-                lambda: self.action_triggered.emit(
-                    "unpublish" if self.is_published else "publish", self
-                )
-            )
-            menu.addAction(action_pub)
+        #Sequence Actions
+        if item.sequence:
+            action_expand = QAction(f"Show {item.sequence.count} Frames", self)
+            action_expand.triggered.connect(lambda: self.action_triggered.emit("expand", item))
+            menu.addAction(action_expand)
+
+            action_copy_seq = QAction("Copy Sequence Path (####)", self)
+            action_copy_seq.triggered.connect(lambda: self.copy_specific_path(item.sequence.pattern("hash")))
+            menu.addAction(action_copy_seq)
             menu.addSeparator()
 
         #File Actions
         action_open = QAction("Open File Location", self)
-        action_open.triggered.connect(self.open_file_location)
+        action_open.triggered.connect(lambda: self.open_file_location(item))
         menu.addAction(action_open)
 
         #Path Variants
-        variants = get_path_variants(self.full_path)
-        
+        variants = get_path_variants(item.full_path)
+
         action_copy_local = QAction("Copy Path (Local)", self)
-        action_copy_local.triggered.connect(self.copy_path)
+        action_copy_local.triggered.connect(lambda: self.copy_specific_path(item.full_path))
         menu.addAction(action_copy_local)
 
         if variants:
@@ -880,60 +1362,220 @@ class ThumbnailCard(QFrame):
             action_copy_home.triggered.connect(lambda: self.copy_specific_path(variants.get("home")))
             menu.addAction(action_copy_home)
 
-        menu.exec_(global_pos)
+        menu.exec_(self.viewport().mapToGlobal(pos))
 
-    def open_file_location(self):
-        path = os.path.normpath(self.full_path)
+    def open_file_location(self, item):
+        path = os.path.normpath(item.full_path)
         if os.path.exists(path):
             subprocess.Popen(f'explorer /select,"{path}"')
-    
-    def copy_path(self):
-        QApplication.clipboard().setText(self.full_path)
 
     def copy_specific_path(self, path):
         if path:
             QApplication.clipboard().setText(path)
 
-    #State updates
-    def set_selected(self, selected):
-        self.is_selected = selected
-        self.update_border()
-
-    def mark_published(self, published=True):
-        self.is_published = published
-        self.status_lbl.setVisible(published)
-        self.update_border()
-
-    def update_border(self):
-        base_bg = "#1e1e1e"
-        hover_bg = "#333333"
-
-        if self.is_selected:
-            css = (
-                "ThumbnailCard {"
-                f"background-color: {base_bg};"
-                "border: 3px solid #FF6000;"
-                "border-radius: 10px;"
-                "}"
-            )
-        elif self.is_published:
-            css = (
-                "ThumbnailCard {"
-                f"background-color: {base_bg};"
-                "border: 3px solid #00ff00;"
-                "border-radius: 10px;"
-                "}"
-            )
+#sidebar row and thumbnail sizes
+SIDEBAR_ROW_HEIGHT = 100
+SIDEBAR_THUMB = QSize(142, 80)
+
+class SidebarItem:
+    """One shot or asset record in the sidebar (a plain dict copy of the DB row)."""
+
+    def __init__(self, record, key_field, color):
+        self.key_field = key_field
+        self.color = color
+        self.model = None
+        self.row = -1
+        self.set_record(record)
+
+    def set_record(self, record):
+        self.record = dict(record)
+        self.key = str(self.record.get(self.key_field) or "")
+        #lowercased once so filtering while typing stays cheap
+        self.search_key = self.key.lower()
+        self.search_desc = str(self.record.get("description") or "").lower()
+
+        thumb = self.record.get("thumbnail_path")
+        self.thumb_path = thumb.strip() if isinstance(thumb, str) and thumb.strip() else None
+        self.decode_token = None
+        self.no_thumbnail = False
+
+    def matches(self, text):
+        return not text or text in self.search_key or text in self.search_desc
+
+    def on_image_decoded(self, image):
+        self.decode_token = None
+        if image.isNull():
+            self.no_thumbnail = True
+            return
+        cache_pixmap(self.thumb_path, SIDEBAR_THUMB, image)
+        if self.model:
+            self.model.item_changed(self)
+
+class SidebarModel(QAbstractListModel):
+    """
+    Shots or assets for the sidebar. Rows are updated, added and removed in
+    place after edits so the list (and the selection) doesn't get rebuilt.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+
+        if role == Qt.DisplayRole:
+            return item.key
+        if role == Qt.ToolTipRole:
+            return item.record.get("description") or item.key
+        if role == GALLERY_ITEM_ROLE:
+            return item
+        if role == Qt.DecorationRole:
+            if not item.thumb_path or item.no_thumbnail:
+                return None
+            pixmap = get_cached_pixmap(item.thumb_path, SIDEBAR_THUMB)
+            if pixmap is None and not item.decode_token:
+                item.decode_token = get_image_decoder().request(item, item.thumb_path, SIDEBAR_THUMB)
+            return pixmap
+        return None
+
+    def set_records(self, records, key_field, color):
+        self.beginResetModel()
+        for item in self.items:
+            item.model = None
+        self.items = [SidebarItem(r, key_field, color) for r in records]
+        self.items.sort(key=lambda i: i.key)
+        self.renumber()
+        self.endResetModel()
+
+    def renumber(self, start=0):
+        for row in range(start, len(self.items)):
+            self.items[row].model = self
+            self.items[row].row = row
+
+    def find_row(self, key):
+        for item in self.items:
+            if item.key == key:
+                return item.row
+        return -1
+
+    def item_changed(self, item):
+        index = self.index(item.row)
+        self.dataChanged.emit(index, index)
+
+    def upsert(self, record, old_key=None):
+        """Updates the row for old_key (or the record's own key) in place, or inserts a new one."""
+        if not self.items:
+            return
+        key_field = self.items[0].key_field
+        row = self.find_row(old_key or str(record.get(key_field) or ""))
+
+        if row >= 0:
+            item = self.items[row]
+            item.set_record(record)
+            #renamed rows have to move to stay sorted
+            if (row > 0 and self.items[row - 1].key > item.key) or \
+               (row < len(self.items) - 1 and self.items[row + 1].key < item.key):
+                self.remove_row(row)
+                self.insert_item(item)
+            else:
+                self.item_changed(item)
         else:
-            css = (
-                "ThumbnailCard {"
-                f"background-color: {base_bg};"
-                "border-radius: 10px;"
-                "}"
-                f"ThumbnailCard:hover {{ background-color: {hover_bg}; }}"
-            )
+            self.insert_item(SidebarItem(record, key_field, self.items[0].color))
+
+    def insert_item(self, item):
+        row = 0
+        while row < len(self.items) and self.items[row].key < item.key:
+            row += 1
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.insert(row, item)
+        self.renumber(row)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        item = self.items.pop(row)
+        item.model = None
+        self.renumber(row)
+        self.endRemoveRows()
+
+    def remove(self, key):
+        row = self.find_row(key)
+        if row >= 0:
+            self.remove_row(row)
+
+class SidebarFilterModel(QSortFilterProxyModel):
+    """Type-ahead filter over code/name and description."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_text = ""
+
+    def set_filter_text(self, text):
+        self.filter_text = text.strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        item = self.sourceModel().items[source_row]
+        return item.matches(self.filter_text)
+
+class SidebarDelegate(QStyledItemDelegate):
+    """Paints a sidebar row like the old shot buttons: name on the left, thumbnail on the right."""
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), SIDEBAR_ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        item = index.data(GALLERY_ITEM_ROLE)
+        if item is None:
+            return
 
-        self.setStyleSheet(css)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = option.rect.adjusted(0, 0, 0, -10)
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        if selected:
+            bg, txt_color = "white", "#222"
+        else:
+            bg, txt_color = ("#4d4d4d" if hovered else "#3c3c3c"), "white"
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(bg))
+        painter.drawRoundedRect(rect, 8, 8)
+
+        #thumbnail box
+        box = QRect(rect.right() - 15 - SIDEBAR_THUMB.width(), rect.center().y() - SIDEBAR_THUMB.height() // 2,
+                    SIDEBAR_THUMB.width(), SIDEBAR_THUMB.height())
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap:
+            x = box.x() + (box.width() - pixmap.width()) // 2
+            y = box.y() + (box.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+            painter.setPen(QPen(QColor("#555"), 1))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(box, 4, 4)
+        else:
+            painter.setBrush(QColor(item.color))
+            painter.drawRoundedRect(box, 4, 4)
+
+        #name
+        font = QFont(option.font)
+        font.setBold(True)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(QColor(txt_color))
+        text_rect = QRect(rect.x() + 15, rect.y(), box.x() - rect.x() - 25, rect.height())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         painter.fontMetrics().elidedText(item.key, Qt.ElideRight, text_rect.width()))
+
+        painter.restore()
 
 class ShotInfoPanel(QFrame):
     def __init__(self):
@@ -1249,8 +1891,22 @@ class OrionLauncherUI(QWidget):
         self.current_shot_code = None
         self.current_task_path = None
         
-        self.active_buttons = {"col1": None, "task": None} 
-        self.selected_card = None 
+        self.active_buttons = {"task": None} 
+        #shot/asset rows per context, read from the DB once
+        self.sidebar_records = {}
+
+        #async gallery state
+        self.gallery_scan_token = None
+
+        #folder listings shared by the task list, gallery and exports pane
+        self.listing_cache = ListingCache()
+        self.prefetching = set()
+        self.task_list_pending = False
+
+        #exports pane widgets by path, so refreshes only touch what changed
+        self.exports_token = None
+        self.export_widgets = {}
+        self.export_empty_lbl = None
         
         self.init_ui()
 
@@ -1267,9 +1923,9 @@ class OrionLauncherUI(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(main_layout)
 
-        # LEFT SIDEBAR (Previously col1)
+        # LEFT SIDEBAR
         # Logo, Asset/Shot Switcher, and the List of Items
-        self.sidebar_frame, self.sidebar_layout, self.sidebar_scroll, self.sidebar_content = self.create_column_structure(
+        self.sidebar_frame, self.sidebar_layout, _, _ = self.create_column_structure(
             "#1e1e1e", 320, "border-right: 1px solid #2a2a2a;"
         )
         
@@ -1295,7 +1951,38 @@ class OrionLauncherUI(QWidget):
         sidebar_header.addStretch()
         
         self.sidebar_layout.addLayout(sidebar_header)
-        self.sidebar_layout.addWidget(self.sidebar_scroll)
+
+        # shot/asset list with type-ahead search
+        self.sidebar_panel = QWidget()
+        sidebar_panel_layout = QVBoxLayout(self.sidebar_panel)
+        sidebar_panel_layout.setContentsMargins(0, 0, 0, 0)
+        sidebar_panel_layout.setSpacing(10)
+
+        self.sidebar_search = QLineEdit()
+        self.sidebar_search.setPlaceholderText("search code or description...")
+        self.sidebar_search.setClearButtonEnabled(True)
+        self.sidebar_search.setStyleSheet("background-color: #2b2b2b; color: white; border: none; border-radius: 5px; padding: 6px;")
+        self.sidebar_search.textChanged.connect(self.on_sidebar_search)
+        sidebar_panel_layout.addWidget(self.sidebar_search)
+
+        self.sidebar_model = SidebarModel(self)
+        self.sidebar_filter = SidebarFilterModel(self)
+        self.sidebar_filter.setSourceModel(self.sidebar_model)
+
+        self.sidebar_view = QListView()
+        self.sidebar_view.setModel(self.sidebar_filter)
+        self.sidebar_view.setItemDelegate(SidebarDelegate(self.sidebar_view))
+        self.sidebar_view.setUniformItemSizes(True)
+        self.sidebar_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.sidebar_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.sidebar_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.sidebar_view.setMouseTracking(True)
+        self.sidebar_view.setFrameShape(QFrame.NoFrame)
+        self.sidebar_view.setStyleSheet(get_scrollbar_style("#1e1e1e") + "QListView { background: transparent; outline: none; }")
+        self.sidebar_view.clicked.connect(self.on_sidebar_select)
+        sidebar_panel_layout.addWidget(self.sidebar_view)
+
+        self.sidebar_layout.addWidget(self.sidebar_panel)
         
         # action bar (Create/Edit/Delete buttons)
         self.action_bar = QWidget()
@@ -1435,6 +2122,13 @@ class OrionLauncherUI(QWidget):
         self.export_scroll.setWidget(self.export_container)
         task_bot_layout.addWidget(self.export_scroll)
 
+        #publish/unpublish progress, copies run in the background
+        self.transfer_status = QLabel("")
+        self.transfer_status.setStyleSheet("color: #888; font-size: 10px; margin-left: 10px;")
+        self.transfer_status.hide()
+        task_bot_layout.addWidget(self.transfer_status)
+        get_transfer_bridge().progress.connect(self.on_transfer_progress)
+
         self.task_splitter.addWidget(self.task_top_widget)
         self.task_splitter.addWidget(self.task_bottom_widget)
         self.task_splitter.setStretchFactor(0, 1)
@@ -1540,86 +2234,163 @@ class OrionLauncherUI(QWidget):
         self.wacom_checkbox.setChecked(self.settings.get('wacom_fix', False))
 
     #LOGIC
-    def populate_sidebar(self, mode):
+    def populate_sidebar(self, mode, refresh=False):
         
         self.current_context = mode
         
         self.context_switch.show()
         self.action_bar.show()
-        self.sidebar_scroll.show()
-        self.clear_layout(self.sidebar_content)
-        
+        self.sidebar_panel.show()
+
+        #records are read once per context, edits update them in place
+        if refresh or self.sidebar_records.get(mode) is None:
+            self.sidebar_records[mode] = self.load_sidebar_records(mode)
+
         if self.current_context == "Assets":
-            print("Go to here")
-            try:
-                assets_data = self.orion.get_all_assets()
-                for asset in assets_data:
-                    name = asset['name']
-                    asset_dict = {key: asset[key] for key in asset.keys()}
-                    btn = ShotButton(name, "#ff9966", full_data=asset_dict)
-                    btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                    btn.clicked.connect(lambda checked, b=btn: self.on_sidebar_select(b))
-                    self.sidebar_content.addWidget(btn)
-            except Exception as e:
-                print(f"Asset DB Error: {e}")
+            self.sidebar_model.set_records(self.sidebar_records[mode], "name", "#ff9966")
         else:
-            try:
-                shots_data = self.orion.get_all_shots()
-                for shot in shots_data:
-                    code = shot['code']
-                    shot_dict = {key: shot[key] for key in shot.keys()}
-                    btn = ShotButton(code, "#66ffcc", full_data=shot_dict) 
-                    btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                    btn.clicked.connect(lambda checked, b=btn: self.on_sidebar_select(b))
-                    self.sidebar_content.addWidget(btn)
-            except Exception as e:
-                print(f"Shot DB Error: {e}")
-        
-        self.sidebar_content.addStretch()
-        
-    def on_sidebar_select(self, btn):
-        if self.active_buttons["col1"]:
-            try: self.active_buttons["col1"].set_active(False)
-            except: pass
-        btn.set_active(True)
-        self.active_buttons["col1"] = btn
+            self.sidebar_model.set_records(self.sidebar_records[mode], "code", "#66ffcc")
+        self.select_sidebar_key(self.current_shot_code)
+
+    def load_sidebar_records(self, mode):
+        try:
+            if mode == "Assets":
+                rows = self.orion.get_all_assets()
+            else:
+                rows = self.orion.get_all_shots()
+            return [dict(row) for row in rows]
+        except Exception as e:
+            print(f"{'Asset' if mode == 'Assets' else 'Shot'} DB Error: {e}")
+            return []
+
+    def refresh_sidebar_record(self, key, old_key=None):
+        """Re-reads one shot/asset from the DB and updates its row in place."""
+        mode = self.current_context
+        row = self.orion.get_asset(key) if mode == "Assets" else self.orion.get_shot(key)
+        if not row:
+            return
+        record = dict(row)
+        key_field = "name" if mode == "Assets" else "code"
+
+        records = self.sidebar_records.get(mode)
+        if records is not None:
+            match = old_key or key
+            records[:] = [r for r in records if r.get(key_field) != match] + [record]
+
+        if self.sidebar_model.items:
+            self.sidebar_model.upsert(record, old_key=old_key)
+        else:
+            self.sidebar_model.set_records([record], key_field, "#ff9966" if mode == "Assets" else "#66ffcc")
+        self.select_sidebar_key(key)
+
+    def remove_sidebar_record(self, key):
+        mode = self.current_context
+        key_field = "name" if mode == "Assets" else "code"
+        records = self.sidebar_records.get(mode)
+        if records is not None:
+            records[:] = [r for r in records if r.get(key_field) != key]
+        self.sidebar_model.remove(key)
+
+    def select_sidebar_key(self, key):
+        self.sidebar_view.clearSelection()
+        if not key:
+            return
+        row = self.sidebar_model.find_row(key)
+        if row >= 0:
+            index = self.sidebar_filter.mapFromSource(self.sidebar_model.index(row))
+            if index.isValid():
+                self.sidebar_view.setCurrentIndex(index)
+
+    def on_sidebar_search(self, text):
+        self.sidebar_filter.set_filter_text(text)
+
+    def on_sidebar_select(self, index):
+        item = index.data(GALLERY_ITEM_ROLE)
+        if item is None:
+            return
 
-        self.current_shot_code = btn.text_label
+        self.current_shot_code = item.key
         
-        if btn.full_data:
-            start = btn.full_data.get('frame_start')
-            end = btn.full_data.get('frame_end')
-            desc = btn.full_data.get('description', "")
+        if item.record:
+            start = item.record.get('frame_start')
+            end = item.record.get('frame_end')
+            desc = item.record.get('description', "")
             self.info_panel.update_info(self.current_shot_code, start, end, desc)
         
         self.populate_task_list()
         self.clear_gallery()
-        self.clear_layout(self.export_layout)
-        
+        self.clear_exports_pane()
+        
+    def get_item_path(self, key):
+        base_folder = "30_assets" if self.current_context == "Assets" else "40_shots"
+        return os.path.join(self.project_root, base_folder, key)
+
+    def list_folder(self, path):
+        """(dirs, files) for path from the prefetched listings, or read now if not cached."""
+        listing = self.listing_cache.get(path)
+        if listing is None:
+            listing = list_dir(path)
+            self.listing_cache.put(path, listing)
+        return listing
+
+    def prefetch_item_tree(self, item_path):
+        """Scans a whole shot/asset tree in the background into the listing cache."""
+        if item_path in self.prefetching or self.listing_cache.get(item_path) is not None:
+            return
+        self.prefetching.add(item_path)
+        get_background_runner().run(scan_item_tree, item_path,
+                                    callback=lambda listings, p=item_path: self.on_tree_prefetched(p, listings))
+
+    def on_tree_prefetched(self, item_path, listings):
+        self.prefetching.discard(item_path)
+        if listings:
+            self.listing_cache.update(listings)
+
+        #the task list was waiting for this shot
+        if self.current_shot_code and self.get_item_path(self.current_shot_code) == item_path:
+            if self.task_list_pending:
+                self.populate_task_list()
+
+    def prefetch_neighbours(self, distance=2):
+        """Speculatively scans the shots either side of the selection in the sidebar."""
+        current = self.sidebar_view.currentIndex()
+        if not current.isValid():
+            return
+        for offset in range(1, distance + 1):
+            for row in (current.row() - offset, current.row() + offset):
+                index = self.sidebar_filter.index(row, 0)
+                item = index.data(GALLERY_ITEM_ROLE) if index.isValid() else None
+                if item:
+                    self.prefetch_item_tree(self.get_item_path(item.key))
+
     def populate_task_list(self):
         self.clear_layout(self.task_content)
+        self.task_list_pending = False
         if not self.current_shot_code: return
 
-        if self.current_context == "Assets":
-            base_folder = "30_assets"
-        else:
-            base_folder = "40_shots"
+        item_path = self.get_item_path(self.current_shot_code)
+        listing = self.listing_cache.get(item_path)
 
-        item_path = os.path.join(self.project_root, base_folder, self.current_shot_code)
-        
-        if os.path.exists(item_path):
-            items = sorted([d for d in os.listdir(item_path) if os.path.isdir(os.path.join(item_path, d))])
-            ignore = ["__pycache__", ".git"]
-            items = [i for i in items if i not in ignore and not i.startswith(".")]
+        if listing is None:
+            #one background scan fills the task list, gallery and exports pane
+            self.task_list_pending = True
+            loading = QLabel("Loading...")
+            loading.setStyleSheet("color: #555;")
+            self.task_content.addWidget(loading)
+            self.prefetch_item_tree(item_path)
+            return
 
+        items = listing[0]
+        if items:
             for spec in items:
                 spec_full_path = os.path.join(item_path, spec)
                 group = SpecialismGroup(spec, spec_full_path, self)
                 self.task_content.addWidget(group)
-        else:
+        elif not os.path.exists(item_path):
              self.task_content.addWidget(QLabel("Folder not found on disk."))
 
         self.task_content.addStretch()
+        self.prefetch_neighbours()
 
     def get_next_available_shot_code(self):
         shots_dir = os.path.join(self.project_root, "40_shots")
@@ -1640,7 +2411,7 @@ class OrionLauncherUI(QWidget):
     def enter_create_mode(self):
         self.context_switch.hide()
         self.action_bar.hide()
-        self.sidebar_scroll.hide()
+        self.sidebar_panel.hide()
         
         if self.current_context == "Assets":
             self.editor = AssetEditor(mode="create")
@@ -1664,7 +2435,7 @@ class OrionLauncherUI(QWidget):
         #Hide main widgets
         self.context_switch.hide()
         self.action_bar.hide()
-        self.sidebar_scroll.hide()
+        self.sidebar_panel.hide()
 
         try:
             if self.current_context == "Assets":
@@ -1744,14 +2515,16 @@ class OrionLauncherUI(QWidget):
             
             self.context_switch.show()
             self.action_bar.show()
-            self.sidebar_scroll.show()
+            self.sidebar_panel.show()
             QMessageBox.critical(self, "Editor Error", f"Could not load editor:\n{e}")
 
     def exit_edit_mode(self):
         if hasattr(self, 'editor'):
             self.editor.deleteLater()
             del self.editor
-        self.populate_sidebar(self.current_context)
+        self.context_switch.show()
+        self.action_bar.show()
+        self.sidebar_panel.show()
 
     def update_discord_id_in_db(self, code, discord_id):
         try:
@@ -1774,6 +2547,7 @@ class OrionLauncherUI(QWidget):
             if disc_id: self.update_discord_id_in_db(code, disc_id)
             QMessageBox.information(self, "Success", f"Shot {code} created.")
             self.exit_edit_mode()
+            self.refresh_sidebar_record(code)
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
@@ -1812,6 +2586,7 @@ class OrionLauncherUI(QWidget):
             
             QMessageBox.information(self, "Success", f"Shot {new_code} updated.")
             self.exit_edit_mode()
+            self.refresh_sidebar_record(new_code, old_key=old_code)
         except Exception as e:
             QMessageBox.critical(self, "Update Failed", str(e))
 
@@ -1862,6 +2637,7 @@ class OrionLauncherUI(QWidget):
             
             QMessageBox.information(self, "Success", f"Asset {new_name} updated.")
             self.exit_edit_mode()
+            self.refresh_sidebar_record(new_name, old_key=old_name)
             
         except Exception as e:
             QMessageBox.critical(self, "Update Failed", str(e))
@@ -1886,16 +2662,14 @@ class OrionLauncherUI(QWidget):
                 if success:
                     QMessageBox.information(self, "Deleted", f"{item_type} deleted successfully.")
                     # Reset Selection
+                    self.listing_cache.invalidate(self.get_item_path(self.current_shot_code))
+                    self.remove_sidebar_record(self.current_shot_code)
                     self.current_shot_code = None
-                    self.active_buttons["col1"] = None
                     
                     # Clear UI Panes
                     self.clear_layout(self.task_content) 
-                    self.clear_layout(self.export_layout) 
+                    self.clear_exports_pane() 
                     self.info_panel.setVisible(False)
-                    
-                    # Refresh List
-                    self.populate_sidebar(self.current_context)
                 else:
                     QMessageBox.warning(self, "Error", "Failed to delete item. Check console for details.")
             except Exception as e:
@@ -1906,9 +2680,11 @@ class OrionLauncherUI(QWidget):
         self.current_mode = mode
         print(self.current_mode)
         
-        self.active_buttons = {"col1": None, "task": None}
+        self.active_buttons = {"task": None}
+        self.current_shot_code = None
+        self.sidebar_search.clear()
         self.clear_layout(self.task_content)
-        self.clear_layout(self.export_layout) 
+        self.clear_exports_pane() 
         self.clear_gallery()
         self.info_panel.setVisible(False) 
         
@@ -1946,59 +2722,70 @@ class OrionLauncherUI(QWidget):
         self.populate_gallery(full_path, exclude_dirs=["EXPORT", "BIN"])
         self.populate_exports_pane(full_path)
 
+    def clear_exports_pane(self):
+        if self.exports_token:
+            get_background_runner().cancel(self.exports_token)
+            self.exports_token = None
+        self.clear_layout(self.export_layout)
+        self.export_widgets = {}
+        self.export_empty_lbl = None
+        self.export_layout.addStretch()
+
     def populate_exports_pane(self, task_path):
         """Populates the bottom of Column 2 with items from EXPORT and EXPORT/PUBLISHED"""
-        self.clear_layout(self.export_layout)
-        
-        export_path = os.path.join(task_path, "EXPORT")
-        publish_path = os.path.join(export_path, "PUBLISHED")
-        
-        items_to_add = [] 
+        self.clear_exports_pane()
+        self.refresh_exports_pane(task_path)
+
+    def refresh_exports_pane(self, task_path=None):
+        """Re-lists the exports off the GUI thread, only changed entries are touched."""
+        task_path = task_path or self.current_task_path
+        if not task_path: return
+
+        if self.exports_token:
+            get_background_runner().cancel(self.exports_token)
+        self.exports_token = get_background_runner().run(
+            list_exports, task_path, self.listing_cache,
+            callback=lambda records, p=task_path: self.on_exports_listed(p, records)
+        )
 
-        # reg exports
-        if os.path.exists(export_path):
-            try:
-                for f in os.listdir(export_path):
-                    if f.startswith('.'): continue
-                    full_p = os.path.join(export_path, f)
-                    if os.path.isfile(full_p):
-                        # (Filename, Full Path, Is_Published=False)
-                        items_to_add.append((f, full_p, False))
-            except Exception as e:
-                print(f"[DEBUG] Error reading export path: {e}")
+    def on_exports_listed(self, task_path, records):
+        self.exports_token = None
+        #user moved on to another task while this was listing
+        if task_path != self.current_task_path or records is None:
+            return
 
-        # published exports (will b above)
-        if os.path.exists(publish_path):
-            try:
-                for f in os.listdir(publish_path):
-                    if f.startswith('.'): continue
-                    full_p = os.path.join(publish_path, f)
-                    if os.path.isfile(full_p):
-                        # (Filename, Full Path, Is_Published=True)
-                        items_to_add.append((f, full_p, True))
-            except Exception as e:
-                print(f"[DEBUG] Error reading publish path: {e}")
-        
-        # SORTING LOGIC
-        # tuple: (Is Published?, Modification Time)
-        # reverse=True means:
-        #  true (published) comes before False (unpublished)
-        #   higher Time (new) comes before lower Time (old)
-        items_to_add.sort(key=lambda x: (x[2], os.path.getmtime(x[1])), reverse=True)
+        # remove entries that are gone (unpublished, moved to BIN...)
+        paths = {r[1] for r in records}
+        for path in [p for p in self.export_widgets if p not in paths]:
+            widget = self.export_widgets.pop(path)
+            self.export_layout.removeWidget(widget)
+            widget.deleteLater()
 
         # widgets
-        if not items_to_add:
-            lbl = QLabel("No export files found.")
-            lbl.setStyleSheet("color: #666; font-style: italic; margin-left: 10px;")
-            self.export_layout.addWidget(lbl)
-        else:
-            for name, path, is_pub in items_to_add:
+        if not records:
+            if not self.export_empty_lbl:
+                self.export_empty_lbl = QLabel("No export files found.")
+                self.export_empty_lbl.setStyleSheet("color: #666; font-style: italic; margin-left: 10px;")
+                self.export_layout.insertWidget(0, self.export_empty_lbl)
+            return
+
+        if self.export_empty_lbl:
+            self.export_layout.removeWidget(self.export_empty_lbl)
+            self.export_empty_lbl.deleteLater()
+            self.export_empty_lbl = None
+
+        # records are already in order: published first, then newest first
+        for pos, (name, path, size, mtime, is_pub) in enumerate(records):
+            item = self.export_widgets.get(path)
+            if item is None:
                 item = ExportItemWidget(name, path, is_published=is_pub)
                 # connect signal (publish/unpublish actions)
                 item.action_triggered.connect(self.handle_export_action)
-                self.export_layout.addWidget(item)
-                
-        self.export_layout.addStretch()
+                self.export_widgets[path] = item
+                self.export_layout.insertWidget(pos, item)
+            elif self.export_layout.indexOf(item) != pos:
+                self.export_layout.removeWidget(item)
+                self.export_layout.insertWidget(pos, item)
 
     def handle_export_action(self, action, item):
         if action == "publish":
@@ -2010,16 +2797,28 @@ class OrionLauncherUI(QWidget):
         src = item.full_path
         dir_name = os.path.dirname(src)
         publish_dir = os.path.join(dir_name, "PUBLISHED")
-        if not os.path.exists(publish_dir): os.makedirs(publish_dir)
-        
-        dst = os.path.join(publish_dir, item.filename)
-        try:
-            shutil.copy2(src, dst)
-            QMessageBox.information(self, "Published", f"Published: {item.filename}")
-            # Refresh list
-            self.populate_exports_pane(self.current_task_path)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Publish failed: {e}")
+
+        #hardlink first (no data copied), only queue a real copy if the share can't link
+        get_background_runner().run(link_publish, src, publish_dir,
+                                    callback=lambda dst: self.on_publish_linked(dst, item.filename, src, publish_dir))
+        self.show_transfer_status(f"Publishing {item.filename}...")
+
+    def on_publish_linked(self, dst, filename, src, publish_dir):
+        dir_name = os.path.dirname(src)
+        if dst:
+            self.listing_cache.invalidate(dir_name)
+            self.show_transfer_status(f"Published: {filename}")
+            if self.current_task_path and dir_name.startswith(self.current_task_path):
+                self.refresh_exports_pane()
+            return
+
+        def copied(job):
+            if job.ok:
+                get_background_runner().run(record_publish, publish_dir, filename, src, "copy")
+            self.on_transfer_finished(job, [dir_name], "Published")
+
+        #copy runs in the background, the pane refreshes when it lands
+        get_transfer_bridge().submit(src, os.path.join(publish_dir, filename), mode="copy", callback=copied)
 
     def unpublish_asset_file(self, item):
         export_dir = os.path.dirname(item.full_path)
@@ -2028,8 +2827,6 @@ class OrionLauncherUI(QWidget):
         task_dir = os.path.dirname(export_root) 
         
         bin_dir = os.path.join(task_dir, "BIN")
-        if not os.path.exists(bin_dir): os.makedirs(bin_dir)
-        
         dst = os.path.join(bin_dir, item.filename)
 
         if os.path.exists(dst):
@@ -2037,13 +2834,36 @@ class OrionLauncherUI(QWidget):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             dst = os.path.join(bin_dir, f"{base}_{timestamp}{ext}")
 
-        try:
-            shutil.move(item.full_path, dst)
-            QMessageBox.information(self, "Unpublished", f"Moved to BIN:\n{os.path.basename(dst)}")
-            # Refresh list
-            self.populate_exports_pane(self.current_task_path)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Unpublish failed: {e}")
+        filename = item.filename
+        def moved(job):
+            if job.ok:
+                get_background_runner().run(forget_publish, export_dir, filename)
+            self.on_transfer_finished(job, [export_root, bin_dir], "Moved to BIN")
+
+        get_transfer_bridge().submit(item.full_path, dst, mode="move", callback=moved)
+        self.show_transfer_status(f"Unpublishing {item.filename}...")
+
+    def show_transfer_status(self, text):
+        self.transfer_status.setText(text)
+        self.transfer_status.show()
+
+    def on_transfer_progress(self, job):
+        verb = "Publishing" if job.mode == "copy" else "Unpublishing"
+        self.show_transfer_status(f"{verb} {job.name}... {job.fraction:.0%} ({job.speed() / (1024 * 1024):.0f} MB/s)")
+
+    def on_transfer_finished(self, job, changed_dirs, verb):
+        for d in changed_dirs:
+            self.listing_cache.invalidate(d)
+
+        if job.ok:
+            self.show_transfer_status(f"{verb}: {os.path.basename(job.dst)}")
+        elif job.state == "failed":
+            self.transfer_status.hide()
+            QMessageBox.critical(self, "Error", f"{verb} failed for {job.name}: {job.error}")
+
+        #only still matters if the user is looking at that task
+        if self.current_task_path and any(d.startswith(self.current_task_path) for d in changed_dirs):
+            self.refresh_exports_pane()
 
     def create_right_panel(self):
         layout = QVBoxLayout()
@@ -2052,31 +2872,34 @@ class OrionLauncherUI(QWidget):
         self.info_panel = ShotInfoPanel()
         layout.addWidget(self.info_panel)
         
-        # SCROLL AREA FOR GALLERY
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet(get_scrollbar_style("#121212"))
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
+        # GALLERY
         gallery_container = QWidget()
         gallery_container.setStyleSheet("background: transparent;")
         gallery_layout = QVBoxLayout(gallery_container)
         gallery_layout.setContentsMargins(20, 20, 20, 20)
-        
-        self.grid_layout = QGridLayout()
-        self.grid_layout.setSpacing(20)
-        self.grid_layout.setAlignment(Qt.AlignTop) 
-        
-        self.grid_layout.setColumnStretch(0, 1)
-        self.grid_layout.setColumnStretch(1, 1)
-        self.grid_layout.setColumnStretch(2, 1)
 
-        gallery_layout.addLayout(self.grid_layout)
-        gallery_layout.addStretch()
-        
-        scroll.setWidget(gallery_container)
-        layout.addWidget(scroll)
+        #back button, only shown while a sequence is expanded
+        self.gallery_back_btn = QPushButton()
+        self.gallery_back_btn.setStyleSheet("""
+            QPushButton { background-color: #2b2b2b; color: #bbb; border-radius: 5px; height: 30px; text-align: left; padding-left: 10px; border: none; }
+            QPushButton:hover { background-color: #383838; color: white; }
+        """)
+        self.gallery_back_btn.clicked.connect(lambda: self.populate_gallery(self.current_task_path, exclude_dirs=["EXPORT", "BIN"]))
+        self.gallery_back_btn.hide()
+        gallery_layout.addWidget(self.gallery_back_btn)
+
+        self.gallery_status = QLabel()
+        self.gallery_status.setStyleSheet("color: #555; font-size: 14px; font-weight: bold;")
+        self.gallery_status.hide()
+        gallery_layout.addWidget(self.gallery_status)
+
+        #model/view gallery, only visible cards are painted
+        self.gallery_view = GalleryView()
+        self.gallery_view.item_double_clicked.connect(self.launch_dcc_file)
+        self.gallery_view.action_triggered.connect(self.handle_card_action)
+        gallery_layout.addWidget(self.gallery_view)
+
+        layout.addWidget(gallery_container)
 
         bottom_bar_container = QWidget()
         bottom_bar = QHBoxLayout(bottom_bar_container)
@@ -2106,203 +2929,76 @@ class OrionLauncherUI(QWidget):
         return layout
 
     def on_new_file_clicked(self):
-        print(f"TEST {self.current_context}")
-        if self.current_context == "Shots":
-            
-            shot_code = self.current_shot_code
-            shot_row = self.orion.get_shot(shot_code)
-            row_dict = dict(shot_row)
-            
-            frame_start = row_dict.get('frame_start')
-            frame_end = row_dict.get('frame_end')
-            discord_thread_id = row_dict.get('discord_thread_id') 
-            shot_path = row_dict.get('shot_path')
-            
-            items = ["Maya", "Nuke", "Houdini", "Mari"]
-            choice, ok = QInputDialog.getItem(self, "Launch DCC", "Select Software to Open:", items, 0, False)
-            if not ok: return
-            launcher_map = {
-                "Maya": "dcc/maya/maya_launcher.py",
-                "Nuke": "dcc/nuke/nuke_launcher.py",
-                "Houdini": "dcc/houdini/houdini_launcher.py",
-                "Mari": "dcc/mari/mari_launcher.py"
-            }
-            launcher_rel_path = launcher_map[choice]
-            launcher_abs_path = os.path.join(orion_package_root, launcher_rel_path)
-            
-            if os.path.exists(launcher_abs_path):
-                #FLAGS
-                cmd_args = [sys.executable, launcher_abs_path]
-                
-                if shot_code:
-                    cmd_args.extend(["--code", str(shot_code)])
-                    cmd_args.extend(["--start", str(frame_start)])
-                    cmd_args.extend(["--end", str(frame_end)])
-                    cmd_args.extend(["--discord", str(discord_thread_id)])
-                    cmd_args.extend(["--shotpath", str(shot_path)])
-
-                subprocess.Popen(cmd_args)
-            else:
-                QMessageBox.warning(self, "Error", f"Launcher script not found: {launcher_abs_path}")
-                
-        elif self.current_context == "Assets":
-            
-            shot_code = self.current_shot_code
-            shot_row = self.orion.get_shot(shot_code)
-            
-            items = ["Maya", "Nuke", "Houdini", "Mari"]
-            choice, ok = QInputDialog.getItem(self, "Launch DCC", "Select Software to Open:", items, 0, False)
-            if not ok: return
-            launcher_map = {
-                "Maya": "dcc/maya/maya_launcher.py",
-                "Nuke": "dcc/nuke/nuke_launcher.py",
-                "Houdini": "dcc/houdini/houdini_launcher.py",
-                "Mari": "dcc/mari/mari_launcher.py"
-            }
-            launcher_rel_path = launcher_map[choice]
-            launcher_abs_path = os.path.join(orion_package_root, launcher_rel_path)
-            
-            if os.path.exists(launcher_abs_path):
-                #FLAGS
-                cmd_args = [sys.executable, launcher_abs_path]
-                
-                if shot_code:
-                    cmd_args.extend(["--code", str(shot_code)])
-
-                subprocess.Popen(cmd_args)
-            else:
-                QMessageBox.warning(self, "Error", f"Launcher script not found: {launcher_abs_path}")
+        items = ["Maya", "Nuke", "Houdini", "Mari"]
+        choice, ok = QInputDialog.getItem(self, "Launch DCC", "Select Software to Open:", items, 0, False)
+        if not ok: return
+        self.launch_software(choice.lower())
 
     def launch_dcc_file(self, card):
-        
-        if self.current_context == "Shots":
-                
-            shot_code = self.current_shot_code
-            shot_row = self.orion.get_shot(shot_code)
-            row_dict = dict(shot_row)
-            
-            frame_start = row_dict.get('frame_start')
-            frame_end = row_dict.get('frame_end')
-            discord_thread_id = row_dict.get('discord_thread_id') 
-            shot_path = row_dict.get('shot_path') 
-            
-            file_path = card.full_path
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            launcher_map = {
-                ".ma": "dcc/maya/maya_launcher.py",
-                ".mb": "dcc/maya/maya_launcher.py",
-                ".nk": "dcc/nuke/nuke_launcher.py",
-                ".hip": "dcc/houdini/houdini_launcher.py",
-                ".hipnc": "dcc/houdini/houdini_launcher.py",
-                ".mari": "dcc/mari/mari_launcher.py"
-            }
-            
-            if ext in launcher_map:
-                launcher_rel_path = launcher_map[ext]
-                launcher_abs_path = os.path.join(orion_package_root, launcher_rel_path)
-                
-                if os.path.exists(launcher_abs_path):
-                    # BUILD ARGUMENTS WITH FLAGS
-                    cmd_args = [sys.executable, launcher_abs_path]
-                    
-                    # We HAVE a file, so add it
-                    cmd_args.extend(["--file", file_path])
-                    
-                    if shot_code: 
-                        cmd_args.extend(["--code", str(shot_code)])
-                        cmd_args.extend(["--start", str(frame_start)])
-                        cmd_args.extend(["--end", str(frame_end)])
-                        cmd_args.extend(["--discord", str(discord_thread_id)])
-                        cmd_args.extend(["--shotpath", str(shot_path)])
-                        
-                    subprocess.Popen(cmd_args)
-                    return
-                
-            try:
-                os.startfile(file_path)
-            except Exception as e:
-                QMessageBox.warning(self, "Launch Error", f"Could not open file: {e}")
-                
-        elif self.current_context == "Assets":
-            
-            shot_code = self.current_shot_code
-            shot_row = self.orion.get_shot(shot_code)
-            
-            file_path = card.full_path
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            launcher_map = {
-                ".ma": "dcc/maya/maya_launcher.py",
-                ".mb": "dcc/maya/maya_launcher.py",
-                ".nk": "dcc/nuke/nuke_launcher.py",
-                ".hip": "dcc/houdini/houdini_launcher.py",
-                ".hipnc": "dcc/houdini/houdini_launcher.py",
-                ".mari": "dcc/mari/mari_launcher.py"
-            }
-            
-            if ext in launcher_map:
-                launcher_rel_path = launcher_map[ext]
-                launcher_abs_path = os.path.join(orion_package_root, launcher_rel_path)
-                
-                if os.path.exists(launcher_abs_path):
-                    # BUILD ARGUMENTS WITH FLAGS
-                    cmd_args = [sys.executable, launcher_abs_path]
-                    
-                    # We HAVE a file, so add it
-                    cmd_args.extend(["--file", file_path])
-                    
-                    if shot_code: 
-                        cmd_args.extend(["--code", str(shot_code)])
-                        
-                    subprocess.Popen(cmd_args)
-                    return
-                
-            try:
-                os.startfile(file_path)
-            except Exception as e:
-                QMessageBox.warning(self, "Launch Error", f"Could not open file: {e}")
+        file_path = card.full_path
+        ext = os.path.splitext(file_path)[1].lower()
+
+        if ext in DCC_EXTENSIONS:
+            self.launch_software(DCC_EXTENSIONS[ext], file_path)
+            return
+
+        try:
+            os.startfile(file_path)
+        except Exception as e:
+            QMessageBox.warning(self, "Launch Error", f"Could not open file: {e}")
 
     def populate_gallery(self, folder_path, exclude_dirs=None):
         self.clear_gallery()
+
+        #already listed by the shot prefetch
+        listing = self.listing_cache.get(folder_path)
+        if listing is not None:
+            self.on_gallery_scanned(gallery_items_from_files(folder_path, listing[1], exclude_dirs))
+            return
+
         if not os.path.exists(folder_path): return
-        
-        if exclude_dirs is None: exclude_dirs = []
 
-        #get all items
-        all_items = os.listdir(folder_path)
-        
-        #filter for files only (ignore folders and hidden files)
-        files = []
-        for f in all_items:
-            if f in exclude_dirs: continue
-            if f.startswith("."): continue
-            
-            full_path = os.path.join(folder_path, f)
-            if os.path.isfile(full_path):
-                files.append(f)
+        self.show_gallery_status("Loading...")
+
+        #scan on a worker, the model is filled once it returns
+        self.gallery_scan_token = get_background_runner().run(
+            list_gallery_items, folder_path, exclude_dirs, callback=self.on_gallery_scanned
+        )
 
-        files.sort(key=lambda f: os.path.getmtime(os.path.join(folder_path, f)), reverse=True)
+    def on_gallery_scanned(self, items):
+        self.gallery_scan_token = None
 
-        if not files:
-            lbl = QLabel("No files found.")
-            lbl.setStyleSheet("color: #555; font-size: 14px; font-weight: bold;")
-            self.grid_layout.addWidget(lbl, 0, 0)
+        if not items:
+            self.show_gallery_status("No files found.")
             return
 
-        row, col = 0, 0
-        max_cols = 3
-        for i, filename in enumerate(files):
+        self.gallery_status.hide()
+        gallery_items = []
+        for i, (mtime, filename, full_path, seq) in enumerate(items):
+            color = "#33ccff" if i % 2 == 0 else "#e65c00"
+            gallery_items.append(GalleryItem(filename, full_path, color, sequence=seq, mtime=mtime))
+        self.gallery_view.gallery_model.set_items(gallery_items)
+
+    def show_gallery_status(self, text):
+        self.gallery_status.setText(text)
+        self.gallery_status.show()
+
+    def handle_card_action(self, action, card):
+        if action == "expand" and card.sequence:
+            self.populate_sequence_frames(card.sequence)
+
+    def populate_sequence_frames(self, seq):
+        """Shows every frame of one sequence, only built when a card is expanded."""
+        self.clear_gallery()
+
+        self.gallery_back_btn.setText(f"< back      {seq.name}  {seq.frame_range_string()}")
+        self.gallery_back_btn.show()
+
+        gallery_items = []
+        for i, frame in enumerate(seq.frames):
             color = "#33ccff" if i % 2 == 0 else "#e65c00"
-            full_path = os.path.join(folder_path, filename)
-            card = ThumbnailCard(filename, full_path, color)
-            card.clicked.connect(self.on_card_clicked)
-            card.double_clicked.connect(self.launch_dcc_file) 
-            self.grid_layout.addWidget(card, row, col)
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            gallery_items.append(GalleryItem(seq.frame_name(frame), seq.path(frame), color))
+        self.gallery_view.gallery_model.set_items(gallery_items)
 
     def launch_shot_creator(self):
         self.enter_create_mode()
@@ -2315,18 +3011,20 @@ class OrionLauncherUI(QWidget):
              if os.path.exists(path): os.startfile(path)
     
     def clear_gallery(self):
-        while self.grid_layout.count():
-            child = self.grid_layout.takeAt(0)
-            if child.widget(): child.widget().deleteLater()
-        self.selected_card = None
+        #stop any scan still running for the previous folder
+        if self.gallery_scan_token:
+            get_background_runner().cancel(self.gallery_scan_token)
+            self.gallery_scan_token = None
 
-    def on_card_clicked(self, card_widget):
-        if self.selected_card: self.selected_card.set_selected(False)
-        self.selected_card = card_widget
-        self.selected_card.set_selected(True)
+        #also cancels queued thumbnail decodes
+        self.gallery_view.gallery_model.clear()
+        self.gallery_back_btn.hide()
+        self.gallery_status.hide()
 
     def on_publish_clicked(self):
-        if self.selected_card: self.selected_card.mark_published()
+        index = self.gallery_view.currentIndex()
+        if index.isValid():
+            self.gallery_view.gallery_model.set_published(index.row())
 
     def add_header(self, layout, text):
         #container to hold text and line 
@@ -2369,6 +3067,7 @@ class OrionLauncherUI(QWidget):
             )
             QMessageBox.information(self, "Success", f"Asset {data['name']} created.")
             self.exit_edit_mode()
+            self.refresh_sidebar_record(data['name'])
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
         
@@ -2396,16 +3095,53 @@ class OrionLauncherUI(QWidget):
 
 #LAUNCHER LOGIC
 
-    def _launch_dcc(self, launcher_rel_path):
+    def get_launch_context(self):
         """
-        Helper method to run external launcher scripts using the current UI context.
+        Shot/asset context for a launch, taken from the sidebar records
+        so launching doesn't have to query the DB again.
         """
-        import sys
-        import subprocess
+        if not self.current_shot_code:
+            return {}
 
+        context = {"shot_code": self.current_shot_code}
+        if self.current_context == "Assets":
+            return context
+
+        row = self.sidebar_model.find_row(self.current_shot_code)
+        record = self.sidebar_model.items[row].record if row >= 0 else None
+        if record is None:
+            shot_row = self.orion.get_shot(self.current_shot_code)
+            record = dict(shot_row) if shot_row else {}
+
+        context["frame_start"] = record.get("frame_start")
+        context["frame_end"] = record.get("frame_end")
+        context["discord_thread_id"] = record.get("discord_thread_id")
+        context["shot_path"] = record.get("shot_path")
+        return context
+
+    def launch_software(self, software, file_path=None):
+        """
+        Starts a DCC with the current context. By default the environment is built
+        in this process and the DCC spawned directly, the launcher script is only
+        run as a subprocess when WARM_LAUNCH is off or its module failed to import.
+        """
+        click_time = time.time()
+        launch_func, launcher_rel_path = DCC_LAUNCHERS[software]
+        context = self.get_launch_context()
+
+        if WARM_LAUNCH and launch_func:
+            #prefs syncing can be slow, keep it off the GUI thread
+            get_background_runner().run(warm_launch, launch_func, file_path, context, self.orion, click_time)
+            return
+
+        self._launch_dcc(launcher_rel_path, file_path, context, click_time)
+
+    def _launch_dcc(self, launcher_rel_path, file_path=None, context=None, click_time=None):
+        """
+        Helper method to run external launcher scripts using the current UI context.
+        """
         # 1. Locate the launcher script in the pipeline structure
-        # self.orion.pipeline_dir resolves to the root folder (e.g. .../orionTech/core/..)
-        launcher_path = os.path.join(self.orion.pipeline_dir, launcher_rel_path)
+        launcher_path = os.path.join(orion_package_root, launcher_rel_path)
         
         if not os.path.exists(launcher_path):
             QMessageBox.warning(self, "Launcher Missing", f"Could not find launcher script at:\n{launcher_path}")
@@ -2414,45 +3150,37 @@ class OrionLauncherUI(QWidget):
         # 2. Prepare the command
         # using sys.executable ensures we use the same python interpreter
         cmd = [sys.executable, launcher_path]
+        if file_path:
+            cmd.extend(["--file", file_path])
 
         # 3. Inject Context (if a shot or asset is selected)
-        if self.current_shot_code:
-            cmd.extend(["--code", self.current_shot_code])
-            
-            # If in "Shots" mode, we likely have frame ranges and discord IDs to pass
-            if self.current_context != "Assets":
-                shot_data = self.orion.get_shot(self.current_shot_code)
-                if shot_data:
-                    # Pass frame range
-                    cmd.extend(["--start", str(shot_data['frame_start'])])
-                    cmd.extend(["--end", str(shot_data['frame_end'])])
-                    
-                    # Pass Discord ID if it exists
-                    if shot_data['discord_thread_id']:
-                        cmd.extend(["--discord", str(shot_data['discord_thread_id'])])
-                        
-                    # Pass Shot Path on Disk
-                    if shot_data['shot_path']:
-                        cmd.extend(["--shotpath", str(shot_data['shot_path'])])
-
-        # 4. Execute non-blocking
+        context = context if context is not None else self.get_launch_context()
+        flags = {"shot_code": "--code", "frame_start": "--start", "frame_end": "--end",
+                 "discord_thread_id": "--discord", "shot_path": "--shotpath"}
+        for key, flag in flags.items():
+            if context.get(key):
+                cmd.extend([flag, str(context[key])])
+
+        # 4. Execute non-blocking, the launcher reports click to DCC start time
+        env = os.environ.copy()
+        env[CLICK_TIME_ENV] = str(click_time or time.time())
         try:
             print(f"Orion Launching: {' '.join(cmd)}")
-            subprocess.Popen(cmd) 
+            subprocess.Popen(cmd, env=env) 
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", f"Failed to launch process:\n{e}")
 
     def handle_launch_maya(self):
-        self._launch_dcc(os.path.join("dcc", "maya", "maya_launcher.py"))
+        self.launch_software("maya")
 
     def handle_launch_nuke(self):
-        self._launch_dcc(os.path.join("dcc", "nuke", "nuke_launcher.py"))
+        self.launch_software("nuke")
 
     def handle_launch_houdini(self):
-        self._launch_dcc(os.path.join("dcc", "houdini", "houdini_launcher.py"))
+        self.launch_software("houdini")
 
     def handle_launch_mari(self):
-        self._launch_dcc(os.path.join("dcc", "mari", "mari_launcher.py"))
+        self.launch_software("mari")
 
 #SETTINGS LOGIC
     def toggle_dark_mode(self, state):
@@ -2472,6 +3200,17 @@ class OrionLauncherUI(QWidget):
         self.prefs_utils.save_settings(self.settings)
         self.system_utils.wacom_fix(state == Qt.Checked)
 
+    def closeEvent(self, event):
+        stats = get_thumb_cache_stats()
+        for tier, tier_stats in stats.items():
+            print(f"Thumbnail {tier} cache: {tier_stats['hits']} hits, {tier_stats['misses']} misses ({tier_stats['hit_rate']:.0%})")
+        if THUMB_SERVICE:
+            THUMB_SERVICE.shutdown(wait=False)
+        if TRANSFER_MANAGER:
+            #let running publishes finish so nothing is left half copied
+            TRANSFER_MANAGER.shutdown(wait=True)
+        super().closeEvent(event)
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     window = OrionLauncherUI()